@@ -25,5 +25,12 @@ echo "  Media→ $MEDIA_DIR"
 # ── Run migrations ────────────────────────────────────────────────────────────
 python manage.py migrate --noinput
 
+# ── Build precomputed indexes ─────────────────────────────────────────────────
+# Tables added by a migration start empty; these fill them on the first start
+# after it and do nothing once they hold rows (see DEPLOY.md).
+python manage.py rebuild_related_jobs --if-empty
+python manage.py rebuild_job_matches --if-empty
+python manage.py rebuild_skill_associations --if-empty
+
 # ── Start Gunicorn ────────────────────────────────────────────────────────────
 exec gunicorn --bind 0.0.0.0:8000 --workers 3 talent_solutions.wsgi:application
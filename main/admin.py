@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from main.models import User, Company, Skill, Job, JobApplication, ContactMessage
+from main.models import User, Company, Skill, Job, JobApplication, ContactMessage, OutboundEmail
 
 
 @admin.register(User)
@@ -180,3 +180,14 @@ class ContactMessageAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    """
+    Outbound email queue (dead letters can be retried by setting status back to pending)
+    """
+    list_display = ['subject', 'sender_key', 'status', 'attempts', 'created_at']
+    list_filter = ['status', 'sender_key']
+    search_fields = ['subject', 'to']
+    readonly_fields = ['created_at', 'updated_at', 'sent_at', 'last_error']
@@ -0,0 +1,118 @@
+"""
+Application status breakdowns for the dashboards.
+
+Reads come from the denormalized ApplicationStatusCount table (one small
+indexed query, independent of how many applications exist).  Writes happen
+in the JobApplication save/delete receivers in main/signals.py.
+count_by_status() is the single grouped-query fallback used for ad-hoc
+filters and for rebuilding the counters.
+"""
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from main.models import JobApplication, ApplicationStatusCount, APPLICATION_STATUS_CHOICES
+
+STATUSES = [code for code, _ in APPLICATION_STATUS_CHOICES]
+
+
+def _empty_breakdown():
+    breakdown = {'all': 0}
+    breakdown.update({status: 0 for status in STATUSES})
+    return breakdown
+
+
+def count_by_status(queryset=None):
+    """
+    {'all': n, 'pending': n, ...} for `queryset` with one GROUP BY query.
+    """
+    if queryset is None:
+        queryset = JobApplication.objects.all()
+
+    breakdown = _empty_breakdown()
+    for row in queryset.order_by().values('status').annotate(n=Count('id')):
+        breakdown[row['status']] = row['n']
+        breakdown['all'] += row['n']
+    return breakdown
+
+
+def get_status_breakdown(job=None, user=None):
+    """
+    {'all': n, 'pending': n, ...} for all applications, or for one job or
+    one user.  Served from the counter table.
+    """
+    if job is not None and user is not None:
+        return count_by_status(JobApplication.objects.filter(job=job, user=user))
+
+    if job is not None:
+        scope, scope_id = 'job', getattr(job, 'pk', job)
+    elif user is not None:
+        scope, scope_id = 'user', getattr(user, 'pk', user)
+    else:
+        scope, scope_id = 'all', 0
+
+    breakdown = _empty_breakdown()
+    rows = ApplicationStatusCount.objects.filter(scope=scope, scope_id=scope_id).values_list('status', 'count')
+    for status, count in rows:
+        breakdown[status] = count
+        breakdown['all'] += count
+    return breakdown
+
+
+def _scopes(job_id, user_id):
+    scopes = [('all', 0), ('job', job_id)]
+    if user_id is not None:
+        scopes.append(('user', user_id))
+    return scopes
+
+
+def _adjust(scope, scope_id, status, delta):
+    updated = ApplicationStatusCount.objects.filter(
+        scope=scope, scope_id=scope_id, status=status
+    ).update(count=F('count') + delta)
+    if updated:
+        return
+    try:
+        with transaction.atomic():
+            ApplicationStatusCount.objects.create(scope=scope, scope_id=scope_id, status=status, count=delta)
+    except IntegrityError:
+        # Another worker created the row first
+        ApplicationStatusCount.objects.filter(
+            scope=scope, scope_id=scope_id, status=status
+        ).update(count=F('count') + delta)
+
+
+def record_change(old_key, new_key):
+    """
+    Move one application between counters.  Keys are
+    JobApplication.count_key() tuples; None means "not counted" (created /
+    deleted).
+    """
+    if old_key == new_key:
+        return
+    with transaction.atomic():
+        if old_key is not None:
+            status, job_id, user_id = old_key
+            for scope, scope_id in _scopes(job_id, user_id):
+                _adjust(scope, scope_id, status, -1)
+        if new_key is not None:
+            status, job_id, user_id = new_key
+            for scope, scope_id in _scopes(job_id, user_id):
+                _adjust(scope, scope_id, status, 1)
+
+
+def rebuild_status_counts():
+    """Recompute every counter from the applications table."""
+    rows = []
+    base = JobApplication.objects.order_by()
+
+    for row in base.values('status').annotate(n=Count('id')):
+        rows.append(ApplicationStatusCount(scope='all', scope_id=0, status=row['status'], count=row['n']))
+    for row in base.values('job_id', 'status').annotate(n=Count('id')):
+        rows.append(ApplicationStatusCount(scope='job', scope_id=row['job_id'], status=row['status'], count=row['n']))
+    for row in base.filter(user__isnull=False).values('user_id', 'status').annotate(n=Count('id')):
+        rows.append(ApplicationStatusCount(scope='user', scope_id=row['user_id'], status=row['status'], count=row['n']))
+
+    with transaction.atomic():
+        ApplicationStatusCount.objects.all().delete()
+        ApplicationStatusCount.objects.bulk_create(rows, batch_size=500)
+    return len(rows)
@@ -0,0 +1,182 @@
+"""
+Cached JWT user resolution.
+
+Verifying an access token and loading its user used to cost a signature
+check and a users-table query on every request.  Two caches remove both:
+
+  • a per-process LRU of verified tokens, keyed by the token's jti, so a
+    token seen before is not decoded again (the raw token is stored with
+    the entry and must match, so a jti alone never authenticates);
+  • a short-TTL shared cache of the user's row, rebuilt into a User with
+    Model.from_db().  Every column is cached except the password hash,
+    which is left deferred and loaded only where a view checks or sets a
+    password; leaving more columns out made each view that read one of
+    them pay an extra single-column query.
+
+Revocation is checked on every request with one cache.get_many():
+
+  • logout puts the token's jti on a revoked list until it would expire;
+  • a password change records an auth epoch for the user, and tokens
+    issued before it are rejected;
+  • User save/delete drops the cached row (receivers in main/signals.py).
+"""
+
+import base64
+import json
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import AccessToken
+from main.models import User
+
+TOKEN_LRU_SIZE = 2048
+USER_CACHE_TIMEOUT = 5 * 60  # seconds
+
+_USER_KEY = 'auth:user:{}'
+_EPOCH_KEY = 'auth:epoch:{}'
+_REVOKED_KEY = 'auth:revoked:{}'
+
+# Never cached: the cache directory is shared
+_SECRET_FIELDS = {'password'}
+# Model order, which is what from_db() expects values in
+_USER_FIELDS = [f.attname for f in User._meta.concrete_fields if f.attname not in _SECRET_FIELDS]
+
+
+def _access_lifetime():
+    return int(settings.SIMPLE_JWT['ACCESS_TOKEN_LIFETIME'].total_seconds())
+
+
+# ── verified token LRU ─────────────────────────────────────────────────────
+
+class _TokenLRU:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, jti, raw):
+        with self._lock:
+            entry = self._entries.get(jti)
+            if entry is None or entry[0] != raw:
+                return None
+            self._entries.move_to_end(jti)
+            return entry[1]
+
+    def put(self, jti, raw, claims):
+        with self._lock:
+            self._entries[jti] = (raw, claims)
+            self._entries.move_to_end(jti)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, jti):
+        with self._lock:
+            self._entries.pop(jti, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_tokens = _TokenLRU(TOKEN_LRU_SIZE)
+
+
+def verify_token(raw):
+    """
+    Return (jti, user_id, iat, exp) for a valid access token, or None.
+    Signature verification only runs the first time this process sees it.
+    """
+    # Peek at the jti without verifying; the LRU entry only counts when the
+    # whole raw token matches what was verified before.
+    jti = _unverified_jti(raw)
+    if jti:
+        claims = _tokens.get(jti, raw)
+        if claims is not None:
+            return claims if claims[3] > time.time() else None
+
+    try:
+        token = AccessToken(raw)
+    except TokenError:
+        return None
+    claims = (token.get('jti'), token.get('user_id'), token.get('iat', 0), token.get('exp', 0))
+    if not claims[0] or not claims[1]:
+        return None
+    _tokens.put(claims[0], raw, claims)
+    return claims
+
+
+def _unverified_jti(raw):
+    try:
+        payload = raw.split('.')[1]
+        data = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+    except (IndexError, ValueError, TypeError):
+        return None
+    return data.get('jti') if isinstance(data, dict) else None
+
+
+# ── user resolution ────────────────────────────────────────────────────────
+
+def _user_from_row(row):
+    return User.from_db(DEFAULT_DB_ALIAS, _USER_FIELDS, [row[name] for name in _USER_FIELDS])
+
+
+def get_user_for_token(raw):
+    """
+    Resolve an access token to a User, or None when it is invalid, revoked,
+    issued before the user's last password change, or the user is gone.
+    """
+    claims = verify_token(raw)
+    if claims is None:
+        return None
+    jti, user_id, iat, _ = claims
+
+    user_key, epoch_key, revoked_key = _USER_KEY.format(user_id), _EPOCH_KEY.format(user_id), _REVOKED_KEY.format(jti)
+    cached = cache.get_many([user_key, epoch_key, revoked_key])
+    if revoked_key in cached:
+        return None
+    if iat < cached.get(epoch_key, 0):
+        return None
+
+    row = cached.get(user_key)
+    if row is not None:
+        try:
+            return _user_from_row(row)
+        except KeyError:
+            pass  # cached before a column was added; reload below
+
+    row = User.objects.filter(pk=user_id).values(*_USER_FIELDS).first()
+    if row is None:
+        return None
+    cache.set(user_key, row, USER_CACHE_TIMEOUT)
+    return _user_from_row(row)
+
+
+# ── invalidation ───────────────────────────────────────────────────────────
+
+def invalidate_user(user_id):
+    """Drop the cached row (User save/delete)."""
+    cache.delete(_USER_KEY.format(user_id))
+
+
+def revoke_user_tokens(user_id):
+    """Reject every access token issued to the user before now (password change)."""
+    cache.set(_EPOCH_KEY.format(user_id), int(time.time()), _access_lifetime())
+    invalidate_user(user_id)
+
+
+def revoke_token(raw):
+    """Reject one access token for the rest of its lifetime (logout)."""
+    if not raw:
+        return
+    claims = verify_token(raw)
+    if claims is None:
+        return
+    jti, _, _, exp = claims
+    remaining = int(exp - time.time())
+    if remaining > 0:
+        cache.set(_REVOKED_KEY.format(jti), True, remaining)
+    _tokens.discard(jti)
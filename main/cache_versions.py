@@ -0,0 +1,49 @@
+"""
+Version counters for cache namespaces.
+
+Cached values are stored under keys that include their namespace's current
+version; bumping the version makes every older entry unreachable at once
+(it then simply expires), with no need to know which keys exist:
+
+    key = f'company:v{get_version("company")}'
+    bump_version('company')          # on save/delete
+"""
+
+import time
+from django.core.cache import cache
+
+_KEY = 'cache_version:{}'
+
+
+def _fresh_version():
+    # Counters start from the clock, so a counter that was evicted and
+    # recreated never reuses a number that older entries are stored under.
+    return int(time.time() * 1000)
+
+
+def get_version(namespace):
+    return cache.get_or_set(_KEY.format(namespace), _fresh_version, None)
+
+
+def get_versions(namespaces):
+    """{namespace: version} for several namespaces in one cache round trip."""
+    keys = {_KEY.format(ns): ns for ns in namespaces}
+    found = cache.get_many(list(keys))
+    missing = {key: _fresh_version() for key in keys if key not in found}
+    if missing:
+        for key, version in missing.items():
+            if not cache.add(key, version, None):
+                missing[key] = cache.get(key, version)
+        found.update(missing)
+    return {keys[key]: found[key] for key in keys}
+
+
+def bump_version(namespace):
+    """Invalidate everything cached under `namespace`; returns the new version."""
+    key = _KEY.format(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = _fresh_version()
+        cache.set(key, version, None)
+        return version
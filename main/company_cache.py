@@ -0,0 +1,75 @@
+"""
+Cached company profile.
+
+Company is a singleton that only changes when an admin edits it, yet it is
+shown on every page through the company_context processor.  The row is
+kept in two layers:
+
+  • a per-process copy, trusted for LOCAL_TTL seconds before the shared
+    version counter is checked again;
+  • a shared cache entry keyed by that version, so other worker processes
+    pick up an edit without each querying the database.
+
+Company save/delete bumps the version (receivers in main/signals.py).
+"""
+
+import threading
+import time
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from main.cache_versions import bump_version, get_version
+from main.models import Company
+
+NAMESPACE = 'company'
+LOCAL_TTL = 5            # seconds between version checks in this process
+SHARED_TIMEOUT = 24 * 60 * 60
+
+_NO_COMPANY = 'none'
+_FIELDS = [f.attname for f in Company._meta.concrete_fields]
+
+_local = {'version': None, 'company': None, 'checked_at': 0.0}
+_lock = threading.Lock()
+
+
+def _load(version):
+    key = f'{NAMESPACE}:v{version}'
+    row = cache.get(key)
+    if row == _NO_COMPANY:
+        return None
+    if row is not None:
+        try:
+            return Company.from_db(DEFAULT_DB_ALIAS, _FIELDS, [row[name] for name in _FIELDS])
+        except KeyError:
+            pass  # cached before a column was added; reload below
+
+    company = Company.objects.first()
+    if company is None:
+        cache.set(key, _NO_COMPANY, SHARED_TIMEOUT)
+    else:
+        cache.set(key, {name: getattr(company, name) for name in _FIELDS}, SHARED_TIMEOUT)
+    return company
+
+
+def get_company():
+    """The company profile (or None), usually without a query."""
+    now = time.monotonic()
+    with _lock:
+        if _local['version'] is not None and now - _local['checked_at'] < LOCAL_TTL:
+            return _local['company']
+
+    version = get_version(NAMESPACE)
+    with _lock:
+        if version == _local['version']:
+            _local['checked_at'] = now
+            return _local['company']
+
+    company = _load(version)
+    with _lock:
+        _local.update(version=version, company=company, checked_at=now)
+    return company
+
+
+def invalidate_company():
+    bump_version(NAMESPACE)
+    with _lock:
+        _local.update(version=None, company=None, checked_at=0.0)
@@ -1,7 +1,7 @@
-from main.models import Company
+from django.utils.functional import SimpleLazyObject
+from main.company_cache import get_company
 
 
 def company_context(request):
-    """Add company to all templates."""
-    company = Company.objects.first()
-    return {'company': company}
+    """Add company to all templates (loaded only if a template uses it)."""
+    return {'company': SimpleLazyObject(get_company)}
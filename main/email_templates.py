@@ -0,0 +1,525 @@
+"""
+Email template registry.
+
+Each email is declared once below as an HTML body with $placeholders.  The
+first render in a process compiles it:
+
+  • the body is wrapped in its chrome (wrapper, header, footer, styles),
+    which is therefore rendered once and reused for every send;
+  • the plain-text part is derived from the same HTML source, so the two
+    parts can't drift apart;
+  • the subject and both parts become string.Template objects, so a send
+    only substitutes its values into them.  Every value is HTML-escaped
+    for the HTML part (the subject too, in the <title>); the subject and
+    the plain-text part get the values as they are.
+
+Usage:
+    subject, plain, html = renderers['application_confirmation'](name=..., job_title=..., company=...)
+
+render('application_confirmation', name=..., ...) does the same, with one
+more call and keyword dict on the way.
+
+Optional sections are declared as blocks: a block is rendered only when its
+condition variable is truthy, otherwise its placeholder is left empty.
+"""
+
+import re
+from dataclasses import dataclass, field
+from html import escape
+from html.parser import HTMLParser
+from string import Template
+
+
+# ── chrome ─────────────────────────────────────────────────────────────────
+
+SIMPLE_CHROME = """
+    <div style="font-family:'Segoe UI',sans-serif; max-width:560px; margin:0 auto; color:#374151;">
+      %(body)s
+      <p style="color:#9ca3af; font-size:12px; margin-top:24px;%(signature_style)s">%(signature)s</p>
+    </div>"""
+
+BRANDED_CHROME = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>$subject</title></head>
+<body style="margin:0; padding:0; background:#f3f4f6;
+             font-family:'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;">
+
+<!-- outer wrapper -->
+<table role="presentation" width="100%%" cellpadding="0" cellspacing="0">
+  <tr>
+    <td style="padding:32px 16px;" align="center">
+
+      <!-- card -->
+      <table role="presentation" width="600" cellpadding="0" cellspacing="0"
+             style="max-width:600px; background:#ffffff; border-radius:12px; overflow:hidden;
+                    box-shadow:0 4px 16px rgba(0,0,0,0.08);">
+
+        <!-- ── dark header ── -->
+        <tr>
+          <td style="background:#0f172a; padding:28px 28px 24px; text-align:center;">
+            <p style="margin:0; font-size:24px; font-weight:700; color:#ffffff;
+                      letter-spacing:-0.3px;">Talent Solutions</p>
+            <p style="margin:6px 0 0; font-size:13px; color:#64748b;">Your Career, Our Priority</p>
+          </td>
+        </tr>
+%(body)s
+        <!-- ── footer ── -->
+        <tr>
+          <td style="padding:32px 28px 28px; margin-top:8px; border-top:1px solid #f3f4f6;">
+            <p style="margin:0; text-align:center; font-size:12px; color:#9ca3af; line-height:1.7;">
+              This email was sent by <strong style="color:#6b7280;">Talent Solutions</strong>
+              because you submitted an application on our platform.<br>
+              If you have any questions, feel free to contact our support team.<br><br>
+              &copy; 2026 Talent Solutions. All rights reserved.
+            </p>
+          </td>
+        </tr>
+
+      </table><!-- /card -->
+    </td>
+  </tr>
+</table><!-- /outer -->
+
+</body>
+</html>"""
+
+
+# ── template sources ───────────────────────────────────────────────────────
+
+_CODE_BOX = """
+      <div style="text-align:center; margin:28px 0;">
+        <span style="display:inline-block; padding:16px 36px; background:#f0fdff;
+                     border:2px solid #0891b2; border-radius:12px;
+                     font-size:32px; font-weight:700; color:#0891b2; letter-spacing:8px;">
+          $code
+        </span>
+      </div>
+      <p style="color:#6b7280; font-size:14px;">
+         This code is valid for <strong>10 minutes</strong>. Do not share it with anyone.</p>"""
+
+VERIFICATION_CODE = """
+      <h2 style="color:#0891b2; margin-bottom:8px;">Email Verification</h2>
+      <p>Hi <strong>$name</strong>,</p>
+      <p>Use the code below to verify your identity and complete your login.</p>""" + _CODE_BOX
+
+ADMIN_RESET_CODE = """
+      <h2 style="color:#0891b2; margin-bottom:8px;">Password Reset</h2>
+      <p>Hi <strong>$name</strong>,</p>
+      <p>Use the code below to reset your admin account password.</p>""" + _CODE_BOX
+
+APPLICATION_CONFIRMATION = """
+      <h2 style="color:#0891b2; margin-bottom:8px;">Application Received</h2>
+      <p>Hi <strong>$name</strong>,</p>
+      <p>Thank you for applying for <strong>$job_title</strong> at <strong>$company</strong>.
+         Your application has been received and is now under review.</p>
+      <table style="width:100%; border-collapse:collapse; margin:16px 0;">
+        <tr><td style="padding:6px 0; color:#6b7280; width:140px;">Job</td>
+            <td style="padding:6px 0; font-weight:600;">$job_title</td></tr>
+        <tr><td style="padding:6px 0; color:#6b7280;">Company</td>
+            <td style="padding:6px 0; font-weight:600;">$company</td></tr>
+        <tr><td style="padding:6px 0; color:#6b7280;">Status</td>
+            <td style="padding:6px 0; font-weight:600; color:#f59e0b;">Pending</td></tr>
+      </table>
+      <p style="color:#6b7280; font-size:14px;">
+         We will be in touch soon. You can track your application status from
+         <em>My Applications</em> on your dashboard.</p>"""
+
+NEW_APPLICATION_ALERT = """
+      <h2 style="color:#0891b2; margin-bottom:8px;">New Application Received</h2>
+      <p>A new application has been submitted for <strong>$job_title</strong>.</p>
+      <table style="width:100%; border-collapse:collapse; margin:16px 0;">
+        <tr><td style="padding:6px 0; color:#6b7280; width:140px;">Applicant</td>
+            <td style="padding:6px 0; font-weight:600;">$name</td></tr>
+        <tr><td style="padding:6px 0; color:#6b7280;">Contact</td>
+            <td style="padding:6px 0;">$contact</td></tr>
+        <tr><td style="padding:6px 0; color:#6b7280;">Job</td>
+            <td style="padding:6px 0; font-weight:600;">$job_title</td></tr>
+        <tr><td style="padding:6px 0; color:#6b7280;">Company</td>
+            <td style="padding:6px 0;">$company</td></tr>
+      </table>
+      <p style="color:#6b7280; font-size:14px;">
+         Review the application from the <em>Applications</em> section in the admin panel.</p>"""
+
+APPLICATION_STATUS_UPDATE = """
+      <h2 style="color:#0891b2; margin-bottom:8px;">Application Status Update</h2>
+      <p>Hi <strong>$name</strong>,</p>
+      <p>Your application for <strong>$job_title</strong> at <strong>$company</strong> has been updated.</p>
+      <div style="text-align:center; margin:20px 0;">
+        <span style="display:inline-block; padding:6px 20px; background:${color}15; color:$color;
+                     border-radius:9999px; font-weight:700; font-size:15px; border:1px solid ${color}40;">
+          $label
+        </span>
+      </div>
+      <p style="text-align:center; color:#6b7280;">$message</p>"""
+
+REJECTION_REASON = """
+        <tr>
+          <td style="padding:20px 28px 0;">
+            <table role="presentation" width="100%" cellpadding="0" cellspacing="0"
+                   style="border-radius:8px; overflow:hidden; border:1px solid #fecaca;">
+              <tr>
+                <td style="background:#fee2e2; padding:10px 16px;">
+                  <p style="margin:0; font-size:12px; font-weight:700; color:#991b1b;
+                            text-transform:uppercase; letter-spacing:0.8px;">Feedback from the hiring team</p>
+                </td>
+              </tr>
+              <tr>
+                <td style="background:#fff5f5; padding:14px 16px;">
+                  <p style="margin:0; font-size:14px; color:#7f1d1d; line-height:1.6;">$reason</p>
+                </td>
+              </tr>
+            </table>
+          </td>
+        </tr>"""
+
+REJECTION = """
+        <!-- ── red icon circle ── -->
+        <tr>
+          <td style="background:#f8fafc; padding:28px 28px 0;" align="center">
+            <table role="presentation" cellpadding="0" cellspacing="0">
+              <tr>
+                <td width="64" height="64" style="background:#fee2e2; border-radius:50%;"
+                    align="center" valign="middle">
+                  <!-- simple ✕ mark -->
+                  <span aria-hidden="true" style="font-size:28px; color:#ef4444; font-weight:700;">✕</span>
+                </td>
+              </tr>
+            </table>
+          </td>
+        </tr>
+
+        <!-- ── title + subtitle ── -->
+        <tr>
+          <td style="background:#f8fafc; padding:16px 28px 0;" align="center">
+            <p style="margin:0; font-size:20px; font-weight:700; color:#1f2937;">Application Decision</p>
+            <p style="margin:8px 0 0; font-size:14px; color:#6b7280;">We have completed our review process</p>
+          </td>
+        </tr>
+
+        <!-- ── greeting ── -->
+        <tr>
+          <td style="padding:24px 28px 0;">
+            <p style="margin:0; font-size:15px; color:#374151; line-height:1.7;">
+              Hi <strong style="color:#1f2937;">$name</strong>,
+            </p>
+            <p style="margin:14px 0 0; font-size:15px; color:#374151; line-height:1.7;">
+              Thank you for taking the time to apply for the position listed below.
+              After a careful and thorough review of all applications received, we regret
+              to inform you that your application has <strong style="color:#dc2626;">not been selected</strong> at this time.
+            </p>
+          </td>
+        </tr>
+
+        <!-- ── job details card ── -->
+        <tr>
+          <td style="padding:20px 28px 0;">
+            <table role="presentation" width="100%" cellpadding="0" cellspacing="0"
+                   style="border-radius:10px; overflow:hidden; border:1px solid #e5e7eb;">
+              <!-- card header -->
+              <tr>
+                <td style="background:#eef2ff; padding:11px 18px;">
+                  <p style="margin:0; font-size:12px; font-weight:700; color:#4338ca;
+                            text-transform:uppercase; letter-spacing:0.8px;">Position Details</p>
+                </td>
+              </tr>
+              <!-- rows -->
+              <tr>
+                <td style="padding:0 18px;">
+                  <table role="presentation" width="100%" cellpadding="0" cellspacing="0">
+                    <tr>
+                      <td style="padding:11px 0; border-bottom:1px solid #f3f4f6; width:90px;" valign="top">
+                        <p style="margin:0; font-size:13px; color:#6b7280;">Position</p>
+                      </td>
+                      <td style="padding:11px 0; border-bottom:1px solid #f3f4f6;" valign="top">
+                        <p style="margin:0; font-size:14px; font-weight:600; color:#1f2937;">$job_title</p>
+                      </td>
+                    </tr>
+                    <tr>
+                      <td style="padding:11px 0; border-bottom:1px solid #f3f4f6;" valign="top">
+                        <p style="margin:0; font-size:13px; color:#6b7280;">Company</p>
+                      </td>
+                      <td style="padding:11px 0; border-bottom:1px solid #f3f4f6;" valign="top">
+                        <p style="margin:0; font-size:14px; font-weight:600; color:#1f2937;">$company</p>
+                      </td>
+                    </tr>
+                    <tr>
+                      <td style="padding:11px 0;" valign="top">
+                        <p style="margin:0; font-size:13px; color:#6b7280;">Location</p>
+                      </td>
+                      <td style="padding:11px 0;" valign="top">
+                        <p style="margin:0; font-size:14px; font-weight:600; color:#1f2937;">$country</p>
+                      </td>
+                    </tr>
+                  </table>
+                </td>
+              </tr>
+              <!-- status badge row -->
+              <tr>
+                <td style="background:#fef2f2; padding:12px 18px; border-top:1px solid #fecaca;"
+                    align="center">
+                  <span style="display:inline-block; padding:5px 18px; background:#ef4444;
+                               color:#ffffff; border-radius:20px; font-size:13px; font-weight:700;
+                               letter-spacing:0.5px;">
+                    Not Selected
+                  </span>
+                </td>
+              </tr>
+            </table>
+          </td>
+        </tr>
+
+        <!-- ── rejection reason (conditional) ── -->
+        $reason_block
+
+        <!-- ── closing message ── -->
+        <tr>
+          <td style="padding:24px 28px 0;">
+            <p style="margin:0; font-size:15px; color:#374151; line-height:1.7;">
+              We truly value the interest you showed in joining our team. Please know that
+              this decision was made after careful consideration and was not an easy one.
+            </p>
+            <p style="margin:14px 0 0; font-size:15px; color:#374151; line-height:1.7;">
+              We encourage you to continue exploring opportunities that match your skills
+              and experience. You are always welcome to apply again for any future positions
+              that interest you.
+            </p>
+          </td>
+        </tr>
+
+        <!-- ── browse jobs button ── -->
+        <tr>
+          <td style="padding:28px 28px 0;" align="center">
+            <a href="$site_url/jobs/"
+               style="display:inline-block; padding:11px 30px;
+                      background:linear-gradient(135deg, #0891b2, #2563eb);
+                      color:#ffffff; text-decoration:none; border-radius:8px;
+                      font-size:14px; font-weight:600; letter-spacing:0.2px;">
+              Browse More Jobs
+            </a>
+          </td>
+        </tr>
+"""
+
+
+@dataclass(frozen=True)
+class Block:
+    """Optional section: rendered into `$<name>` only when `condition` is truthy."""
+    condition: str
+    html: str
+
+
+@dataclass(frozen=True)
+class EmailTemplate:
+    subject: str
+    html: str
+    chrome: str = 'simple'
+    signature: str = '— Talent Solutions'
+    signature_centered: bool = False
+    blocks: dict = field(default_factory=dict)
+
+
+TEMPLATES = {
+    'verification_code': EmailTemplate(
+        subject='Your Verification Code – Talent Solutions',
+        html=VERIFICATION_CODE,
+    ),
+    'admin_reset_code': EmailTemplate(
+        subject='Password Reset Code – Talent Solutions Admin',
+        html=ADMIN_RESET_CODE,
+        signature='— Talent Solutions (Admin)',
+    ),
+    'application_confirmation': EmailTemplate(
+        subject='Application Received – $job_title',
+        html=APPLICATION_CONFIRMATION,
+    ),
+    'new_application_alert': EmailTemplate(
+        subject='New Application – $job_title ($name)',
+        html=NEW_APPLICATION_ALERT,
+        signature='— Talent Solutions (Internal)',
+    ),
+    'application_status_update': EmailTemplate(
+        subject='Application Update – $job_title',
+        html=APPLICATION_STATUS_UPDATE,
+        signature_centered=True,
+    ),
+    'rejection': EmailTemplate(
+        subject='Your Application for $job_title – Decision',
+        html=REJECTION,
+        chrome='branded',
+        blocks={'reason_block': Block('reason', REJECTION_REASON)},
+    ),
+}
+
+
+# ── HTML → plain text ──────────────────────────────────────────────────────
+
+class _TextExtractor(HTMLParser):
+    """
+    Flatten an email body to readable text: paragraphs and headings become
+    blank-line separated, two-cell table rows become "Label: value" lines
+    and links keep their target.  Runs on template sources, so
+    $placeholders pass through untouched.
+    """
+
+    PARAGRAPH_TAGS = {'p', 'div', 'h1', 'h2', 'h3', 'h4', 'table'}
+    SKIP_TAGS = {'head', 'title', 'style', 'script'}
+    CELL_BREAK = '\x00'
+
+    def __init__(self):
+        super().__init__()
+        self.rows = [{'parts': [], 'cells': 0, 'nested': False}]
+        self.skip_depth = 0
+        self.hidden_depth = 0
+        self.links = []
+
+    @property
+    def parts(self):
+        return self.rows[-1]['parts']
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in self.SKIP_TAGS:
+            self.skip_depth += 1
+        elif self.hidden_depth or attrs.get('aria-hidden') == 'true':
+            self.hidden_depth += 1
+        elif tag in self.PARAGRAPH_TAGS:
+            self.parts.append('\n\n')
+        elif tag == 'br':
+            self.parts.append('\n')
+        elif tag == 'tr':
+            self.rows[-1]['nested'] = True
+            self.rows.append({'parts': [], 'cells': 0, 'nested': False})
+        elif tag == 'td' and len(self.rows) > 1:
+            if self.rows[-1]['cells']:
+                self.parts.append(self.CELL_BREAK)
+            self.rows[-1]['cells'] += 1
+        elif tag == 'a':
+            self.links.append(attrs.get('href'))
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            self.skip_depth -= 1
+        elif self.hidden_depth:
+            self.hidden_depth -= 1
+        elif tag in self.PARAGRAPH_TAGS:
+            self.parts.append('\n\n')
+        elif tag == 'tr' and len(self.rows) > 1:
+            row = self.rows.pop()
+            text = ''.join(row['parts'])
+            if row['cells'] > 1 and not row['nested']:
+                cells = [' '.join(cell.split()) for cell in text.split(self.CELL_BREAK)]
+                text = ': '.join(cells) + '\n'
+                if self.parts and not self.parts[-1].endswith('\n'):
+                    text = '\n' + text
+            self.parts.append(text.replace(self.CELL_BREAK, ' '))
+        elif tag == 'a' and self.links:
+            href = self.links.pop()
+            if href:
+                if self.parts:
+                    self.parts[-1] = self.parts[-1].rstrip(' ')
+                self.parts.append(f': {href}')
+
+    def handle_data(self, data):
+        if self.skip_depth or self.hidden_depth:
+            return
+        if not data.strip() and (not self.parts or self.parts[-1].endswith('\n')):
+            return
+        self.parts.append(re.sub(r'\s+', ' ', data))
+
+    def text(self):
+        lines = []
+        for line in ''.join(self.parts).split('\n'):
+            line = ' '.join(line.split())
+            if line or (lines and lines[-1]):
+                lines.append(line)
+        return '\n'.join(lines).strip()
+
+
+def html_to_text(html):
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return parser.text()
+
+
+# ── compilation ────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """
+    One email's parts as string.Template objects: the subject, the
+    plain-text part and the chrome-wrapped HTML, plus its blocks as
+    (name, condition, html, text) templates.
+    """
+    subject: Template
+    text: Template
+    html: Template
+    blocks: tuple = ()
+
+    def render(self, **values):
+        """Return (subject, plain_text, html); every value is escaped for the HTML part."""
+        html_values = {name: escape(str(value)) for name, value in values.items()}
+        for block_name, condition, block_html, block_text in self.blocks:
+            if values.get(condition):
+                html_values[block_name] = block_html.substitute(html_values)
+                values[block_name] = block_text.substitute(values)
+            else:
+                html_values[block_name] = values[block_name] = ''
+        subject = self.subject.substitute(values)
+        html_values['subject'] = escape(subject)
+        return subject, self.text.substitute(values, subject=subject), self.html.substitute(html_values)
+
+
+def compile_template(template):
+    """Wrap the body in its chrome, derive the text part and build the Template objects."""
+    if template.chrome == 'branded':
+        html = BRANDED_CHROME % {'body': template.html}
+        text = html_to_text(template.html) + '\n\n' + template.signature
+    else:
+        html = SIMPLE_CHROME % {
+            'body': template.html.strip(),
+            'signature': template.signature,
+            'signature_style': ' text-align:center;' if template.signature_centered else '',
+        }
+        text = html_to_text(html)
+
+    return CompiledTemplate(
+        subject=Template(template.subject),
+        text=Template(text),
+        html=Template(html),
+        blocks=tuple(
+            (block_name, block.condition, Template(block.html), Template(html_to_text(block.html)))
+            for block_name, block in template.blocks.items()
+        ),
+    )
+
+
+class _CompiledTemplates(dict):
+    """name → CompiledTemplate, compiling a template the first time it is asked for."""
+
+    def __missing__(self, name):
+        compiled = self[name] = compile_template(TEMPLATES[name])
+        renderers[name] = compiled.render
+        return compiled
+
+
+class _Renderers(dict):
+    """name → the compiled template's bound render method: one dict lookup on the hot path."""
+
+    def __missing__(self, name):
+        return _compiled[name].render
+
+
+_compiled = _CompiledTemplates()
+renderers = _Renderers()
+
+
+def get_template(name):
+    """Compiled template for `name`, compiled on first use in this process."""
+    return _compiled[name]
+
+
+def render(template_name, /, **context):
+    """Return (subject, plain_text, html) for the named email."""
+    return renderers[template_name](**context)
@@ -0,0 +1,64 @@
+"""
+Cached filter facets for the public jobs list.
+
+The country dropdown needs every country that currently has live jobs plus
+a job count per country.  That is computed with one grouped query and
+cached; Job save/delete receivers in main/signals.py drop the cache, and
+the cache entry also expires on its own the day after the earliest
+deadline it covers, so expired jobs fall out of the counts without a save.
+"""
+
+from datetime import datetime, time as dt_time, timedelta
+from django.core.cache import cache
+from django.db.models import Count, Min
+from django.utils import timezone
+from main.models import Job, COUNTRY_CHOICES
+
+COUNTRY_FACETS_CACHE_KEY = 'job_facets:country'
+COUNTRY_FACETS_MAX_AGE = 24 * 60 * 60  # seconds
+
+_COUNTRY_NAMES = dict(COUNTRY_CHOICES)
+
+
+def _seconds_until_expiry(deadline):
+    """Seconds until the first moment `deadline` is in the past."""
+    if deadline is None:
+        return COUNTRY_FACETS_MAX_AGE
+    expires_at = timezone.make_aware(datetime.combine(deadline + timedelta(days=1), dt_time.min))
+    remaining = int((expires_at - timezone.now()).total_seconds())
+    return max(1, min(remaining, COUNTRY_FACETS_MAX_AGE))
+
+
+def _build_country_facets():
+    rows = (
+        Job.objects.live()
+        .values('country')
+        .annotate(count=Count('id'), next_deadline=Min('deadline'))
+        .order_by()
+    )
+
+    facets = []
+    next_deadline = None
+    for row in rows:
+        facets.append((row['country'], _COUNTRY_NAMES.get(row['country'], row['country']), row['count']))
+        if next_deadline is None or row['next_deadline'] < next_deadline:
+            next_deadline = row['next_deadline']
+
+    facets.sort(key=lambda facet: facet[1])
+    return facets, _seconds_until_expiry(next_deadline)
+
+
+def get_country_facets():
+    """
+    Return [(code, name, live_job_count), ...] sorted by country name.
+    Served from cache; hits the jobs table only after an invalidation.
+    """
+    facets = cache.get(COUNTRY_FACETS_CACHE_KEY)
+    if facets is None:
+        facets, timeout = _build_country_facets()
+        cache.set(COUNTRY_FACETS_CACHE_KEY, facets, timeout)
+    return facets
+
+
+def invalidate_country_facets():
+    cache.delete(COUNTRY_FACETS_CACHE_KEY)
@@ -0,0 +1,166 @@
+"""
+Responsive image variants.
+
+When a hero photo, team photo, profile picture or company logo is saved,
+generate_variants() writes a fixed set of downsized copies next to the
+original, in WebP plus a JPEG (or PNG, for images with transparency)
+fallback, and returns a compact manifest that is stored on the model:
+
+    {"src": "hero/1234.jpg", "w": 4032, "h": 3024,
+     "base": "hero/variants/1234", "sizes": [480, 960, 1600], "fallback": "jpg"}
+
+Variant files are named "<base>_<width>.<ext>", so the manifest does not
+have to list them.  The {% responsive_img %} tag (templatetags/
+responsive_images.py) turns a manifest into srcset attributes.
+
+Encoding is too slow for a request, so saves don't do it: the image
+worker (`python manage.py generate_image_variants --watch`) picks up rows
+whose manifest doesn't describe the current file (stale()) and refreshes
+them.  Until then templates fall back to the original image.  Variant
+files are deleted with their row (post_delete receivers in
+main/signals.py).
+"""
+
+import io
+import logging
+import os
+from django.core.files.base import ContentFile
+from django.db.models import F, Q
+from django.db.models.fields.json import KT
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# (model label, image field) → (manifest field, target widths)
+VARIANT_FIELDS = {
+    ('main.HeroPhoto', 'image'): ('image_variants', (480, 960, 1600)),
+    ('main.TeamMember', 'photo'): ('photo_variants', (160, 320, 640)),
+    ('main.User', 'profile_picture'): ('profile_picture_variants', (64, 128, 256)),
+    ('main.Company', 'logo'): ('logo_variants', (96, 192, 384)),
+}
+
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+
+
+def variant_config(instance, field_name):
+    return VARIANT_FIELDS.get((instance._meta.label, field_name))
+
+
+def stale(model, field_name):
+    """Rows of `model` whose manifest doesn't describe the file they hold."""
+    manifest_field, _ = VARIANT_FIELDS[(model._meta.label, field_name)]
+    has_file = Q(**{f'{field_name}__gt': ''})
+    no_manifest = Q(_variants_src__isnull=True)
+    return model.objects.annotate(_variants_src=KT(f'{manifest_field}__src')).filter(
+        (has_file & (no_manifest | ~Q(_variants_src=F(field_name)))) | (~has_file & ~no_manifest)
+    )
+
+
+def variant_name(manifest, width, ext):
+    return f"{manifest['base']}_{width}.{ext}"
+
+
+def _has_alpha(image):
+    return image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+
+
+def _encode(image, fmt):
+    buffer = io.BytesIO()
+    if fmt == 'webp':
+        image.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=4)
+    elif fmt == 'png':
+        image.save(buffer, 'PNG', optimize=True)
+    else:
+        image.save(buffer, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def generate_variants(field_file, widths):
+    """
+    Write resized variants of `field_file` to its storage and return the
+    manifest, or None when the file can't be read as an image.
+    """
+    storage = field_file.storage
+    try:
+        with storage.open(field_file.name, 'rb') as fh:
+            image = Image.open(fh)
+            image.load()
+    except (OSError, ValueError) as exc:
+        logger.warning("Image variants skipped for %s: %s", field_file.name, exc)
+        return None
+
+    image = ImageOps.exif_transpose(image)
+    alpha = _has_alpha(image)
+    image = image.convert('RGBA' if alpha else 'RGB')
+    fallback = 'png' if alpha else 'jpg'
+
+    directory, filename = os.path.split(field_file.name)
+    stem = os.path.splitext(filename)[0]
+    manifest = {
+        'src': field_file.name,
+        'w': image.width,
+        'h': image.height,
+        'base': f'{directory}/variants/{stem}' if directory else f'variants/{stem}',
+        'sizes': [],
+        'fallback': fallback,
+    }
+
+    # Never upscale; an image narrower than the smallest target still gets
+    # one re-encoded copy at its own width.
+    sizes = sorted({min(width, image.width) for width in widths})
+    for width in sizes:
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for ext in ('webp', fallback):
+            name = variant_name(manifest, width, ext)
+            if storage.exists(name):
+                storage.delete(name)
+            storage.save(name, ContentFile(_encode(resized, ext)))
+        manifest['sizes'].append(width)
+    return manifest
+
+
+def delete_variants(storage, manifest):
+    for width in (manifest or {}).get('sizes', []):
+        for ext in ('webp', manifest['fallback']):
+            name = variant_name(manifest, width, ext)
+            if storage.exists(name):
+                storage.delete(name)
+
+
+def refresh_variants(instance, field_name, force=False):
+    """
+    Bring the manifest for `instance.<field_name>` up to date with the file
+    it currently holds.  Returns True when the manifest changed.
+    """
+    manifest_field, widths = variant_config(instance, field_name)
+    field_file = getattr(instance, field_name)
+    current = getattr(instance, manifest_field) or {}
+
+    if not field_file:
+        if not current:
+            return False
+        delete_variants(field_file.storage, current)
+        manifest = {}
+    elif current.get('src') == field_file.name and not force:
+        return False
+    else:
+        if current:
+            delete_variants(field_file.storage, current)
+        manifest = generate_variants(field_file, widths) or {}
+
+    # Only if the row still holds the file the manifest is for: it may have
+    # been replaced since this instance was loaded
+    if field_file:
+        same_file = Q(**{field_name: field_file.name})
+    else:
+        same_file = Q(**{field_name: ''}) | Q(**{f'{field_name}__isnull': True})
+    updated = type(instance).objects.filter(same_file, pk=instance.pk).update(
+        **{manifest_field: manifest}
+    )
+    if not updated:
+        delete_variants(field_file.storage, manifest)
+        return False
+    setattr(instance, manifest_field, manifest)
+    return True
@@ -0,0 +1,46 @@
+"""
+Closing jobs whose application deadline has passed.
+
+Pages never show expired jobs (they read Job.objects.live(), which filters
+on the deadline), but the stored status stays 'active' until something
+closes it.  close_expired_jobs() does that for every such job with one
+UPDATE over the (status, deadline) index; `python manage.py
+close_expired_jobs` runs it once, or daily as a worker.
+
+QuerySet.update() sends no post_save, so the caches and indexes the Job
+receivers in main/signals.py would refresh are refreshed here instead,
+once for the whole batch, after the transaction commits.
+"""
+
+import logging
+import time
+from django.db import transaction
+from main import matching, related_jobs
+from main import utils as recommender
+from main.facets import invalidate_country_facets
+from main.models import Job
+from main.page_cache import purge_tags
+
+logger = logging.getLogger(__name__)
+
+
+def _after_close(job_ids):
+    related_jobs.refresh_jobs(job_ids)
+    purge_tags('job')
+    invalidate_country_facets()
+    recommender.clear_apriori_cache()
+
+
+def close_expired_jobs():
+    """Mark every active job past its deadline as closed; returns how many were closed."""
+    with transaction.atomic():
+        expired = Job.objects.expired()
+        job_ids = list(expired.values_list('pk', flat=True))
+        if not job_ids:
+            return 0
+        closed = expired.update(status='closed', updated_at=int(time.time() * 1000))
+        matching.mark_jobs_dirty(job_ids)
+        transaction.on_commit(lambda: _after_close(job_ids))
+
+    logger.info(f"Closed {closed} expired jobs")
+    return closed
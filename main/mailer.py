@@ -0,0 +1,226 @@
+"""
+Pooled SMTP connections.
+
+Django's EmailMessage.send() opens a connection, does the TLS handshake and
+AUTH, sends one message and hangs up.  The pool here keeps authenticated
+connections open between sends so a batch of queued messages (a bulk status
+update, a new-application alert to every recruiter) goes through one
+session with a single handshake:
+
+    results = mailer.send_messages(messages)   # [None | exception, ...]
+
+Connections are recycled after EMAIL_POOL['MAX_IDLE_SECONDS'] without use
+(relays drop idle sessions) and after MAX_MESSAGES_PER_CONNECTION sends.
+A send that fails because the server dropped a reused session is retried
+once on a fresh connection; any other error is reported for that message
+only and the rest of the batch carries on.
+
+get_stats() returns counters for the worker to log: handshakes opened,
+handshakes avoided and per-message send latency.
+"""
+
+import logging
+import smtplib
+import threading
+import time
+from django.conf import settings
+from django.core.mail import get_connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'MAX_CONNECTIONS': 2,
+    'MAX_IDLE_SECONDS': 60,
+    'MAX_MESSAGES_PER_CONNECTION': 200,
+}
+
+# Errors meaning "this session is gone", not "this message is bad"
+_DISCONNECT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+def _setting(name):
+    return getattr(settings, 'EMAIL_POOL', {}).get(name, DEFAULTS[name])
+
+
+class _PooledConnection:
+    def __init__(self, backend):
+        self.backend = backend
+        self.last_used = time.monotonic()
+        self.messages_sent = 0
+
+    def expired(self):
+        return (
+            time.monotonic() - self.last_used > _setting('MAX_IDLE_SECONDS')
+            or self.messages_sent >= _setting('MAX_MESSAGES_PER_CONNECTION')
+        )
+
+    def close(self):
+        try:
+            self.backend.close()
+        except Exception:  # noqa: BLE001
+            pass
+
+
+class MailerStats:
+    """Process-wide delivery counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.handshakes = 0
+        self.messages_sent = 0
+        self.messages_failed = 0
+        self.reconnects = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def record_handshake(self):
+        with self._lock:
+            self.handshakes += 1
+
+    def record_reconnect(self):
+        with self._lock:
+            self.reconnects += 1
+
+    def record_send(self, seconds, ok):
+        with self._lock:
+            if ok:
+                self.messages_sent += 1
+                self.latency_total += seconds
+                self.latency_max = max(self.latency_max, seconds)
+            else:
+                self.messages_failed += 1
+
+    def as_dict(self):
+        with self._lock:
+            attempted = self.messages_sent + self.messages_failed
+            return {
+                'handshakes': self.handshakes,
+                'handshakes_avoided': max(attempted - self.handshakes, 0),
+                'messages_sent': self.messages_sent,
+                'messages_failed': self.messages_failed,
+                'reconnects': self.reconnects,
+                'avg_latency_ms': round(self.latency_total / self.messages_sent * 1000, 1) if self.messages_sent else 0.0,
+                'max_latency_ms': round(self.latency_max * 1000, 1),
+            }
+
+
+class SMTPPool:
+    def __init__(self, stats):
+        self.stats = stats
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _open(self):
+        backend = get_connection(fail_silently=False)
+        # open() returns True only when it actually opened a network session
+        # (the smtp backend); locmem/console backends have nothing to open.
+        if backend.open():
+            self.stats.record_handshake()
+        return _PooledConnection(backend)
+
+    def acquire(self):
+        with self._lock:
+            while self._idle:
+                conn = self._idle.pop()
+                if not conn.expired():
+                    return conn
+                conn.close()
+        return self._open()
+
+    def release(self, conn):
+        conn.last_used = time.monotonic()
+        with self._lock:
+            if len(self._idle) < _setting('MAX_CONNECTIONS') and not conn.expired():
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def discard(self, conn):
+        conn.close()
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _send_one(self, conn, message):
+        message.connection = conn.backend
+        started = time.perf_counter()
+        conn.backend.send_messages([message])
+        conn.messages_sent += 1
+        return time.perf_counter() - started
+
+    def send_messages(self, messages):
+        """
+        Send `messages` over one pooled connection.  Returns a list with one
+        entry per message: None when it was sent, otherwise the exception.
+        """
+        results = []
+        if not messages:
+            return results
+
+        conn = None
+        try:
+            for index, message in enumerate(messages):
+                if conn is None or conn.expired():
+                    if conn is not None:
+                        self.discard(conn)
+                        conn = None
+                    try:
+                        conn = self.acquire()
+                    except Exception as exc:  # noqa: BLE001
+                        # Relay unreachable: fail the rest of the batch rather
+                        # than hammering it with one connect per message.
+                        remaining = len(messages) - index
+                        for _ in range(remaining):
+                            self.stats.record_send(0, ok=False)
+                        results.extend([exc] * remaining)
+                        break
+                try:
+                    elapsed = self._send_one(conn, message)
+                except _DISCONNECT_ERRORS:
+                    # Stale session: reconnect once and retry this message.
+                    self.discard(conn)
+                    self.stats.record_reconnect()
+                    conn = None
+                    try:
+                        conn = self._open()
+                        elapsed = self._send_one(conn, message)
+                    except Exception as exc:  # noqa: BLE001
+                        self.stats.record_send(0, ok=False)
+                        results.append(exc)
+                        if conn is not None:
+                            self.discard(conn)
+                            conn = None
+                        continue
+                except Exception as exc:  # noqa: BLE001
+                    self.stats.record_send(0, ok=False)
+                    results.append(exc)
+                    continue
+                self.stats.record_send(elapsed, ok=True)
+                results.append(None)
+        finally:
+            if conn is not None:
+                self.release(conn)
+        return results
+
+
+stats = MailerStats()
+pool = SMTPPool(stats)
+
+
+def send_messages(messages):
+    """Send a batch of EmailMessage objects through the shared pool."""
+    return pool.send_messages(list(messages))
+
+
+def get_stats():
+    return stats.as_dict()
+
+
+def close_connections():
+    pool.close_all()
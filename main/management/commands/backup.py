@@ -0,0 +1,251 @@
+"""
+Management command to back up the live SQLite database (and media) without blocking the app
+Usage: python manage.py backup [--dest backups/] [--media] [--keep-days 14] [--pages 256]
+
+The database is copied through SQLite's online backup API a few pages per
+step, so the read lock is only held for one step at a time.  The copy is
+switched out of WAL mode (a single self-contained file), checked with
+PRAGMA integrity_check and gzipped as a stream to db_<timestamp>.sqlite3.gz.
+--media takes a dated snapshot of MEDIA_ROOT in <dest>/media/<timestamp>/:
+files unchanged since the previous snapshot are hard links to it, so only
+new or changed files take space, and deleted or overwritten media stays
+recoverable from older snapshots.  Backups and media snapshots older than
+--keep-days are deleted; the newest snapshot is always kept.
+"""
+
+import gzip
+import os
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+# Writes from other connections make SQLite restart a stepped backup; after
+# this many restarts the copy is taken in one step instead
+MAX_RESTARTS = 3
+CHUNK_SIZE = 1024 * 1024
+# backup.sh used to write uncompressed copies and media tarballs; prune those too
+PRUNE_PATTERNS = ('db_*.sqlite3*', 'media_*.tar.gz')
+SNAPSHOT_FORMAT = '%Y%m%d_%H%M%S'
+
+
+class _TooManyRestarts(Exception):
+    pass
+
+
+class _StepTimer:
+    """Progress callback for Connection.backup(): times each step and counts restarts."""
+
+    def __init__(self, pause):
+        self.pause = pause
+        self.max_restarts = MAX_RESTARTS
+        self.steps = 0
+        self.restarts = 0
+        self.pages = 0
+        self.lock_held = 0.0
+        self.longest_hold = 0.0
+        self._remaining = None
+        self._step_started = time.perf_counter()
+
+    def __call__(self, status, remaining, total):
+        held = time.perf_counter() - self._step_started
+        self.steps += 1
+        self.lock_held += held
+        self.longest_hold = max(self.longest_hold, held)
+        self.pages = total
+        if self._remaining is not None and remaining > self._remaining:
+            self.restarts += 1
+            if self.max_restarts is not None and self.restarts > self.max_restarts:
+                raise _TooManyRestarts
+        self._remaining = remaining
+        if remaining and self.pause:
+            time.sleep(self.pause)
+        self._step_started = time.perf_counter()
+
+    def start_over(self):
+        """Before a one-step retry: no pause, no restart limit."""
+        self.pause = 0
+        self.max_restarts = None
+        self._remaining = None
+        self._step_started = time.perf_counter()
+
+
+def _size(nbytes):
+    return f'{nbytes / (1024 * 1024):.1f} MB'
+
+
+def _media_snapshots(snapshots):
+    """Finished snapshot directories under `snapshots` (named by SNAPSHOT_FORMAT)."""
+    if not snapshots.is_dir():
+        return []
+    found = []
+    for path in snapshots.iterdir():
+        try:
+            time.strptime(path.name, SNAPSHOT_FORMAT)
+        except ValueError:
+            continue
+        if path.is_dir():
+            found.append(path)
+    return found
+
+
+class Command(BaseCommand):
+    help = 'Back up the SQLite database with the online backup API, verify and gzip it, and prune old backups'
+
+    def add_arguments(self, parser):
+        config = getattr(settings, 'BACKUP', {})
+        parser.add_argument('--dest', default=str(config.get('DIR', settings.BASE_DIR / 'backups')))
+        parser.add_argument('--media', action='store_true', help='Also snapshot MEDIA_ROOT into <dest>/media/<timestamp>')
+        parser.add_argument('--keep-days', type=int, default=config.get('KEEP_DAYS', 14))
+        parser.add_argument('--pages', type=int, default=config.get('PAGES_PER_STEP', 256),
+                            help='Pages copied per backup step')
+        parser.add_argument('--pause-ms', type=float, default=config.get('STEP_PAUSE_MS', 5),
+                            help='Pause between steps, letting writers in')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError(
+                f'backup copies the SQLite database, but the default database is {connection.vendor}; '
+                'use pg_dump for PostgreSQL.'
+            )
+        source_path = Path(connection.settings_dict['NAME'])
+        if not source_path.exists():
+            raise CommandError(f'Database file not found: {source_path}')
+
+        dest = Path(options['dest'])
+        dest.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+
+        self._backup_database(source_path, dest, options)
+        if options['media']:
+            self._snapshot_media(Path(settings.MEDIA_ROOT), dest / 'media')
+        self._prune(dest, options['keep_days'])
+
+        self.stdout.write(self.style.SUCCESS(f'Backup finished in {time.perf_counter() - started:.2f} s.'))
+
+    def _backup_database(self, source_path, dest, options):
+        name = f"db_{time.strftime('%Y%m%d_%H%M%S')}.sqlite3"
+        # Dot-prefixed while in progress, so a failed run never matches the
+        # retention patterns or looks like a finished backup
+        copy_path = dest / f'.{name}.partial'
+        gz_path = dest / f'.{name}.gz.partial'
+        try:
+            copied = time.perf_counter()
+            timer = self._copy(source_path, copy_path, options['pages'], options['pause_ms'] / 1000)
+            copied = time.perf_counter() - copied
+
+            checked = time.perf_counter()
+            self._verify(copy_path)
+            checked = time.perf_counter() - checked
+
+            compressed = time.perf_counter()
+            with open(copy_path, 'rb') as raw, gzip.open(gz_path, 'wb', compresslevel=6) as out:
+                shutil.copyfileobj(raw, out, CHUNK_SIZE)
+            os.replace(gz_path, dest / f'{name}.gz')
+            compressed = time.perf_counter() - compressed
+
+            raw_size = copy_path.stat().st_size
+            gz_size = (dest / f'{name}.gz').stat().st_size
+        finally:
+            copy_path.unlink(missing_ok=True)
+            gz_path.unlink(missing_ok=True)
+
+        self.stdout.write(f'DB backed up → {dest / name}.gz ({_size(raw_size)} → {_size(gz_size)})')
+        self.stdout.write(
+            f'  copy {copied:.2f} s in {timer.steps} steps ({timer.pages} pages), '
+            f'{timer.restarts} restarts; lock held {timer.lock_held * 1000:.1f} ms in total, '
+            f'longest {timer.longest_hold * 1000:.1f} ms'
+        )
+        self.stdout.write(f'  integrity_check {checked:.2f} s, gzip {compressed:.2f} s')
+
+    def _copy(self, source_path, copy_path, pages, pause):
+        source = sqlite3.connect(source_path, timeout=20)
+        try:
+            timer = _StepTimer(pause)
+            target = sqlite3.connect(copy_path)
+            try:
+                source.backup(target, pages=pages, progress=timer)
+            except _TooManyRestarts:
+                # Writes keep invalidating the stepped copy.  Take it in one
+                # step: under WAL a reader doesn't block writers anyway.
+                self.stdout.write(self.style.WARNING(
+                    f'  source changed during {timer.restarts} stepped copies; copying in one step'
+                ))
+                timer.start_over()
+                source.backup(target, pages=-1, progress=timer)
+            # A self-contained file: no -wal/-shm needed to restore it
+            target.execute('PRAGMA journal_mode=DELETE')
+            target.close()
+        finally:
+            source.close()
+        return timer
+
+    def _verify(self, copy_path):
+        copy = sqlite3.connect(copy_path)
+        try:
+            result = [row[0] for row in copy.execute('PRAGMA integrity_check')]
+        finally:
+            copy.close()
+        if result != ['ok']:
+            raise CommandError(f"Backup copy failed integrity_check: {'; '.join(result[:5])}")
+
+    def _snapshot_media(self, source, snapshots):
+        if not source.is_dir():
+            self.stdout.write(self.style.WARNING(f'Media directory not found at {source}'))
+            return
+        started = time.perf_counter()
+        previous = max(_media_snapshots(snapshots), default=None)
+        name = time.strftime(SNAPSHOT_FORMAT)
+        # Dot-prefixed until complete, so it is never linked from or pruned half-written
+        partial = snapshots / f'.{name}.partial'
+        shutil.rmtree(partial, ignore_errors=True)
+        copied = copied_bytes = total = 0
+        for root, _dirs, files in os.walk(source):
+            for filename in files:
+                path = Path(root) / filename
+                relative = path.relative_to(source)
+                target = partial / relative
+                target.parent.mkdir(parents=True, exist_ok=True)
+                stat = path.stat()
+                total += 1
+                if previous is not None and self._link_unchanged(previous / relative, target, stat):
+                    continue
+                shutil.copy2(path, target)
+                copied += 1
+                copied_bytes += stat.st_size
+        os.replace(partial, snapshots / name)
+        self.stdout.write(
+            f'Media snapshot → {snapshots / name} ({copied} of {total} files new or changed, '
+            f'{_size(copied_bytes)}) in {time.perf_counter() - started:.2f} s'
+        )
+
+    @staticmethod
+    def _link_unchanged(earlier, target, stat):
+        """Hard-link `earlier` to `target` if it is the same file (size and mtime) as `stat`."""
+        try:
+            current = earlier.stat()
+            if current.st_size != stat.st_size or int(current.st_mtime) != int(stat.st_mtime):
+                return False
+            os.link(earlier, target)
+        except OSError:  # missing, or the filesystem has no hard links
+            return False
+        return True
+
+    def _prune(self, dest, keep_days):
+        cutoff = time.time() - keep_days * 86400
+        removed = 0
+        for pattern in PRUNE_PATTERNS:
+            for path in dest.glob(pattern):
+                if path.is_file() and path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+        snapshots = sorted(_media_snapshots(dest / 'media'))
+        for path in snapshots[:-1]:
+            if time.mktime(time.strptime(path.name, SNAPSHOT_FORMAT)) < cutoff:
+                shutil.rmtree(path)
+                removed += 1
+        self.stdout.write(f'Pruned {removed} backups older than {keep_days} days.')
+
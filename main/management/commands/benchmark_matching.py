@@ -0,0 +1,170 @@
+"""
+Management command to benchmark the candidate ↔ job matching kernel on synthetic data
+Usage: python manage.py benchmark_matching [--users 100000] [--jobs 10000] [--workers 1,4] [--small]
+
+The bulk kernel and one-row rescoring run in memory on --users × --jobs.
+The incremental refresh is then timed the way the refresh_job_matches
+worker runs it: against a throwaway test database seeded with the same
+users × jobs (or --db-users × --db-jobs), one skill is added to each
+sampled candidate or job, the ids are queued and the queue is drained.
+Seeding 100k candidates takes a while; --small runs 5,000 × 500 instead.
+"""
+
+import datetime
+import os
+import random
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from main import matching
+from main.models import Job, MatchRefresh, Skill, User, UserSkill
+
+
+def _synthetic_rows(count, skills, per_row, rng):
+    # Skewed skill popularity, like real postings: a few skills appear everywhere
+    weights = [1 / (rank + 1) for rank in range(skills)]
+    population = range(skills)
+    return {
+        row_id: set(rng.choices(population, weights, k=rng.randint(1, per_row * 2 - 1)))
+        for row_id in range(1, count + 1)
+    }
+
+
+class Command(BaseCommand):
+    help = 'Time bulk matching on synthetic users × jobs, and the refresh worker against a seeded test database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100_000)
+        parser.add_argument('--jobs', type=int, default=10_000)
+        parser.add_argument('--skills', type=int, default=500)
+        parser.add_argument('--skills-per-user', type=int, default=6)
+        parser.add_argument('--skills-per-job', type=int, default=5)
+        parser.add_argument('--workers', default=f'1,{os.cpu_count() or 1}',
+                            help='Comma-separated worker counts to try (default: 1 and all cores)')
+        parser.add_argument('--db-users', type=int,
+                            help='Candidates seeded for the refresh benchmark (default: --users; 0 skips it)')
+        parser.add_argument('--db-jobs', type=int, help='Jobs seeded for the refresh benchmark (default: --jobs)')
+        parser.add_argument('--sample', type=int, default=20, help='Candidates and jobs refreshed')
+        parser.add_argument('--small', action='store_true', help='5,000 users × 500 jobs, for a quick run')
+        parser.add_argument('--seed', type=int, default=7)
+
+    def handle(self, *args, **options):
+        if options['small']:
+            options['users'], options['jobs'] = 5_000, 500
+        for db_option, option in (('db_users', 'users'), ('db_jobs', 'jobs')):
+            if options[db_option] is None:
+                options[db_option] = options[option]
+        rng = random.Random(options['seed'])
+        users = _synthetic_rows(options['users'], options['skills'], options['skills_per_user'], rng)
+        jobs = _synthetic_rows(options['jobs'], options['skills'], options['skills_per_job'], rng)
+        self.stdout.write(f"{len(users):,} users × {len(jobs):,} jobs over {options['skills']} skills")
+
+        baseline = None
+        for workers in sorted({int(w) for w in options['workers'].split(',') if w.strip()}):
+            started = time.perf_counter()
+            user_tops, job_tops = matching.score_all(users, jobs, workers=workers)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            self.stdout.write(
+                f'  bulk, {workers} worker(s): {elapsed:7.2f}s  '
+                f'({len(users) / elapsed:,.0f} users/s, ×{baseline / elapsed:.1f})'
+            )
+
+        # Rescoring one row against the in-memory index: the refresh's kernel, without the database
+        index = matching.build_index(jobs, users)
+        sample_users = rng.sample(list(users.values()), min(1000, len(users)))
+        sample_jobs = rng.sample(list(jobs.values()), min(1000, len(jobs)))
+        started = time.perf_counter()
+        for skill_ids in sample_users:
+            matching.top_jobs_for(skill_ids, index['job_postings'])
+        per_user = (time.perf_counter() - started) / len(sample_users)
+        started = time.perf_counter()
+        for skill_ids in sample_jobs:
+            matching.top_users_for(skill_ids, index['user_postings'])
+        per_job = (time.perf_counter() - started) / len(sample_jobs)
+        self.stdout.write(f'  in memory: {per_user * 1000:.2f} ms per user row, {per_job * 1000:.2f} ms per job column')
+
+        if options['db_users'] and options['db_jobs']:
+            self.benchmark_refresh(options, rng)
+        self.stdout.write(self.style.SUCCESS('Done.'))
+
+    def benchmark_refresh(self, options, rng):
+        if connection.vendor == 'sqlite':
+            # A file, like production, rather than the in-memory test default
+            connection.settings_dict['TEST']['NAME'] = str(settings.BASE_DIR / '.benchmark_matching.sqlite3')
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            skill_ids = self.seed(options, rng)
+            started = time.perf_counter()
+            matching.rebuild()
+            self.stdout.write(
+                f"  seeded {options['db_users']:,} users × {options['db_jobs']:,} jobs; "
+                f'rebuild from the database {time.perf_counter() - started:.2f}s'
+            )
+
+            sample = options['sample']
+            user_ids = rng.sample(list(User.objects.filter(role='user').values_list('pk', flat=True)), sample)
+            job_ids = rng.sample(list(Job.objects.values_list('pk', flat=True)), sample)
+
+            # One new skill per sampled row, written without signals, then queued
+            UserSkill.objects.bulk_create(
+                [UserSkill(user_id=user_id, name=f'extra {user_id}', normalized_name=f'extra {user_id}',
+                           skill_id=rng.choice(skill_ids)) for user_id in user_ids],
+                ignore_conflicts=True,
+            )
+            Job.skills.through.objects.bulk_create(
+                [Job.skills.through(job_id=job_id, skill_id=rng.choice(skill_ids)) for job_id in job_ids],
+                ignore_conflicts=True,
+            )
+            per_user = self.drain(lambda: matching.mark_users_dirty(user_ids), sample)
+            per_job = self.drain(lambda: matching.mark_jobs_dirty(job_ids), sample)
+            self.stdout.write(
+                f'  refresh worker: {per_user * 1000:.2f} ms per candidate, {per_job * 1000:.2f} ms per job '
+                f'({sample} of each, queue to stored lists)'
+            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def seed(self, options, rng):
+        now = int(time.time() * 1000)
+        skills = Skill.objects.bulk_create(
+            [Skill(name=f'Skill {i}', slug=f'skill-{i}', created_at=now) for i in range(options['skills'])]
+        )
+        skill_ids = [skill.pk for skill in skills]
+        users = _synthetic_rows(options['db_users'], options['skills'], options['skills_per_user'], rng)
+        jobs = _synthetic_rows(options['db_jobs'], options['skills'], options['skills_per_job'], rng)
+
+        admin = User.objects.create(username='benchmark-admin', email='admin@benchmark.invalid', role='admin')
+        User.objects.bulk_create(
+            [User(id=admin.pk + i, username=f'candidate-{i}', email=f'{i}@benchmark.invalid', role='user')
+             for i in users],
+            batch_size=1000,
+        )
+        UserSkill.objects.bulk_create(
+            [UserSkill(user_id=admin.pk + i, name=f'Skill {s}', normalized_name=f'skill {s}', skill_id=skill_ids[s])
+             for i, row in users.items() for s in row],
+            batch_size=1000,
+        )
+        deadline = datetime.date.today() + datetime.timedelta(days=30)
+        Job.objects.bulk_create(
+            [Job(id=i, title=f'Job {i}', slug=f'job-{i}', description='-', country='QA', salary=1,
+                 deadline=deadline, posted_by=admin, status='active', created_at=now, updated_at=now)
+             for i in jobs],
+            batch_size=1000,
+        )
+        Job.skills.through.objects.bulk_create(
+            [Job.skills.through(job_id=i, skill_id=skill_ids[s]) for i, row in jobs.items() for s in row],
+            batch_size=1000,
+        )
+        return skill_ids
+
+    @staticmethod
+    def drain(queue, count):
+        """Seconds per queued row to mark and then empty the MatchRefresh queue."""
+        started = time.perf_counter()
+        queue()
+        while any(matching.process_pending()):
+            pass
+        assert not MatchRefresh.objects.exists()
+        return (time.perf_counter() - started) / count
@@ -0,0 +1,117 @@
+"""
+Management command to compare dense (pandas + mlxtend) and sparse (bitset) rule mining
+Usage: python manage.py benchmark_mining [--transactions 10000,100000,1000000] [--items 2000]
+"""
+
+import multiprocessing
+import random
+import resource
+import time
+from django.core.management.base import BaseCommand
+from main.utils import sparse_mining
+
+
+def _synthetic_transactions(count, items, seed):
+    # Applicants apply to 2-5 jobs; a few jobs attract most applications
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(items)]
+    population = range(items)
+    return [sorted(set(rng.choices(population, weights, k=rng.randint(2, 5)))) for _ in range(count)]
+
+
+def _peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # ru_maxrss is KiB on Linux
+
+
+def _dense(transactions, min_support, min_confidence):
+    import pandas as pd
+    from mlxtend.frequent_patterns import apriori, association_rules
+    from mlxtend.preprocessing import TransactionEncoder
+
+    te = TransactionEncoder()
+    df = pd.DataFrame(te.fit(transactions).transform(transactions), columns=te.columns_)
+    itemsets = apriori(df, min_support=min_support, use_colnames=True, max_len=3)
+    if itemsets.empty:
+        return 0, min_support
+    rules = association_rules(itemsets, metric='confidence', min_threshold=min_confidence, num_itemsets=len(itemsets))
+    return len(rules), min_support
+
+
+def _sparse(transactions, min_support, min_confidence, memory_limit_mb):
+    rules, used_support = sparse_mining.mine(
+        transactions, min_support, min_confidence, max_len=3, memory_limit_mb=memory_limit_mb,
+    )
+    return len(rules), used_support
+
+
+def _run(conn, mode, count, items, seed, min_support, min_confidence, memory_limit_mb):
+    # One fresh process per measurement, so ru_maxrss is this run's own peak
+    try:
+        transactions = _synthetic_transactions(count, items, seed)
+        baseline = _peak_rss_mb()
+        started = time.perf_counter()
+        if mode == 'dense':
+            rules, support = _dense(transactions, min_support, min_confidence)
+        else:
+            rules, support = _sparse(transactions, min_support, min_confidence, memory_limit_mb)
+        conn.send(('ok', time.perf_counter() - started, _peak_rss_mb() - baseline, rules, support))
+    except ImportError as e:
+        conn.send(('skipped', str(e)))
+    except MemoryError:
+        conn.send(('failed', 'MemoryError'))
+    finally:
+        conn.close()
+
+
+class Command(BaseCommand):
+    help = 'Benchmark peak RSS and wall time of dense vs sparse association-rule mining on synthetic data'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--transactions', default='10000,100000,1000000')
+        parser.add_argument('--items', type=int, default=2000)
+        parser.add_argument('--min-support', type=float, default=0.001)
+        parser.add_argument('--min-confidence', type=float, default=0.1)
+        parser.add_argument('--memory-limit-mb', type=int, default=256)
+        parser.add_argument('--max-dense-mb', type=int, default=4096,
+                            help='Skip the dense path when its one-hot matrix alone would exceed this')
+        parser.add_argument('--seed', type=int, default=7)
+
+    def _measure(self, mode, count, options):
+        parent, child = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(target=_run, args=(
+            child, mode, count, options['items'], options['seed'],
+            options['min_support'], options['min_confidence'], options['memory_limit_mb'],
+        ))
+        process.start()
+        child.close()
+        try:
+            result = parent.recv()
+        except EOFError:
+            result = ('failed', f'worker exited with code {process.exitcode}')
+        process.join()
+        return result
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{options['items']} jobs, min_support={options['min_support']:g}, "
+            f"min_confidence={options['min_confidence']:g}, sparse ceiling {options['memory_limit_mb']} MB"
+        )
+        self.stdout.write(f"{'transactions':>12}  {'mode':<6}  {'time':>8}  {'peak RSS':>9}  {'rules':>7}  support")
+
+        for count in [int(n) for n in options['transactions'].split(',') if n.strip()]:
+            for mode in ('dense', 'sparse'):
+                dense_mb = count * options['items'] / (1024 * 1024)  # one byte per cell
+                if mode == 'dense' and dense_mb > options['max_dense_mb']:
+                    result = ('skipped', f'one-hot matrix would be {dense_mb:,.0f} MB')
+                else:
+                    result = self._measure(mode, count, options)
+
+                if result[0] == 'ok':
+                    _, elapsed, rss, rules, support = result
+                    self.stdout.write(
+                        f'{count:>12,}  {mode:<6}  {elapsed:>7.2f}s  {rss:>6.0f} MB  {rules:>7,}  {support:g}'
+                    )
+                else:
+                    self.stdout.write(f'{count:>12,}  {mode:<6}  {result[0]}: {result[1]}')
+
+        self.stdout.write(self.style.SUCCESS('Done.'))
@@ -0,0 +1,189 @@
+"""
+Management command to hammer apply and login from several processes, with SQLite's defaults and with the tuned settings
+Usage: python manage.py benchmark_sqlite_concurrency [--processes 6] [--seconds 10]
+"""
+
+import multiprocessing
+import os
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+import datetime
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connections
+from django.test import Client, override_settings
+
+# 1×1 PNG, accepted by the apply form as a passport photo
+_PNG = (
+    b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89'
+    b'\x00\x00\x00\rIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82'
+)
+_PASSWORD = 'benchmark-password'
+
+# Both runs use a fast hasher, so login time is the database's, not PBKDF2's
+_BENCHMARK_SETTINGS = {
+    'PASSWORD_HASHERS': ['django.contrib.auth.hashers.MD5PasswordHasher'],
+    'ALLOWED_HOSTS': ['*'],
+    'DEBUG': False,
+}
+
+
+def _use_database(path, options, conn_max_age=0):
+    connections.close_all()
+    settings_dict = connections['default'].settings_dict
+    settings_dict.update(NAME=path, OPTIONS=options, CONN_MAX_AGE=conn_max_age)
+
+
+def _seed(users):
+    from main.models import Job, Skill, User
+
+    admin = User.objects.create_user(username='bench-admin', password=_PASSWORD, role='admin', email='admin@bench.test')
+    skills = [Skill.objects.create(name=f'Bench skill {i}') for i in range(8)]
+    deadline = datetime.date.today() + datetime.timedelta(days=30)
+    for i in range(5):
+        job = Job.objects.create(
+            title=f'Bench job {i}', company_name='Bench', description='Benchmark job', country='QA',
+            salary=1000, deadline=deadline, status='active', posted_by=admin,
+        )
+        job.skills.set(skills[i:i + 3])
+    for i in range(users):
+        # Unverified: their login writes a session and queues an OTP email
+        User.objects.create_user(
+            username=f'bench-user-{i}', password=_PASSWORD, role='user', email=f'user{i}@bench.test',
+            is_email_verified=False,
+        )
+
+
+def _apply(client, job_slugs, skill_ids, rng):
+    response = client.post(f'/jobs/{rng.choice(job_slugs)}/apply/', {
+        'full_name': 'Bench Applicant',
+        'contact_number': '5550100',
+        'passport_number': f'B{rng.randrange(10 ** 8)}',
+        'skills': rng.sample(skill_ids, 2),
+        'passport_photo': SimpleUploadedFile('passport.png', _PNG, content_type='image/png'),
+    })
+    return response.status_code == 302 and 'success' in response['Location']
+
+
+def _login(client, usernames, rng):
+    response = client.post('/login/', {'identifier': rng.choice(usernames), 'password': _PASSWORD})
+    client.cookies.clear()
+    return response.status_code == 302
+
+
+def _worker(conn, path, options, conn_max_age, media_root, seconds, seed):
+    result = {'ok': 0, 'failed': 0, 'locked': 0, 'errors': 0, 'latencies': []}
+    try:
+        _use_database(path, options, conn_max_age)
+        with override_settings(MEDIA_ROOT=media_root, **_BENCHMARK_SETTINGS):
+            from main.models import Job, Skill, User
+
+            rng = random.Random(seed)
+            job_slugs = list(Job.objects.values_list('slug', flat=True))
+            skill_ids = [str(pk) for pk in Skill.objects.values_list('pk', flat=True)]
+            usernames = list(User.objects.filter(role='user').values_list('username', flat=True))
+            client = Client()
+
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                try:
+                    if rng.random() < 0.5:
+                        ok = _apply(client, job_slugs, skill_ids, rng)
+                    else:
+                        ok = _login(client, usernames, rng)
+                    result['ok' if ok else 'failed'] += 1
+                except OperationalError as e:
+                    result['locked' if 'locked' in str(e) else 'errors'] += 1
+                    connections.close_all()
+                except Exception:  # noqa: BLE001
+                    result['errors'] += 1
+                    connections.close_all()
+                result['latencies'].append(time.perf_counter() - started)
+        connections.close_all()
+    finally:
+        conn.send(result)
+        conn.close()
+
+
+class Command(BaseCommand):
+    help = 'Benchmark concurrent apply/login throughput and lock errors: SQLite defaults vs the tuned settings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=6)
+        parser.add_argument('--seconds', type=float, default=10.0, help='Duration of each run')
+        parser.add_argument('--users', type=int, default=50)
+        parser.add_argument('--seed', type=int, default=7)
+
+    def handle(self, *args, **options):
+        configured = settings.DATABASES['default']
+        runs = [
+            # Django's own defaults: rollback journal, 5 s busy timeout, DEFERRED transactions
+            ('defaults', {}, 0),
+            ('tuned', dict(configured.get('OPTIONS', {})), configured.get('CONN_MAX_AGE', 0)),
+        ]
+        original = dict(connections['default'].settings_dict)
+        workdir = tempfile.mkdtemp(prefix='sqlite-bench-')
+        try:
+            # One seeded schema, copied for every run so each starts identical
+            template = os.path.join(workdir, 'template.sqlite3')
+            _use_database(template, {})
+            with override_settings(**_BENCHMARK_SETTINGS):
+                call_command('migrate', verbosity=0)
+                _seed(options['users'])
+            connections.close_all()
+
+            self.stdout.write(
+                f"{options['processes']} processes × {options['seconds']:g} s, 50% apply / 50% login"
+            )
+            self.stdout.write(
+                f"{'settings':<9}  {'ops/s':>7}  {'ok':>6}  {'failed':>6}  {'locked':>6}  {'errors':>6}  {'p50':>8}  {'p95':>8}"
+            )
+            for label, db_options, conn_max_age in runs:
+                path = os.path.join(workdir, f'{label}.sqlite3')
+                with sqlite3.connect(template) as source, sqlite3.connect(path) as target:
+                    source.backup(target)
+                totals = self._run(path, db_options, conn_max_age, os.path.join(workdir, f'media-{label}'), options)
+                latencies = sorted(totals['latencies'])
+                p50 = statistics.median(latencies) * 1000 if latencies else 0
+                p95 = latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0
+                self.stdout.write(
+                    f"{label:<9}  {totals['ok'] / options['seconds']:>7.1f}  {totals['ok']:>6}  {totals['failed']:>6}  "
+                    f"{totals['locked']:>6}  {totals['errors']:>6}  {p50:>6.1f}ms  {p95:>6.1f}ms"
+                )
+        finally:
+            connections.close_all()
+            connections['default'].settings_dict.update(original)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        self.stdout.write(self.style.SUCCESS('Done.'))
+
+    def _run(self, path, db_options, conn_max_age, media_root, options):
+        context = multiprocessing.get_context('fork')
+        pipes, processes = [], []
+        for i in range(options['processes']):
+            parent, child = context.Pipe(duplex=False)
+            process = context.Process(target=_worker, args=(
+                child, path, db_options, conn_max_age, media_root, options['seconds'], options['seed'] + i,
+            ))
+            process.start()
+            child.close()
+            pipes.append(parent)
+            processes.append(process)
+
+        totals = {'ok': 0, 'failed': 0, 'locked': 0, 'errors': 0, 'latencies': []}
+        for parent, process in zip(pipes, processes):
+            try:
+                result = parent.recv()
+            except EOFError:
+                result = {'errors': 1}
+            process.join()
+            for key, value in result.items():
+                totals[key] += value
+        return totals
@@ -0,0 +1,42 @@
+"""
+Management command to close jobs whose application deadline has passed
+Usage:
+    python manage.py close_expired_jobs            # run forever, sweeping after every midnight
+    python manage.py close_expired_jobs --once     # sweep once and exit (cron)
+"""
+
+import time
+from datetime import datetime, time as dt_time, timedelta
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+from main.job_expiry import close_expired_jobs
+
+
+def _seconds_until_midnight():
+    now = timezone.now()
+    midnight = timezone.make_aware(datetime.combine(now.date() + timedelta(days=1), dt_time.min))
+    return max(1, int((midnight - now).total_seconds()))
+
+
+class Command(BaseCommand):
+    help = 'Bulk-close active jobs whose deadline has passed'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Sweep once and exit')
+        parser.add_argument('--delay', type=int, default=60,
+                            help='Seconds after midnight to wait before each sweep')
+
+    def handle(self, *args, **options):
+        if not options['once']:
+            self.stdout.write(self.style.SUCCESS('Job expiry worker started.'))
+        while True:
+            close_old_connections()
+            closed = close_expired_jobs()
+            if closed or options['once']:
+                self.stdout.write(f'Closed {closed} expired job(s).')
+
+            if options['once']:
+                return
+            # Deadlines are dates, so nothing else expires before midnight
+            time.sleep(_seconds_until_midnight() + options['delay'])
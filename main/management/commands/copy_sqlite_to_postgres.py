@@ -0,0 +1,111 @@
+"""
+Management command to copy the SQLite database into the configured PostgreSQL database
+Usage: python manage.py copy_sqlite_to_postgres [--source path/to/db.sqlite3] [--batch-size 2000] [--truncate]
+
+Run `python manage.py migrate` against PostgreSQL first (DB_ENGINE=postgresql).
+Every table of the main app is copied, including the many-to-many rows
+(job and application skills), with primary keys preserved; sequences are
+then reset and the search index rebuilt.  Rows are inserted with
+bulk_create, so no model signals fire.
+"""
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.core.serializers import sort_dependencies
+from django.db import connections, transaction
+from main import search
+
+SOURCE_ALIAS = 'sqlite_source'
+
+
+def _models_to_copy():
+    """main's models, parents before children, then the M2M tables between them."""
+    app_config = apps.get_app_config('main')
+    models = sort_dependencies([(app_config, list(app_config.get_models()))], allow_cycles=True)
+    through = []
+    for model in models:
+        for field in model._meta.local_many_to_many:
+            remote = field.remote_field
+            if remote.through._meta.auto_created and remote.model._meta.app_label == 'main':
+                through.append(remote.through)
+    return models + through
+
+
+def _add_source_database(path):
+    # configure_settings() fills in the defaults (and insists on 'default')
+    connections.settings[SOURCE_ALIAS] = connections.configure_settings({
+        'default': connections.settings['default'],
+        SOURCE_ALIAS: {'ENGINE': 'django.db.backends.sqlite3', 'NAME': path},
+    })[SOURCE_ALIAS]
+
+
+class Command(BaseCommand):
+    help = 'Copy users, jobs, applications, skills and the M2M rows from SQLite into PostgreSQL'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', help='SQLite file (default: the path DB_ENGINE=sqlite would use)')
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--truncate', action='store_true',
+                            help='Empty the PostgreSQL tables first instead of requiring them to be empty')
+
+    def handle(self, *args, **options):
+        target = connections['default']
+        if target.vendor != 'postgresql':
+            raise CommandError('The default database is not PostgreSQL; set DB_ENGINE=postgresql (see .env.example).')
+
+        source_path = options['source'] or str(
+            settings.BASE_DIR / 'db_data' / 'db.sqlite3' if settings.ENVIRONMENT == 'production'
+            else settings.BASE_DIR / 'db.sqlite3'
+        )
+        _add_source_database(source_path)
+        models = _models_to_copy()
+
+        if options['truncate']:
+            tables = ', '.join(target.ops.quote_name(model._meta.db_table) for model in models)
+            with target.cursor() as cursor:
+                cursor.execute(f'TRUNCATE {tables} RESTART IDENTITY CASCADE')
+        else:
+            not_empty = [model._meta.db_table for model in models if model.objects.exists()]
+            if not_empty:
+                raise CommandError(f"PostgreSQL already has rows in {', '.join(not_empty)}; rerun with --truncate.")
+
+        self.stdout.write(f'Copying {source_path} → {target.settings_dict["NAME"]}')
+        with transaction.atomic():
+            # Django's foreign keys on PostgreSQL are DEFERRABLE INITIALLY
+            # DEFERRED, so they are checked once, at commit
+            for model in models:
+                copied = self._copy(model, options['batch_size'])
+                self.stdout.write(f'  {model._meta.db_table:<32} {copied:>9,}')
+
+            with target.cursor() as cursor:
+                for sql in target.ops.sequence_reset_sql(no_style(), models):
+                    cursor.execute(sql)
+
+        indexed = search.get_search_backend().rebuild()
+        self.stdout.write(f'Search index rebuilt for {indexed} jobs.')
+
+        mismatched = [
+            model._meta.db_table for model in models
+            if model.objects.using(SOURCE_ALIAS).count() != model.objects.count()
+        ]
+        connections[SOURCE_ALIAS].close()
+        if mismatched:
+            raise CommandError(f"Row counts differ after the copy: {', '.join(mismatched)}")
+        self.stdout.write(self.style.SUCCESS(f'Copied {len(models)} tables; row counts match.'))
+
+    def _copy(self, model, batch_size):
+        fields = [field.attname for field in model._meta.concrete_fields]
+        rows = model.objects.using(SOURCE_ALIAS).order_by('pk').values_list(*fields)
+        batch, copied = [], 0
+        for row in rows.iterator(chunk_size=batch_size):
+            batch.append(model(**dict(zip(fields, row))))
+            if len(batch) >= batch_size:
+                model.objects.bulk_create(batch)
+                copied += len(batch)
+                batch = []
+        if batch:
+            model.objects.bulk_create(batch)
+            copied += len(batch)
+        return copied
@@ -0,0 +1,66 @@
+"""
+Management command to generate responsive variants for uploaded images
+Usage:
+    python manage.py generate_image_variants            # refresh stale variants once and exit
+    python manage.py generate_image_variants --watch    # run forever (worker)
+    python manage.py generate_image_variants --force    # regenerate every image's variants
+"""
+
+import time
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from main import auth_cache, images
+from main.company_cache import invalidate_company
+from main.page_cache import purge_tags
+
+# Caches that render each model's images, dropped once its manifests are written
+_PAGE_CACHE_TAGS = {'main.HeroPhoto': 'hero', 'main.TeamMember': 'team', 'main.Company': 'company'}
+
+
+class Command(BaseCommand):
+    help = 'Create WebP/JPEG variants for new or changed hero, team, profile and logo images'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Regenerate variants that already exist')
+        parser.add_argument('--watch', action='store_true', help='Keep running, polling for new images')
+        parser.add_argument('--sleep', type=float, default=10.0, help='Seconds between polls with --watch')
+
+    def handle(self, *args, **options):
+        if options['watch']:
+            self.stdout.write(self.style.SUCCESS('Image variant worker started.'))
+        force = options['force']
+        while True:
+            close_old_connections()
+            for (label, field_name), _ in images.VARIANT_FIELDS.items():
+                updated = self.refresh(apps.get_model(label), field_name, force)
+                if updated or not options['watch']:
+                    self.stdout.write(f'{label}.{field_name}: {len(updated)} updated')
+
+            if not options['watch']:
+                self.stdout.write(self.style.SUCCESS('Done.'))
+                return
+            force = False
+            time.sleep(options['sleep'])
+
+    def refresh(self, model, field_name, force):
+        if force:
+            queryset = model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+        else:
+            queryset = images.stale(model, field_name)
+        updated = [
+            instance.pk for instance in queryset.iterator(chunk_size=200)
+            if images.refresh_variants(instance, field_name, force=force)
+        ]
+        # Manifests are written with update(), which fires no save receivers,
+        # so drop the caches that render these images now that they're stored
+        if updated:
+            label = model._meta.label
+            if label == 'main.User':
+                for user_id in updated:
+                    auth_cache.invalidate_user(user_id)
+            else:
+                purge_tags(_PAGE_CACHE_TAGS[label])
+            if label == 'main.Company':
+                invalidate_company()
+        return updated
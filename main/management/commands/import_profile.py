@@ -0,0 +1,105 @@
+"""
+Management command to report per-module import cost of the WSGI entry point
+Usage: python manage.py import_profile [--module talent_solutions.wsgi] [--budget-ms 1500] [--top 25]
+"""
+
+import os
+import re
+import subprocess
+import sys
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+_MARKER = '--import-profile-start--'
+
+# Runs in a fresh interpreter, so nothing is imported yet.  The URLconf
+# (and with it every view) is what Django imports on the first request.
+_SCRIPT = '''
+import sys, time
+sys.stderr.write({marker!r} + "\\n")
+started = time.perf_counter()
+# __import__ rather than importlib.import_module: only the former is
+# recorded by -X importtime
+__import__({module!r})
+if {with_urls!r}:
+    from django.conf import settings
+    __import__(settings.ROOT_URLCONF)
+print(time.perf_counter() - started)
+'''
+
+# "import time:       302 |        698 |       main.utils.apriori_recommendations"
+_LINE_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def _profile(module, with_urls):
+    """(wall seconds, [(name, self µs, cumulative µs, depth)]) from one fresh interpreter."""
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'talent_solutions.settings'))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         _SCRIPT.format(marker=_MARKER, module=module, with_urls=with_urls)],
+        capture_output=True, text=True, cwd=settings.BASE_DIR, env=env,
+    )
+    if result.returncode != 0:
+        raise CommandError(f'Importing {module} failed:\n{result.stderr[-2000:]}')
+
+    modules = []
+    lines = iter(result.stderr.splitlines())
+    for line in lines:
+        if line == _MARKER:
+            break
+    for line in lines:
+        match = _LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return float(result.stdout.strip().splitlines()[-1]), modules
+
+
+def _package(name):
+    return name.split('.', 1)[0]
+
+
+class Command(BaseCommand):
+    help = 'Report per-module import cost of the WSGI entry point and fail when it exceeds the budget'
+
+    def add_arguments(self, parser):
+        config = getattr(settings, 'IMPORT_PROFILE', {})
+        parser.add_argument('--module', default=config.get('MODULE', 'talent_solutions.wsgi'))
+        parser.add_argument('--budget-ms', type=float, default=config.get('BUDGET_MS'),
+                            help='Fail when the import takes longer (default: settings.IMPORT_PROFILE)')
+        parser.add_argument('--top', type=int, default=25, help='Modules listed, by cumulative time')
+        parser.add_argument('--runs', type=int, default=3, help='Fresh interpreters; the fastest run is reported')
+        parser.add_argument('--no-urls', action='store_true', help='Skip importing the URLconf and views')
+
+    def handle(self, *args, **options):
+        module, with_urls = options['module'], not options['no_urls']
+        runs = [_profile(module, with_urls) for _ in range(max(1, options['runs']))]
+        wall, modules = min(runs, key=lambda run: run[0])
+        wall_ms = wall * 1000
+
+        self.stdout.write(f"{'self ms':>9}  {'cumul. ms':>9}  module")
+        for name, self_us, cumulative_us, depth in sorted(modules, key=lambda m: m[2], reverse=True)[:options['top']]:
+            self.stdout.write(f"{self_us / 1000:>9.1f}  {cumulative_us / 1000:>9.1f}  {'  ' * depth}{name}")
+
+        by_package = {}
+        for name, self_us, _, _ in modules:
+            by_package[_package(name)] = by_package.get(_package(name), 0) + self_us
+        self.stdout.write('\nBy top-level package (self time):')
+        for package, total_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:10]:
+            self.stdout.write(f'{total_us / 1000:>9.1f}  {package}')
+
+        target = f'{module} + URLconf' if with_urls else module
+        self.stdout.write(f'\nImporting {target}: {wall_ms:.0f} ms, {len(modules)} modules (fastest of {len(runs)})')
+
+        problems = []
+        forbidden = set(getattr(settings, 'IMPORT_PROFILE', {}).get('FORBIDDEN', []))
+        loaded = sorted(forbidden & set(by_package))
+        if loaded:
+            problems.append(f"imports optional heavy packages: {', '.join(loaded)}")
+        budget = options['budget_ms']
+        if budget is not None and wall_ms > budget:
+            problems.append(f'{wall_ms:.0f} ms is over the {budget:g} ms budget')
+        if problems:
+            raise CommandError(f'Import profile of {target} ' + '; '.join(problems))
+        if budget is not None:
+            self.stdout.write(self.style.SUCCESS(f'Within the {budget:g} ms budget.'))
@@ -0,0 +1,33 @@
+"""
+Management command to mine "also applied to" association rules from job applications
+Usage: python manage.py mine_job_rules [--min-support 0.01] [--min-confidence 0.1] [--mode sparse|dense] [--memory-limit-mb 256]
+"""
+
+from django.core.management.base import BaseCommand
+from main.utils import mine_job_rules
+
+
+class Command(BaseCommand):
+    help = 'Run Apriori on job applications and store the rules used for job recommendations'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--min-support', type=float, default=0.01)
+        parser.add_argument('--min-confidence', type=float, default=0.1)
+        parser.add_argument('--mode', choices=['sparse', 'dense'], help='Default: settings.APRIORI_MINING')
+        parser.add_argument('--memory-limit-mb', type=int, help='Ceiling for sparse mining')
+
+    def handle(self, *args, **options):
+        rules, stored = mine_job_rules(
+            min_support=options['min_support'],
+            min_confidence=options['min_confidence'],
+            mode=options['mode'],
+            memory_limit_mb=options['memory_limit_mb'],
+        )
+        if not rules:
+            self.stdout.write(self.style.WARNING(
+                'No association rules mined; the previously stored rules were kept.'
+            ))
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f'Mined {len(rules)} association rules, stored {stored} job pairs.'
+        ))
@@ -0,0 +1,15 @@
+"""
+Management command to recompute the denormalized application status counters
+Usage: python manage.py rebuild_application_counts
+"""
+
+from django.core.management.base import BaseCommand
+from main.application_stats import rebuild_status_counts
+
+
+class Command(BaseCommand):
+    help = 'Recompute ApplicationStatusCount rows from the job_applications table'
+
+    def handle(self, *args, **options):
+        count = rebuild_status_counts()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {count} status counter rows.'))
@@ -0,0 +1,32 @@
+"""
+Management command to recompute candidate ↔ job skill matches
+Usage:
+    python manage.py rebuild_job_matches [--workers 4]
+    python manage.py rebuild_job_matches --if-empty   # only when no matches are stored (entrypoint.sh)
+"""
+
+import time
+from django.core.management.base import BaseCommand
+from main import matching
+from main.models import JobMatch
+
+
+class Command(BaseCommand):
+    help = 'Re-link user skills and recompute recommended jobs per candidate and top candidates per job'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1, help='Worker processes for scoring (default 1)')
+        parser.add_argument('--if-empty', action='store_true',
+                            help='Do nothing when matches are already stored (e.g. on every container start)')
+
+    def handle(self, *args, **options):
+        if options['if_empty'] and JobMatch.objects.exists():
+            self.stdout.write('Job matches already built.')
+            return
+        started = time.perf_counter()
+        relinked = matching.relink_user_skills()
+        users, jobs = matching.rebuild(workers=options['workers'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Matched {users} candidates against {jobs} active jobs in '
+            f'{time.perf_counter() - started:.1f}s ({len(relinked)} candidates had skills re-linked).'
+        ))
@@ -0,0 +1,27 @@
+"""
+Management command to rebuild the precomputed related-jobs lists
+Usage:
+    python manage.py rebuild_related_jobs              # recompute every list
+    python manage.py rebuild_related_jobs --if-empty   # only when the index is empty (entrypoint.sh)
+"""
+
+from django.core.management.base import BaseCommand
+from main import related_jobs
+from main.models import RelatedJob
+
+
+class Command(BaseCommand):
+    help = 'Recompute the related-jobs list of every active job'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--if-empty', action='store_true',
+                            help='Do nothing when the index already has rows (e.g. on every container start)')
+
+    def handle(self, *args, **options):
+        if options['if_empty'] and RelatedJob.objects.exists():
+            self.stdout.write('Related-jobs index already built.')
+            return
+        count = related_jobs.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed related jobs for {count} active jobs (top {related_jobs.TOP_K} each).'
+        ))
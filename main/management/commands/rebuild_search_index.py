@@ -0,0 +1,18 @@
+"""
+Management command to rebuild the job full-text search index
+Usage: python manage.py rebuild_search_index
+"""
+
+from django.core.management.base import BaseCommand
+from main.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for all jobs'
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        count = backend.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {count} jobs with {backend.__class__.__name__}.'
+        ))
@@ -0,0 +1,27 @@
+"""
+Management command to recount the skill co-occurrence table behind skill suggestions
+Usage:
+    python manage.py rebuild_skill_associations
+    python manage.py rebuild_skill_associations --if-empty   # only when nothing is counted yet (entrypoint.sh)
+"""
+
+from django.core.management.base import BaseCommand
+from main import skill_suggestions
+from main.models import SkillAssociation
+
+
+class Command(BaseCommand):
+    help = 'Recount how often each pair of skills is picked together on applications and jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--if-empty', action='store_true',
+                            help='Do nothing when pair counts are already stored (e.g. on every container start)')
+
+    def handle(self, *args, **options):
+        if options['if_empty'] and SkillAssociation.objects.exists():
+            self.stdout.write('Skill pair counts already built.')
+            return
+        baskets = skill_suggestions.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Counted {SkillAssociation.objects.count()} skill pairs over {baskets} applications and jobs.'
+        ))
@@ -0,0 +1,38 @@
+"""
+Management command to refresh the candidate ↔ job matches and related-jobs lists queued by model changes
+Usage:
+    python manage.py refresh_job_matches            # run forever (worker)
+    python manage.py refresh_job_matches --once     # drain the queue and exit
+"""
+
+import time
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from main import matching
+
+
+class Command(BaseCommand):
+    help = 'Recompute the JobMatch and RelatedJob lists of candidates and jobs queued in MatchRefresh'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Process the queue until empty and exit')
+        parser.add_argument('--batch-size', type=int, default=matching.REFRESH_BATCH_SIZE,
+                            help='Queued refreshes per batch')
+        parser.add_argument('--sleep', type=float, default=5.0, help='Seconds to wait when the queue is empty')
+
+    def handle(self, *args, **options):
+        if not options['once']:
+            self.stdout.write(self.style.SUCCESS('Match refresh worker started.'))
+        while True:
+            close_old_connections()
+            started = time.perf_counter()
+            users, jobs, related = matching.process_pending(options['batch_size'])
+            if users or jobs or related:
+                self.stdout.write(
+                    f'Refreshed {users} candidate(s), {jobs} job(s) and {related} related-jobs list(s) '
+                    f'in {time.perf_counter() - started:.2f}s.'
+                )
+                continue
+            if options['once']:
+                return
+            time.sleep(options['sleep'])
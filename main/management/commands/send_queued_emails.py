@@ -0,0 +1,56 @@
+"""
+Management command to deliver queued outbound email
+Usage:
+    python manage.py send_queued_emails            # run forever (worker)
+    python manage.py send_queued_emails --once     # deliver one batch and exit
+"""
+
+import time
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from main import mailer, outbox
+
+STATS_INTERVAL_SECONDS = 15 * 60
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued emails from the outbox with retries and backoff'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Process a single batch and exit')
+        parser.add_argument('--batch-size', type=int, default=None, help='Messages claimed per batch')
+        parser.add_argument('--sleep', type=float, default=5.0, help='Seconds to wait when the queue is empty')
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('Email worker started.'))
+        last_stats = time.monotonic()
+        try:
+            while True:
+                close_old_connections()
+                requeued = outbox.requeue_stale()
+                if requeued:
+                    self.stdout.write(self.style.WARNING(f'Requeued {requeued} stale message(s).'))
+
+                sent, failed = outbox.process_batch(options['batch_size'])
+                if sent or failed:
+                    self.stdout.write(f'Sent {sent}, failed {failed}.')
+
+                if options['once']:
+                    return
+                if time.monotonic() - last_stats > STATS_INTERVAL_SECONDS:
+                    self.write_stats()
+                    last_stats = time.monotonic()
+                if not (sent or failed):
+                    time.sleep(options['sleep'])
+        finally:
+            mailer.close_connections()
+            self.write_stats()
+
+    def write_stats(self):
+        stats = mailer.get_stats()
+        self.stdout.write(
+            f"SMTP: {stats['messages_sent']} sent, {stats['messages_failed']} failed, "
+            f"{stats['handshakes']} handshakes ({stats['handshakes_avoided']} avoided), "
+            f"{stats['reconnects']} reconnects, latency avg {stats['avg_latency_ms']} ms / "
+            f"max {stats['max_latency_ms']} ms"
+        )
@@ -4,8 +4,8 @@ Usage: python manage.py test_apriori
 """
 
 from django.core.management.base import BaseCommand
-from main.utils import run_apriori_analysis, get_product_recommendations
-from main.models import Product, Order
+from main.utils import mine_job_rules, get_job_recommendations
+from main.models import Job, JobApplication
 
 
 class Command(BaseCommand):
@@ -16,16 +16,14 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS('Testing Apriori Recommendation System'))
         self.stdout.write(self.style.SUCCESS('=' * 70))
 
-        # Check orders
-        order_count = Order.objects.filter(
-            status__in=['delivered', 'confirmed', 'processing', 'shipped']
-        ).count()
+        # Check applications
+        application_count = JobApplication.objects.count()
 
-        self.stdout.write(f'\nTotal orders for analysis: {order_count}')
+        self.stdout.write(f'\nTotal applications for analysis: {application_count}')
 
-        if order_count == 0:
-            self.stdout.write(self.style.WARNING('\nNo orders found for Apriori analysis!'))
-            self.stdout.write(self.style.WARNING('System will fall back to category-based recommendations.'))
+        if application_count == 0:
+            self.stdout.write(self.style.WARNING('\nNo applications found for Apriori analysis!'))
+            self.stdout.write(self.style.WARNING('Job pages will only show skill/country related jobs.'))
             return
 
         # Run Apriori analysis
@@ -33,57 +31,57 @@ class Command(BaseCommand):
         self.stdout.write('Running Apriori Analysis...')
         self.stdout.write('-' * 70)
 
-        rules = run_apriori_analysis()
+        rules, stored = mine_job_rules()
 
-        if rules is None or rules.empty:
+        if not rules:
             self.stdout.write(self.style.WARNING('\nInsufficient data for Apriori rules.'))
-            self.stdout.write(self.style.WARNING('Need at least 2 orders with multiple items each.'))
-            self.stdout.write(self.style.WARNING('System will use fallback recommendations.'))
+            self.stdout.write(self.style.WARNING('Need at least 2 applicants who applied to several jobs each.'))
+            self.stdout.write(self.style.WARNING('Job pages will only show skill/country related jobs.'))
             return
 
-        self.stdout.write(self.style.SUCCESS(f'\nGenerated {len(rules)} association rules!'))
+        self.stdout.write(self.style.SUCCESS(f'\nGenerated {len(rules)} association rules ({stored} job pairs stored)!'))
 
         # Show top 10 rules
         self.stdout.write('\n' + '-' * 70)
         self.stdout.write('Top 10 Association Rules:')
         self.stdout.write('-' * 70)
 
-        for idx, rule in rules.head(10).iterrows():
-            antecedents_ids = list(rule['antecedents'])
-            consequents_ids = list(rule['consequents'])
+        for idx, rule in enumerate(rules[:10]):
+            antecedents_ids = list(rule.antecedents)
+            consequents_ids = list(rule.consequents)
 
-            # Get product names
-            antecedent_products = Product.objects.filter(id__in=antecedents_ids)
-            consequent_products = Product.objects.filter(id__in=consequents_ids)
+            # Get job titles
+            antecedent_jobs = Job.objects.filter(id__in=antecedents_ids)
+            consequent_jobs = Job.objects.filter(id__in=consequents_ids)
 
-            antecedent_names = [p.name for p in antecedent_products]
-            consequent_names = [p.name for p in consequent_products]
+            antecedent_names = [j.title for j in antecedent_jobs]
+            consequent_names = [j.title for j in consequent_jobs]
 
             self.stdout.write(f'\nRule {idx + 1}:')
-            self.stdout.write(f'  If customer buys: {", ".join(antecedent_names)}')
-            self.stdout.write(f'  Then also buys: {", ".join(consequent_names)}')
-            self.stdout.write(f'  Confidence: {rule["confidence"]:.2%}')
-            self.stdout.write(f'  Support: {rule["support"]:.2%}')
-            self.stdout.write(f'  Lift: {rule["lift"]:.2f}')
+            self.stdout.write(f'  If applicant applies to: {", ".join(antecedent_names)}')
+            self.stdout.write(f'  Then also applies to: {", ".join(consequent_names)}')
+            self.stdout.write(f'  Confidence: {rule.confidence:.2%}')
+            self.stdout.write(f'  Support: {rule.support:.2%}')
+            self.stdout.write(f'  Lift: {rule.lift:.2f}')
 
-        # Test recommendations for active products
+        # Test recommendations for active jobs
         self.stdout.write('\n' + '-' * 70)
-        self.stdout.write('Testing Product Recommendations:')
+        self.stdout.write('Testing Job Recommendations:')
         self.stdout.write('-' * 70)
 
-        test_products = Product.objects.filter(is_active=True)[:5]
+        test_jobs = Job.objects.filter(status='active')[:5]
 
-        for product in test_products:
-            recommendations = get_product_recommendations(product.id, limit=4)
+        for job in test_jobs:
+            recommendations = get_job_recommendations(job.id, limit=4)
 
-            self.stdout.write(f'\n{product.name} ({product.category.name if product.category else "No Category"}):')
+            self.stdout.write(f'\n{job.title} ({job.company_name}):')
 
             if recommendations:
                 self.stdout.write(self.style.SUCCESS(f'  Found {len(recommendations)} Apriori-based recommendations:'))
                 for rec in recommendations:
-                    self.stdout.write(f'    - {rec.name} (₹{rec.price})')
+                    self.stdout.write(f'    - {rec.title} ({rec.company_name}, {rec.get_country_display_name()})')
             else:
-                self.stdout.write(self.style.WARNING('  No Apriori recommendations (will use fallback)'))
+                self.stdout.write(self.style.WARNING('  No Apriori recommendations (related jobs only)'))
 
         self.stdout.write('\n' + '=' * 70)
         self.stdout.write(self.style.SUCCESS('Apriori Test Complete!'))
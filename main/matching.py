@@ -0,0 +1,508 @@
+"""
+Skill-based candidate ↔ job matching.
+
+Candidates describe their skills in free text (UserSkill.name); jobs use
+the admin-managed Skill table.  normalize_skill_name() reduces both to a
+lookup key, and each UserSkill is linked to the Skill it names when it is
+saved (link_user_skill, called from main/signals.py).
+
+With users and jobs as sparse rows over skills, the number of shared
+skills for every (user, job) pair is the sparse product U · Jᵀ.  It is
+computed here from skill → posting lists: counting the postings of a
+row's skills (collections.Counter, so the inner loop runs in C) gives that
+row of the product, and heapq.nlargest keeps the top N (_top_by_shared()
+avoids counting the largest list).  A pair scores the percentage of the
+job's skills the candidate has.
+
+  • rebuild(workers=N) recomputes everything in bulk, farming chunks of
+    rows out to a process pool;
+  • refresh_users(ids) / refresh_jobs(ids) recompute one row or column at
+    a time and patch only the ranked lists that row enters, leaves or
+    moves within.  Signal receivers queue ids in the MatchRefresh table
+    with mark_users_dirty() / mark_jobs_dirty(), and the worker
+    (`python manage.py refresh_job_matches`) refreshes them in batches,
+    so no request pays for it.
+
+The candidate's profile page shows get_recommended_jobs().
+
+`python manage.py benchmark_matching` times the bulk kernel on synthetic
+data (100k users × 10k jobs by default) and the worker's refresh against
+a seeded database.
+"""
+
+import heapq
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from django.db import transaction
+from django.db.models import Count, Q
+from main import related_jobs
+from main.models import Job, JobMatch, MatchRefresh, Skill, User, UserSkill
+
+USER_TOP_N = 10   # recommended jobs kept per candidate
+JOB_TOP_N = 25    # candidates kept per job
+CHUNK_SIZE = 2000
+_IN_BATCH = 500   # ids per IN (...) clause
+REFRESH_BATCH_SIZE = 200  # queued refreshes per worker batch
+
+JobSkill = Job.skills.through
+
+
+# ── skill name normalization ───────────────────────────────────────────────
+
+_NON_WORD = re.compile(r'[^a-z0-9+#]+')
+
+
+def normalize_skill_name(name):
+    """'  MS-Excel ' → 'ms excel';  'C++' stays 'c++'."""
+    return _NON_WORD.sub(' ', (name or '').lower()).strip()[:100]
+
+
+def _lookup_keys(key):
+    # Plural and singular spellings resolve to the same skill
+    if len(key) > 3 and key.endswith('s') and not key.endswith('ss'):
+        return (key, key[:-1])
+    return (key, key + 's')
+
+
+def _skill_index():
+    index = {}
+    for skill_id, name, slug in Skill.objects.values_list('id', 'name', 'slug'):
+        for key in (normalize_skill_name(name), normalize_skill_name(slug)):
+            index.setdefault(key, skill_id)
+    return index
+
+
+def resolve_skill_id(name, index=None):
+    index = _skill_index() if index is None else index
+    for key in _lookup_keys(normalize_skill_name(name)):
+        if key in index:
+            return index[key]
+    return None
+
+
+def link_user_skill(user_skill):
+    """Set normalized_name and skill on an unsaved/changed UserSkill."""
+    user_skill.normalized_name = normalize_skill_name(user_skill.name)
+    user_skill.skill_id = resolve_skill_id(user_skill.name)
+
+
+def relink_user_skills(skills=None):
+    """
+    Re-resolve UserSkills against the current Skill table (after skills are
+    added, renamed or deleted).  With `skills`, only rows linked to them or
+    named so they could resolve to them are checked, not every row.
+    Returns the ids of users whose links changed.
+    """
+    index = _skill_index()
+    user_skills = UserSkill.objects.all()
+    if skills is not None:
+        keys = set()
+        for skill in skills:
+            for key in (normalize_skill_name(skill.name), normalize_skill_name(skill.slug)):
+                # The spellings whose _lookup_keys() include `key`
+                keys.update((key, key + 's', key[:-1]))
+        user_skills = user_skills.filter(
+            Q(normalized_name__in=keys) | Q(skill_id__in=[skill.pk for skill in skills])
+        )
+    changed_users = set()
+    for pk, user_id, name, skill_id in user_skills.values_list('id', 'user_id', 'name', 'skill_id').iterator():
+        resolved = resolve_skill_id(name, index)
+        if resolved != skill_id:
+            UserSkill.objects.filter(pk=pk).update(skill_id=resolved, normalized_name=normalize_skill_name(name))
+            changed_users.add(user_id)
+    return changed_users
+
+
+# ── bulk kernel (pure data, safe to run in worker processes) ──────────────
+
+class Postings:
+    """skill_id → ids of the rows having it, as an ascending list and as a set."""
+
+    def __init__(self, rows):
+        self.lists = {}
+        for row_id in sorted(rows):
+            for skill_id in rows[row_id]:
+                self.lists.setdefault(skill_id, []).append(row_id)
+        self.sets = {skill_id: set(row_ids) for skill_id, row_ids in self.lists.items()}
+
+
+def _top_by_shared(skill_ids, postings, n):
+    """
+    [(shared, row_id)] for the `n` rows sharing most of `skill_ids`, ties
+    going to the higher id.
+
+    The most popular skill's list is usually most of the work and mostly
+    holds rows sharing nothing else, so it is not counted: the other lists
+    are, members of the popular one get +1 through a set intersection, and
+    its remaining members (shared = 1) are only read, newest first, when
+    the top n isn't already full of better rows.
+    """
+    skills = sorted((s for s in skill_ids if s in postings.lists), key=lambda s: len(postings.lists[s]))
+    if not skills:
+        return []
+    *rest, popular = skills
+    shared = Counter()
+    for skill_id in rest:
+        shared.update(postings.lists[skill_id])
+    shared.update(postings.sets[popular].intersection(shared))
+
+    best = heapq.nlargest(n, ((count, row_id) for row_id, count in shared.items() if count > 1))
+    missing = n - len(best)
+    if missing > 0:
+        singles = heapq.nlargest(missing, (row_id for row_id, count in shared.items() if count == 1))
+        for row_id in reversed(postings.lists[popular]):
+            if row_id not in shared:
+                singles.append(row_id)
+                if len(singles) >= 2 * missing:
+                    break
+        best += [(1, row_id) for row_id in heapq.nlargest(missing, singles)]
+    return best
+
+
+def top_jobs_for(skill_ids, job_postings, n=USER_TOP_N):
+    """
+    [(job_id, score, shared)] best first, for a candidate with `skill_ids`.
+    Jobs are grouped by how many skills they require (see build_index());
+    within a group the score only depends on the shared count.
+    """
+    best = []
+    for size, postings in job_postings.items():
+        best.extend((count * 100 // size, count, job_id) for count, job_id in _top_by_shared(skill_ids, postings, n))
+    return [(job_id, score, count) for score, count, job_id in heapq.nlargest(n, best)]
+
+
+def top_users_for(skill_ids, user_postings, n=JOB_TOP_N):
+    """[(user_id, score, shared)] best first, for a job requiring `skill_ids`."""
+    total = len(skill_ids)
+    return [(user_id, count * 100 // total, count) for count, user_id in _top_by_shared(skill_ids, user_postings, n)]
+
+
+def build_index(job_skills, user_skills):
+    """Posting lists for top_jobs_for() / top_users_for()."""
+    jobs_by_size = {}
+    for job_id, skill_ids in job_skills.items():
+        if skill_ids:
+            jobs_by_size.setdefault(len(skill_ids), {})[job_id] = skill_ids
+    return {
+        'job_postings': {size: Postings(rows) for size, rows in jobs_by_size.items()},
+        'user_postings': Postings(user_skills),
+    }
+
+
+_worker_state = {}
+
+
+def _init_worker(job_skills, user_skills):
+    _worker_state.update(build_index(job_skills, user_skills))
+
+
+def _score_user_chunk(chunk):
+    job_postings = _worker_state['job_postings']
+    return [(user_id, top_jobs_for(skill_ids, job_postings)) for user_id, skill_ids in chunk]
+
+
+def _score_job_chunk(chunk):
+    user_postings = _worker_state['user_postings']
+    return [(job_id, top_users_for(skill_ids, user_postings)) for job_id, skill_ids in chunk]
+
+
+def _chunks(items, size):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def score_all(user_skills, job_skills, workers=1):
+    """
+    Top matches for every candidate and every job.  Returns
+    ({user_id: [(job_id, score, shared)]}, {job_id: [(user_id, score, shared)]}).
+    """
+    state = (job_skills, user_skills)
+    user_chunks = _chunks(user_skills.items(), CHUNK_SIZE)
+    job_chunks = _chunks(job_skills.items(), CHUNK_SIZE)
+
+    if workers <= 1:
+        _init_worker(*state)
+        try:
+            user_results = [_score_user_chunk(chunk) for chunk in user_chunks]
+            job_results = [_score_job_chunk(chunk) for chunk in job_chunks]
+        finally:
+            _worker_state.clear()
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=state) as pool:
+            user_results = list(pool.map(_score_user_chunk, user_chunks))
+            job_results = list(pool.map(_score_job_chunk, job_chunks))
+
+    user_tops = {user_id: top for chunk in user_results for user_id, top in chunk}
+    job_tops = {job_id: top for chunk in job_results for job_id, top in chunk}
+    return user_tops, job_tops
+
+
+# ── loading rows from the database ─────────────────────────────────────────
+
+def _candidates():
+    return User.objects.filter(role='user', is_active=True)
+
+
+def _load_job_skills():
+    rows = {}
+    for job_id, skill_id in JobSkill.objects.filter(job__status='active').values_list('job_id', 'skill_id').iterator():
+        rows.setdefault(job_id, set()).add(skill_id)
+    return rows
+
+
+def _load_user_skills():
+    rows = {}
+    linked = UserSkill.objects.filter(skill__isnull=False, user__in=_candidates())
+    for user_id, skill_id in linked.values_list('user_id', 'skill_id').iterator():
+        rows.setdefault(user_id, set()).add(skill_id)
+    return rows
+
+
+def _match_rows(user_tops, job_tops):
+    rows = {}
+    for user_id, top in user_tops.items():
+        for rank, (job_id, score, shared) in enumerate(top):
+            rows[user_id, job_id] = JobMatch(user_id=user_id, job_id=job_id, score=score, shared_skills=shared, user_rank=rank)
+    for job_id, top in job_tops.items():
+        for rank, (user_id, score, shared) in enumerate(top):
+            row = rows.get((user_id, job_id))
+            if row is None:
+                row = rows[user_id, job_id] = JobMatch(user_id=user_id, job_id=job_id, score=score, shared_skills=shared)
+            row.job_rank = rank
+    return rows.values()
+
+
+def rebuild(workers=1):
+    """Recompute every match list.  Returns (candidates, jobs) indexed."""
+    user_skills = _load_user_skills()
+    job_skills = _load_job_skills()
+    user_tops, job_tops = score_all(user_skills, job_skills, workers=workers)
+    with transaction.atomic():
+        JobMatch.objects.all().delete()
+        JobMatch.objects.bulk_create(_match_rows(user_tops, job_tops), batch_size=1000)
+    return len(user_skills), len(job_skills)
+
+
+# ── incremental refresh ────────────────────────────────────────────────────
+
+def _ranked(scores, n):
+    """{other_id: (score, shared)} → [(other_id, score, shared)] best first."""
+    best = heapq.nlargest(n, ((score, shared, other_id) for other_id, (score, shared) in scores.items()))
+    return [(other_id, score, shared) for score, shared, other_id in best]
+
+
+def _job_sizes(job_ids=None):
+    """{active job id: number of skills it requires}, for `job_ids` or every active job."""
+    active = JobSkill.objects.filter(job__status='active')
+    if job_ids is None:
+        batches = [active]
+    else:
+        batches = [active.filter(job_id__in=batch) for batch in _chunks(job_ids, _IN_BATCH)]
+    sizes = {}
+    for rows in batches:
+        sizes.update(rows.values('job_id').annotate(n=Count('skill_id')).order_by().values_list('job_id', 'n'))
+    return sizes
+
+
+def _user_scores(user_id, sizes=None):
+    """
+    {job_id: (score, shared)} for one candidate against every active job.
+    `sizes` (from _job_sizes()) saves re-counting job skills when many
+    candidates are scored in a row.
+    """
+    if not _candidates().filter(pk=user_id).exists():
+        return {}
+    skill_ids = set(
+        UserSkill.objects.filter(user_id=user_id, skill__isnull=False).values_list('skill_id', flat=True)
+    )
+    if not skill_ids:
+        return {}
+    shared = dict(
+        JobSkill.objects.filter(job__status='active', skill_id__in=skill_ids)
+        .values('job_id').annotate(n=Count('skill_id')).order_by()
+        .values_list('job_id', 'n')
+    )
+    if sizes is None:
+        sizes = _job_sizes(shared)
+    return {job_id: (count * 100 // sizes[job_id], count) for job_id, count in shared.items()}
+
+
+def _job_scores(job_id):
+    """{user_id: (score, shared)} for one job against every candidate."""
+    if not Job.objects.filter(pk=job_id, status='active').exists():
+        return {}
+    skill_ids = set(JobSkill.objects.filter(job_id=job_id).values_list('skill_id', flat=True))
+    if not skill_ids:
+        return {}
+    shared = (
+        UserSkill.objects.filter(skill_id__in=skill_ids, user__in=_candidates())
+        .values('user_id').annotate(n=Count('skill_id', distinct=True)).order_by()
+        .values_list('user_id', 'n')
+    )
+    return {user_id: (count * 100 // len(skill_ids), count) for user_id, count in shared}
+
+
+# Which side of JobMatch a refresh is about: (own field, other field, own rank, other rank, own list size, other list size)
+_USER_SIDE = ('user_id', 'job_id', 'user_rank', 'job_rank', USER_TOP_N, JOB_TOP_N)
+_JOB_SIDE = ('job_id', 'user_id', 'job_rank', 'user_rank', JOB_TOP_N, USER_TOP_N)
+
+
+def _store_list(side, owner_id, top):
+    """Make `top` the ranked list on `side` for `owner_id`."""
+    own, other, own_rank, other_rank = side[:4]
+    JobMatch.objects.filter(**{own: owner_id, f'{own_rank}__isnull': False}).update(**{own_rank: None})
+    if top:
+        JobMatch.objects.bulk_create(
+            [
+                JobMatch(**{own: owner_id, other: other_id, 'score': score, 'shared_skills': shared, own_rank: rank})
+                for rank, (other_id, score, shared) in enumerate(top)
+            ],
+            update_conflicts=True,
+            unique_fields=['user', 'job'],
+            update_fields=['score', 'shared_skills', own_rank],
+        )
+    JobMatch.objects.filter(**{own: owner_id, 'user_rank__isnull': True, 'job_rank__isnull': True}).delete()
+
+
+def _scores(side, owner_id, sizes=None):
+    return _user_scores(owner_id, sizes) if side is _USER_SIDE else _job_scores(owner_id)
+
+
+def _recompute(side, owner_id, sizes=None):
+    _store_list(side, owner_id, _ranked(_scores(side, owner_id, sizes), side[4]))
+
+
+@transaction.atomic
+def _refresh(side, owner_id):
+    """
+    Recompute `owner_id`'s own list, then patch the lists on the other side
+    that it enters, leaves or moves within.  Entering or moving up only
+    needs a merge, and so does moving down while still ranking above the
+    rest of a full list (nothing outside it ranks higher than its last
+    entry).  Dropping out of a full list, or below its other entries,
+    leaves a gap, so that list is recomputed in full.
+    """
+    own, other, own_rank, other_rank, _, other_n = side
+    other_side = _JOB_SIDE if side is _USER_SIDE else _USER_SIDE
+    scores = _scores(side, owner_id)
+
+    # Lists on the other side that currently include owner_id, plus lists
+    # owner_id now scores for, as they were before this change.
+    listed = set(
+        JobMatch.objects.filter(**{own: owner_id, f'{other_rank}__isnull': False}).values_list(other, flat=True)
+    )
+    lists = {}
+    for batch in _chunks(listed | set(scores), _IN_BATCH):
+        for other_id, member_id, score, shared in JobMatch.objects.filter(
+            **{f'{other}__in': batch, f'{other_rank}__isnull': False}
+        ).values_list(other, own, 'score', 'shared_skills'):
+            lists.setdefault(other_id, {})[member_id] = (score, shared)
+
+    _store_list(side, owner_id, _ranked(scores, side[4]))
+
+    full = []
+    for other_id in listed | set(scores):
+        entries = lists.get(other_id, {})
+        old, new = entries.get(owner_id), scores.get(other_id)
+        if old == new:
+            continue
+        if old is not None and (new is None or new < old) and len(entries) >= other_n:
+            lowest = min((*entry, member_id) for member_id, entry in entries.items() if member_id != owner_id)
+            if new is None or (*new, owner_id) < lowest:
+                full.append(other_id)
+                continue
+        if new is None:
+            del entries[owner_id]
+        else:
+            entries[owner_id] = new
+        top = _ranked(entries, other_n)
+        if old is not None or any(member_id == owner_id for member_id, _, _ in top):
+            _store_list(other_side, other_id, top)
+
+    # A job's change can leave gaps in many candidates' lists; count every
+    # active job's skills once for all of them
+    sizes = _job_sizes() if other_side is _USER_SIDE and len(full) > 1 else None
+    for other_id in full:
+        _recompute(other_side, other_id, sizes)
+
+
+def refresh_users(user_ids):
+    for user_id in user_ids:
+        _refresh(_USER_SIDE, user_id)
+
+
+def refresh_jobs(job_ids):
+    for job_id in job_ids:
+        _refresh(_JOB_SIDE, job_id)
+
+
+# ── refresh queue ─────────────────────────────────────────────────────────
+
+def _mark(kind, ids):
+    # Queued in the caller's transaction, so a rolled-back change queues nothing
+    rows = [MatchRefresh(kind=kind, object_id=pk) for pk in set(ids) if pk is not None]
+    if rows:
+        MatchRefresh.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+def mark_users_dirty(user_ids):
+    _mark('user', user_ids)
+
+
+def mark_jobs_dirty(job_ids):
+    _mark('job', job_ids)
+
+
+def process_pending(batch_size=REFRESH_BATCH_SIZE):
+    """
+    Refresh one batch of queued candidates, jobs and related-jobs lists
+    (the refresh_job_matches worker).  Returns (users, jobs, related)
+    refreshed.
+    """
+    with transaction.atomic():
+        claimed = list(MatchRefresh.objects.order_by('pk').values_list('pk', 'kind', 'object_id')[:batch_size])
+        # Claimed by deleting: a change while this batch runs queues the id again
+        MatchRefresh.objects.filter(pk__in=[pk for pk, _, _ in claimed]).delete()
+    job_ids = [object_id for _, kind, object_id in claimed if kind == 'job']
+    user_ids = [object_id for _, kind, object_id in claimed if kind == 'user']
+    related_ids = [object_id for _, kind, object_id in claimed if kind == 'rel']
+    try:
+        refresh_jobs(job_ids)
+        refresh_users(user_ids)
+        related_jobs.refresh_jobs(related_ids)
+    except Exception:
+        mark_jobs_dirty(job_ids)
+        mark_users_dirty(user_ids)
+        related_jobs.mark_jobs_dirty(related_ids)
+        raise
+    return len(user_ids), len(job_ids), len(related_ids)
+
+
+# ── reading ────────────────────────────────────────────────────────────────
+
+def get_recommended_jobs(user, limit=USER_TOP_N):
+    """Live jobs best matching the candidate's skills, each with .match_score."""
+    matches = (
+        JobMatch.objects.filter(user=user, user_rank__isnull=False, job__in=Job.objects.live())
+        .select_related('job').order_by('user_rank')[:limit]
+    )
+    jobs = []
+    for match in matches:
+        match.job.match_score = match.score
+        jobs.append(match.job)
+    return jobs
+
+
+def get_top_candidates(job, limit=JOB_TOP_N):
+    """Candidates best matching the job's skills, each with .match_score."""
+    matches = (
+        JobMatch.objects.filter(job=job, job_rank__isnull=False)
+        .select_related('user').order_by('job_rank')[:limit]
+    )
+    users = []
+    for match in matches:
+        match.user.match_score = match.score
+        users.append(match.user)
+    return users
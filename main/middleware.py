@@ -1,40 +1,43 @@
+from functools import partial
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from rest_framework_simplejwt.tokens import AccessToken
-from rest_framework_simplejwt.exceptions import TokenError
-from main.models import User
+from django.contrib import auth
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.utils.functional import SimpleLazyObject
+from main.auth_cache import get_user_for_token
 
 
-class JWTAuthenticationMiddleware:
+def get_request_user(request):
     """
-    Middleware to authenticate users via JWT token stored in cookies.
-    This allows JWT auth to work seamlessly with Django templates.
+    The user for this request, from the cheapest credential it carries:
+    the JWT access cookie (resolved from main/auth_cache.py without a query
+    when warm), else the Django session (admin site, session logins).
     """
+    if not hasattr(request, '_cached_user'):
+        user = None
+        access_token = request.COOKIES.get(settings.SIMPLE_JWT.get('AUTH_COOKIE', 'access_token'))
+        if access_token:
+            user = get_user_for_token(access_token)
+        request._cached_user = user if user is not None else auth.get_user(request)
+    return request._cached_user
 
-    def __init__(self, get_response):
-        self.get_response = get_response
 
-    def __call__(self, request):
-        # Try to get the access token from cookies
-        access_token = request.COOKIES.get(settings.SIMPLE_JWT.get('AUTH_COOKIE', 'access_token'))
+async def aget_request_user(request):
+    return await sync_to_async(get_request_user)(request)
 
-        if access_token:
-            try:
-                # Validate the token
-                token = AccessToken(access_token)
-                user_id = token.get('user_id')
-
-                if user_id:
-                    try:
-                        user = User.objects.get(id=user_id)
-                        request.user = user
-                        request.jwt_authenticated = True
-                    except User.DoesNotExist:
-                        request.jwt_authenticated = False
-            except TokenError:
-                # Token is invalid or expired
-                request.jwt_authenticated = False
-        else:
-            request.jwt_authenticated = False
-
-        response = self.get_response(request)
-        return response
+
+class JWTAuthenticationMiddleware(AuthenticationMiddleware):
+    """
+    Middleware to authenticate users via JWT token stored in cookies.
+    This allows JWT auth to work seamlessly with Django templates.
+
+    Replaces Django's AuthenticationMiddleware rather than running after it,
+    so a request pays for one credential lookup, not a session read plus a
+    JWT user query.  request.user stays lazy: nothing is resolved until a
+    view or template touches it.
+    """
+
+    def process_request(self, request):
+        super().process_request(request)  # session middleware check
+        request.user = SimpleLazyObject(lambda: get_request_user(request))
+        request.auser = partial(aget_request_user, request)
@@ -0,0 +1,44 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS job_search_index USING fts5("
+        "title, company_name, description, city, skills, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+
+    Job = apps.get_model('main', 'Job')
+    for job in Job.objects.prefetch_related('skills').iterator(chunk_size=500):
+        schema_editor.execute(
+            "INSERT INTO job_search_index (rowid, title, company_name, description, city, skills) "
+            "VALUES (%s, %s, %s, %s, %s, %s)",
+            [
+                job.pk,
+                job.title or '',
+                job.company_name or '',
+                job.description or '',
+                job.city or '',
+                ' '.join(skill.name for skill in job.skills.all()),
+            ],
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS job_search_index")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0020_add_hero_photo'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:06
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_counts(apps, schema_editor):
+    JobApplication = apps.get_model('main', 'JobApplication')
+    ApplicationStatusCount = apps.get_model('main', 'ApplicationStatusCount')
+
+    base = JobApplication.objects.order_by()
+    rows = []
+    for row in base.values('status').annotate(n=Count('id')):
+        rows.append(ApplicationStatusCount(scope='all', scope_id=0, status=row['status'], count=row['n']))
+    for row in base.values('job_id', 'status').annotate(n=Count('id')):
+        rows.append(ApplicationStatusCount(scope='job', scope_id=row['job_id'], status=row['status'], count=row['n']))
+    for row in base.filter(user__isnull=False).values('user_id', 'status').annotate(n=Count('id')):
+        rows.append(ApplicationStatusCount(scope='user', scope_id=row['user_id'], status=row['status'], count=row['n']))
+    ApplicationStatusCount.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0021_job_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationStatusCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('all', 'All applications'), ('job', 'Per job'), ('user', 'Per user')], max_length=10)),
+                ('scope_id', models.BigIntegerField(default=0)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('reviewed', 'Under Review'), ('shortlisted', 'Shortlisted'), ('accepted', 'Accepted'), ('rejected', 'Rejected')], max_length=20)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'application_status_counts',
+                'unique_together': {('scope', 'scope_id', 'status')},
+            },
+        ),
+        migrations.RunPython(populate_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0022_application_status_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboundEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sender_key', models.CharField(help_text='Key into settings.EMAIL_SENDERS', max_length=30)),
+                ('from_email', models.CharField(max_length=254)),
+                ('to', models.JSONField(help_text='List of recipient addresses')),
+                ('subject', models.CharField(max_length=300)),
+                ('plain_body', models.TextField()),
+                ('html_body', models.TextField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('dead', 'Dead letter')], default='pending', max_length=10)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, null=True)),
+                ('next_attempt_at', models.BigIntegerField(default=0, help_text='Not retried before this time')),
+                ('created_at', models.BigIntegerField(editable=False)),
+                ('updated_at', models.BigIntegerField(editable=False)),
+                ('sent_at', models.BigIntegerField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'outbound_emails',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='outbound_status_due_idx')],
+            },
+        ),
+    ]
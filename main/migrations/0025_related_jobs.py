@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0024_image_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.IntegerField()),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_entries', to='main.job')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_from', to='main.job')),
+            ],
+            options={
+                'db_table': 'related_jobs',
+                'indexes': [models.Index(fields=['job', 'rank'], name='related_job_rank_idx')],
+                'unique_together': {('job', 'related')},
+            },
+        ),
+    ]
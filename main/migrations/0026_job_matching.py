@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0025_related_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userskill',
+            name='normalized_name',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='userskill',
+            name='skill',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='user_skills', to='main.skill'),
+        ),
+        migrations.CreateModel(
+            name='JobMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.PositiveSmallIntegerField(help_text="Percent of the job's skills the candidate has")),
+                ('shared_skills', models.PositiveSmallIntegerField()),
+                ('user_rank', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('job_rank', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='candidate_matches', to='main.job')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_matches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'job_matches',
+                'indexes': [models.Index(fields=['user', 'user_rank'], name='job_match_user_rank_idx'), models.Index(fields=['job', 'job_rank'], name='job_match_job_rank_idx')],
+                'unique_together': {('user', 'job')},
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0026_job_matching'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobAssociationRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('support', models.FloatField()),
+                ('confidence', models.FloatField()),
+                ('lift', models.FloatField()),
+                ('mined_at', models.BigIntegerField(help_text='Epoch milliseconds of the mining run')),
+                ('antecedent', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='association_rules', to='main.job')),
+                ('consequent', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='association_rules_in', to='main.job')),
+            ],
+            options={
+                'db_table': 'job_association_rules',
+                'indexes': [models.Index(fields=['antecedent', '-confidence', '-lift'], name='job_rule_antecedent_idx'), models.Index(fields=['consequent', '-confidence', '-lift'], name='job_rule_consequent_idx')],
+                'unique_together': {('antecedent', 'consequent')},
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0027_job_association_rules'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkillAssociation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('skill_a', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='main.skill')),
+                ('skill_b', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='main.skill')),
+            ],
+            options={
+                'db_table': 'skill_associations',
+                'unique_together': {('skill_a', 'skill_b')},
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0028_skill_associations'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'deadline'], name='jobs_status_deadline_idx'),
+        ),
+    ]
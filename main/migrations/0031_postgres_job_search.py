@@ -0,0 +1,64 @@
+import logging
+from django.db import DatabaseError, migrations, transaction
+
+logger = logging.getLogger(__name__)
+
+
+def create_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(
+        "CREATE TABLE IF NOT EXISTS job_search_document ("
+        "job_id bigint PRIMARY KEY REFERENCES jobs (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+        "document tsvector NOT NULL, "
+        "body text NOT NULL)"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS job_search_document_document_idx ON job_search_document USING GIN (document)"
+    )
+
+    # Trigram matching is optional: skip it when pg_trgm can't be installed
+    # (not available on the server, or no privilege to create it)
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            schema_editor.execute(
+                "CREATE INDEX IF NOT EXISTS job_search_document_body_trgm_idx "
+                "ON job_search_document USING GIN (body gin_trgm_ops)"
+            )
+    except DatabaseError as exc:
+        logger.warning("pg_trgm unavailable, job search will be full-text only: %s", exc)
+
+    schema_editor.execute(
+        "INSERT INTO job_search_document (job_id, document, body) "
+        "SELECT j.id, "
+        "setweight(to_tsvector('simple', j.title), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(s.names, '')), 'A') || "
+        "setweight(to_tsvector('simple', j.company_name), 'B') || "
+        "setweight(to_tsvector('simple', coalesce(j.city, '')), 'B') || "
+        "setweight(to_tsvector('simple', j.description), 'D'), "
+        "concat_ws(' ', j.title, s.names, j.company_name, j.city) "
+        "FROM jobs j LEFT JOIN ("
+        "  SELECT js.job_id, string_agg(sk.name, ' ') AS names "
+        "  FROM jobs_skills js JOIN skills sk ON sk.id = js.skill_id GROUP BY js.job_id"
+        ") s ON s.job_id = j.id "
+        "ON CONFLICT (job_id) DO NOTHING"
+    )
+
+
+def drop_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS job_search_document")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0030_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0031_postgres_job_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatchRefresh',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('user', 'Candidate'), ('job', 'Job')], max_length=4)),
+                ('object_id', models.PositiveIntegerField()),
+            ],
+            options={
+                'db_table': 'match_refreshes',
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+    ]
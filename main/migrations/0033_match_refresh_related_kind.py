@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0032_match_refresh_queue'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='matchrefresh',
+            name='kind',
+            field=models.CharField(choices=[('user', 'Candidate'), ('job', 'Job'), ('rel', 'Related jobs')], max_length=4),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0033_match_refresh_related_kind'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='matchrefresh',
+            name='object_id',
+            field=models.PositiveBigIntegerField(),
+        ),
+    ]
@@ -8,5 +8,12 @@ from .user_skill_model import UserSkill
 from .team_model import TeamMember
 from .contact_model import ContactMessage
 from .hero_photo_model import HeroPhoto
+from .application_status_count_model import ApplicationStatusCount
+from .outbound_email_model import OutboundEmail
+from .related_job_model import RelatedJob
+from .job_match_model import JobMatch
+from .match_refresh_model import MatchRefresh
+from .job_association_rule_model import JobAssociationRule
+from .skill_association_model import SkillAssociation
 
-__all__ = ['User', 'Company', 'Skill', 'Job', 'COUNTRIES_BY_LETTER', 'COUNTRY_CHOICES', 'JobApplication', 'APPLICATION_STATUS_CHOICES', 'UserDocument', 'UserSkill', 'TeamMember', 'ContactMessage', 'HeroPhoto']
+__all__ = ['User', 'Company', 'Skill', 'Job', 'COUNTRIES_BY_LETTER', 'COUNTRY_CHOICES', 'JobApplication', 'APPLICATION_STATUS_CHOICES', 'UserDocument', 'UserSkill', 'TeamMember', 'ContactMessage', 'HeroPhoto', 'ApplicationStatusCount', 'OutboundEmail', 'RelatedJob', 'JobMatch', 'MatchRefresh', 'JobAssociationRule', 'SkillAssociation']
@@ -79,10 +79,31 @@ class JobApplication(models.Model):
     class Meta:
         db_table = 'job_applications'
         ordering = ['-created_at']
+        indexes = [
+            # Admin applications list (unfiltered, and by status), dashboard
+            models.Index(fields=['created_at'], name='job_app_created_idx'),
+            models.Index(fields=['status', 'created_at'], name='job_app_status_idx'),
+            # A user's latest application to a job (job detail / apply form)
+            models.Index(fields=['job', 'user', 'created_at'], name='job_app_job_user_idx'),
+            # "My applications", optionally by status
+            models.Index(fields=['user', 'status', 'created_at'], name='job_app_user_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.full_name} - {self.job.title}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what this row is counted as in ApplicationStatusCount
+        if {'status', 'job_id', 'user_id'}.issubset(field_names):
+            instance._counted_as = instance.count_key()
+        return instance
+
+    def count_key(self):
+        """(status, job_id, user_id) – the counters this application contributes to."""
+        return (self.status, self.job_id, self.user_id)
+
     def save(self, *args, **kwargs):
         # Set created_at on first save (epoch milliseconds)
         if not self.created_at:
@@ -0,0 +1,30 @@
+from django.db import models
+from .application_model import APPLICATION_STATUS_CHOICES
+
+
+class ApplicationStatusCount(models.Model):
+    """
+    Denormalized number of job applications per status.
+    One row per (scope, scope_id, status): scope 'all' (scope_id 0), 'job'
+    (scope_id = job id) or 'user' (scope_id = user id).  Kept up to date by
+    the JobApplication receivers in main/signals.py; rebuild with
+    `python manage.py rebuild_application_counts`.
+    """
+
+    SCOPE_CHOICES = [
+        ('all', 'All applications'),
+        ('job', 'Per job'),
+        ('user', 'Per user'),
+    ]
+
+    scope = models.CharField(max_length=10, choices=SCOPE_CHOICES)
+    scope_id = models.BigIntegerField(default=0)
+    status = models.CharField(max_length=20, choices=APPLICATION_STATUS_CHOICES)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'application_status_counts'
+        unique_together = ('scope', 'scope_id', 'status')
+
+    def __str__(self):
+        return f"{self.scope}:{self.scope_id} {self.status} = {self.count}"
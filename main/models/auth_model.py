@@ -63,6 +63,12 @@ class User(AbstractUser):
         null=True,
         help_text='User profile picture'
     )
+    profile_picture_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text='Resized copies of the profile picture (see main/images.py)'
+    )
     profile_picture_url = models.URLField(
         blank=True,
         null=True,
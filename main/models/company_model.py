@@ -26,6 +26,7 @@ class Company(models.Model):
     # Basic Information
     company_name = models.CharField(max_length=255, help_text='Official company name')
     logo = models.ImageField(upload_to='company/', blank=True, null=True, help_text='Company logo')
+    logo_variants = models.JSONField(default=dict, blank=True, editable=False, help_text='Resized copies of the logo (see main/images.py)')
     tagline = models.CharField(max_length=255, blank=True, null=True, help_text='Short slogan or motto')
     hero_slogan = models.CharField(max_length=300, blank=True, null=True, help_text='Hero section heading (e.g. "Find the right talent, without the hassle.")')
     hero_description = models.TextField(blank=True, null=True, help_text='Hero section subtext paragraph')
@@ -23,6 +23,11 @@ class ContactMessage(models.Model):
 
     class Meta:
         ordering = ['-submitted_at']
+        indexes = [
+            models.Index(fields=['submitted_at'], name='contact_submitted_idx'),
+            models.Index(fields=['is_read', 'submitted_at'], name='contact_read_submitted_idx'),
+            models.Index(fields=['replied_at'], name='contact_replied_idx'),
+        ]
         verbose_name = 'Contact Message'
         verbose_name_plural = 'Contact Messages'
 
@@ -21,6 +21,8 @@ class HeroPhoto(models.Model):
         upload_to=upload_hero_photo,
         help_text="Photo for the hero gallery (recommended: 800x600px or similar landscape)"
     )
+    # Resized WebP/JPEG copies of `image` (see main/images.py)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     caption = models.CharField(
         max_length=200,
         blank=True,
@@ -0,0 +1,29 @@
+from django.db import models
+
+
+class JobAssociationRule(models.Model):
+    """
+    "Applicants of `antecedent` also applied to `consequent`", mined offline
+    from job applications by main/utils/apriori_recommendations.py
+    (`python manage.py mine_job_rules`).  Each mined rule is stored as one
+    row per (antecedent job, consequent job) pair, keeping the strongest
+    rule for the pair.
+    """
+
+    antecedent = models.ForeignKey('Job', on_delete=models.CASCADE, related_name='association_rules')
+    consequent = models.ForeignKey('Job', on_delete=models.CASCADE, related_name='association_rules_in')
+    support = models.FloatField()
+    confidence = models.FloatField()
+    lift = models.FloatField()
+    mined_at = models.BigIntegerField(help_text='Epoch milliseconds of the mining run')
+
+    class Meta:
+        db_table = 'job_association_rules'
+        unique_together = ('antecedent', 'consequent')
+        indexes = [
+            models.Index(fields=['antecedent', '-confidence', '-lift'], name='job_rule_antecedent_idx'),
+            models.Index(fields=['consequent', '-confidence', '-lift'], name='job_rule_consequent_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.antecedent_id} → {self.consequent_id} ({self.confidence:.0%})"
@@ -0,0 +1,33 @@
+from django.db import models
+from django.conf import settings
+
+
+class JobMatch(models.Model):
+    """
+    Skill-based match between a candidate and an active job, maintained by
+    main/matching.py.  A row is kept while the pair is in the candidate's
+    top recommended jobs (user_rank) and/or the job's top candidates
+    (job_rank); the other rank is None.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='job_matches',
+    )
+    job = models.ForeignKey('Job', on_delete=models.CASCADE, related_name='candidate_matches')
+    score = models.PositiveSmallIntegerField(help_text="Percent of the job's skills the candidate has")
+    shared_skills = models.PositiveSmallIntegerField()
+    user_rank = models.PositiveSmallIntegerField(null=True, blank=True)
+    job_rank = models.PositiveSmallIntegerField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'job_matches'
+        unique_together = ('user', 'job')
+        indexes = [
+            models.Index(fields=['user', 'user_rank'], name='job_match_user_rank_idx'),
+            models.Index(fields=['job', 'job_rank'], name='job_match_job_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} ↔ {self.job_id} ({self.score}%)"
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.utils.text import slugify
 from django.conf import settings
 import time
@@ -156,6 +157,18 @@ STATUS_CHOICES = [
 ]
 
 
+class JobQuerySet(models.QuerySet):
+    """Deadline-aware status filters, served by the (status, deadline) index."""
+
+    def live(self):
+        """Active jobs still taking applications (deadline today or later)."""
+        return self.filter(status='active', deadline__gte=timezone.now().date())
+
+    def expired(self):
+        """Jobs still marked active whose deadline has passed."""
+        return self.filter(status='active', deadline__lt=timezone.now().date())
+
+
 class Job(models.Model):
     """Model for job postings."""
 
@@ -211,9 +224,18 @@ class Job(models.Model):
         related_name='posted_jobs'
     )
 
+    objects = JobQuerySet.as_manager()
+
     class Meta:
         db_table = 'jobs'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'deadline'], name='jobs_status_deadline_idx'),
+            # Public list / home carousel: live jobs, urgent first, newest first
+            models.Index(fields=['status', 'is_urgent', 'created_at'], name='jobs_status_urgent_idx'),
+            # Admin jobs list filtered by status
+            models.Index(fields=['status', 'created_at'], name='jobs_status_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.get_country_display()}"
@@ -241,7 +263,6 @@ class Job(models.Model):
     @property
     def is_expired(self):
         """Check if the job deadline has passed."""
-        from django.utils import timezone
         return self.deadline < timezone.now().date()
 
     def get_auto_status(self):
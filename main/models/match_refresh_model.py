@@ -0,0 +1,27 @@
+from django.db import models
+
+
+MATCH_REFRESH_KIND_CHOICES = [
+    ('user', 'Candidate'),
+    ('job', 'Job'),
+    ('rel', 'Related jobs'),
+]
+
+
+class MatchRefresh(models.Model):
+    """
+    A candidate or job whose JobMatch lists are out of date, or ('rel') a
+    job whose RelatedJob list is.  Signal receivers queue rows in the same
+    transaction as the change; `python manage.py refresh_job_matches`
+    works through them (see main/matching.py and main/related_jobs.py).
+    """
+
+    kind = models.CharField(max_length=4, choices=MATCH_REFRESH_KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+
+    class Meta:
+        db_table = 'match_refreshes'
+        unique_together = ('kind', 'object_id')
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}"
@@ -0,0 +1,57 @@
+"""
+Outbox for transactional email.  Views queue messages here and return
+immediately; `python manage.py send_queued_emails` delivers them in the
+background (see main/outbox.py).
+"""
+
+from django.db import models
+import time
+
+
+OUTBOUND_EMAIL_STATUS_CHOICES = [
+    ('pending', 'Pending'),
+    ('sending', 'Sending'),
+    ('sent', 'Sent'),
+    ('dead', 'Dead letter'),
+]
+
+
+class OutboundEmail(models.Model):
+    """One queued email message."""
+
+    sender_key = models.CharField(max_length=30, help_text="Key into settings.EMAIL_SENDERS")
+    from_email = models.CharField(max_length=254)
+    to = models.JSONField(help_text="List of recipient addresses")
+    subject = models.CharField(max_length=300)
+    plain_body = models.TextField()
+    html_body = models.TextField(blank=True, null=True)
+
+    # Delivery state
+    status = models.CharField(max_length=10, choices=OUTBOUND_EMAIL_STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, null=True)
+
+    # Timestamps (epoch milliseconds)
+    next_attempt_at = models.BigIntegerField(default=0, help_text="Not retried before this time")
+    created_at = models.BigIntegerField(editable=False)
+    updated_at = models.BigIntegerField(editable=False)
+    sent_at = models.BigIntegerField(blank=True, null=True)
+
+    class Meta:
+        db_table = 'outbound_emails'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='outbound_status_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} → {', '.join(self.to)} ({self.status})"
+
+    def save(self, *args, **kwargs):
+        now = int(time.time() * 1000)
+        if not self.created_at:
+            self.created_at = now
+        if not self.next_attempt_at:
+            self.next_attempt_at = now
+        self.updated_at = now
+        super().save(*args, **kwargs)
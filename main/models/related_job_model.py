@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class RelatedJob(models.Model):
+    """
+    Precomputed "related jobs" for the job detail page: the top-K active
+    jobs sharing a skill with each job, scored by shared skills and country.  Maintained
+    incrementally by main/related_jobs.py (queued from main/signals.py and
+    refreshed by the refresh_job_matches worker); rebuild with
+    `python manage.py rebuild_related_jobs`.
+    """
+
+    job = models.ForeignKey('Job', on_delete=models.CASCADE, related_name='related_entries')
+    related = models.ForeignKey('Job', on_delete=models.CASCADE, related_name='related_from')
+    score = models.IntegerField()
+    rank = models.PositiveSmallIntegerField()
+
+    class Meta:
+        db_table = 'related_jobs'
+        unique_together = ('job', 'related')
+        indexes = [
+            models.Index(fields=['job', 'rank'], name='related_job_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id} → {self.related_id} ({self.score})"
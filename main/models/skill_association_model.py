@@ -0,0 +1,22 @@
+from django.db import models
+
+
+class SkillAssociation(models.Model):
+    """
+    How often two skills are picked together, counted over job applications
+    (JobApplication.skills) and job postings (Job.skills).  Each unordered
+    pair is stored once with skill_a_id < skill_b_id; the row with
+    skill_a == skill_b holds the number of baskets containing that skill.
+    Maintained incrementally by main/skill_suggestions.py.
+    """
+
+    skill_a = models.ForeignKey('Skill', on_delete=models.CASCADE, related_name='+')
+    skill_b = models.ForeignKey('Skill', on_delete=models.CASCADE, related_name='+')
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'skill_associations'
+        unique_together = ('skill_a', 'skill_b')
+
+    def __str__(self):
+        return f"{self.skill_a_id} + {self.skill_b_id}: {self.count}"
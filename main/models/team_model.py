@@ -25,6 +25,8 @@ class TeamMember(models.Model):
         upload_to=upload_team_photo,
         help_text="Team member photo (recommended: square image, min 400x400px)"
     )
+    # Resized WebP/JPEG copies of `photo` (see main/images.py)
+    photo_variants = models.JSONField(default=dict, blank=True, editable=False)
 
     # Social media links (optional)
     facebook_url = models.URLField(max_length=200, blank=True, null=True)
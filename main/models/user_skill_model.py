@@ -11,6 +11,16 @@ class UserSkill(models.Model):
         related_name='user_skills',
     )
     name = models.CharField(max_length=100)
+    # Filled in by main/matching.py: the name reduced to a lookup key, and the
+    # admin-managed Skill it resolves to (None when there is no such skill).
+    normalized_name = models.CharField(max_length=100, blank=True, default='', db_index=True)
+    skill = models.ForeignKey(
+        'Skill',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='user_skills',
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -0,0 +1,143 @@
+"""
+Persistent email outbox.
+
+enqueue() stores a message in the OutboundEmail table and returns at once,
+so request latency never depends on the SMTP relay.  The worker
+(`python manage.py send_queued_emails`) calls process_batch() in a loop:
+
+    pending ──claim──▶ sending ──ok──▶ sent
+                          │
+                          └─fail─▶ pending (retry after exponential backoff)
+                                   dead    (after EMAIL_OUTBOX['MAX_ATTEMPTS'])
+
+Several workers can run side by side: a row is only delivered by the worker
+whose conditional UPDATE moved it from pending to sending.
+"""
+
+import logging
+import random
+import time
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.db.models import F
+from main import mailer
+from main.models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'MAX_ATTEMPTS': 6,
+    'BACKOFF_BASE_SECONDS': 30,
+    'BACKOFF_MAX_SECONDS': 60 * 60,
+    'BATCH_SIZE': 50,
+    'STALE_AFTER_SECONDS': 10 * 60,   # 'sending' rows older than this were orphaned by a crash
+}
+
+
+def _setting(name):
+    return getattr(settings, 'EMAIL_OUTBOX', {}).get(name, DEFAULTS[name])
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+def backoff_seconds(attempts):
+    """Delay before retry number `attempts` (1-based): base·2^(n-1), capped, ±10% jitter."""
+    delay = min(_setting('BACKOFF_BASE_SECONDS') * (2 ** (attempts - 1)), _setting('BACKOFF_MAX_SECONDS'))
+    return delay * random.uniform(0.9, 1.1)
+
+
+def enqueue(sender_key, to, subject, plain_body, html_body=None):
+    """Queue one message for background delivery."""
+    return OutboundEmail.objects.create(
+        sender_key=sender_key,
+        from_email=settings.EMAIL_SENDERS[sender_key],
+        to=[to] if isinstance(to, str) else list(to),
+        subject=subject,
+        plain_body=plain_body,
+        html_body=html_body or None,
+    )
+
+
+def build_message(email, connection=None):
+    """Turn an OutboundEmail row into a Django email message."""
+    msg = EmailMultiAlternatives(
+        subject=email.subject,
+        body=email.plain_body,
+        from_email=email.from_email,
+        to=email.to,
+        headers={'X-Mailer': 'Talent Solutions'},
+        connection=connection,
+    )
+    if email.html_body:
+        msg.attach_alternative(email.html_body, 'text/html')
+    return msg
+
+
+def requeue_stale():
+    """Put back rows left in 'sending' by a worker that died mid-batch."""
+    cutoff = _now_ms() - _setting('STALE_AFTER_SECONDS') * 1000
+    return OutboundEmail.objects.filter(status='sending', updated_at__lt=cutoff).update(
+        status='pending', updated_at=_now_ms()
+    )
+
+
+def claim_batch(limit=None):
+    """Claim up to `limit` due messages for this worker."""
+    limit = limit or _setting('BATCH_SIZE')
+    now = _now_ms()
+    candidate_ids = list(
+        OutboundEmail.objects.filter(status='pending', next_attempt_at__lte=now)
+        .order_by('next_attempt_at')
+        .values_list('id', flat=True)[:limit]
+    )
+    claimed = []
+    for email_id in candidate_ids:
+        if OutboundEmail.objects.filter(pk=email_id, status='pending').update(status='sending', updated_at=now):
+            claimed.append(email_id)
+    return list(OutboundEmail.objects.filter(pk__in=claimed).order_by('next_attempt_at'))
+
+
+def mark_sent(email):
+    now = _now_ms()
+    OutboundEmail.objects.filter(pk=email.pk).update(
+        status='sent', attempts=F('attempts') + 1, sent_at=now, updated_at=now, last_error=None
+    )
+
+
+def mark_failed(email, exc):
+    attempts = email.attempts + 1
+    now = _now_ms()
+    if attempts >= _setting('MAX_ATTEMPTS'):
+        status, next_attempt_at = 'dead', email.next_attempt_at
+        logger.error("Email dead-lettered after %s attempts (id=%s, to=%s): %s", attempts, email.pk, email.to, exc)
+    else:
+        status, next_attempt_at = 'pending', now + int(backoff_seconds(attempts) * 1000)
+        logger.warning("Email send failed, will retry (id=%s, attempt=%s): %s", email.pk, attempts, exc)
+    OutboundEmail.objects.filter(pk=email.pk).update(
+        status=status, attempts=attempts, next_attempt_at=next_attempt_at,
+        last_error=str(exc)[:2000], updated_at=now,
+    )
+
+
+def deliver(emails):
+    """
+    Send claimed rows through one pooled SMTP session (main/mailer.py) and
+    record each outcome.  Returns (sent, failed).
+    """
+    sent = failed = 0
+    results = mailer.send_messages([build_message(email) for email in emails])
+    for email, error in zip(emails, results):
+        if error is None:
+            mark_sent(email)
+            sent += 1
+        else:
+            mark_failed(email, error)
+            failed += 1
+    return sent, failed
+
+
+def process_batch(limit=None):
+    """Deliver one batch of due messages.  Returns (sent, failed)."""
+    return deliver(claim_batch(limit))
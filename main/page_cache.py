@@ -0,0 +1,95 @@
+"""
+Tagged full-page cache for anonymous visitors.
+
+    @cache_page_for_anonymous('home', tags=('job', 'team', 'hero', 'company'))
+    def home(request): ...
+
+A page is served from / stored in the cache only for anonymous GET/HEAD
+requests: no JWT, session or messages cookie, so the HTML can't contain
+anything user-specific.  Each entry's key embeds the current version of
+every tag it depends on (main/cache_versions.py); purge_tags('job') bumps
+the job version, which orphans exactly the pages that listed 'job' and
+nothing else.  The receivers in main/signals.py purge on model save/delete.
+
+The CSRF token in cached HTML is swapped for a sentinel before storing and
+replaced with a fresh token for each request that is served the copy.
+"""
+
+import hashlib
+import re
+from functools import wraps
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from main.cache_versions import bump_version, get_versions
+
+PAGE_CACHE_TIMEOUT = 10 * 60  # seconds
+
+CSRF_SENTINEL = b'__page_cache_csrf_token__'
+
+# {% csrf_token %} inputs and the <meta name="csrfmiddlewaretoken"> tag in user/base.html
+_CSRF_TOKEN_RE = re.compile(rb'(name="csrfmiddlewaretoken"\s+(?:value|content)=")[A-Za-z0-9]{32,64}(")')
+
+
+def _tag_namespace(tag):
+    return f'page_tag:{tag}'
+
+
+def _is_anonymous(request):
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    cookies = request.COOKIES
+    return not any(
+        name in cookies
+        for name in (
+            settings.SIMPLE_JWT.get('AUTH_COOKIE', 'access_token'),
+            settings.SIMPLE_JWT.get('AUTH_COOKIE_REFRESH', 'refresh_token'),
+            settings.SESSION_COOKIE_NAME,
+            'messages',
+        )
+    )
+
+
+def _cache_key(name, request, tags):
+    versions = get_versions([_tag_namespace(tag) for tag in tags])
+    fingerprint = '|'.join(
+        [request.get_host(), request.get_full_path()]
+        + [f'{tag}={versions[_tag_namespace(tag)]}' for tag in tags]
+    )
+    return f'page:{name}:' + hashlib.md5(fingerprint.encode()).hexdigest()
+
+
+def cache_page_for_anonymous(name, tags, timeout=PAGE_CACHE_TIMEOUT):
+    tags = tuple(tags)
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if not _is_anonymous(request):
+                return view_func(request, *args, **kwargs)
+
+            key = _cache_key(name, request, tags)
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                if CSRF_SENTINEL in content:
+                    content = content.replace(CSRF_SENTINEL, get_token(request).encode())
+                response = HttpResponse(content, content_type=content_type)
+                response['X-Page-Cache'] = 'hit'
+                return response
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming and not response.cookies.get('messages'):
+                content = _CSRF_TOKEN_RE.sub(rb'\1' + CSRF_SENTINEL + rb'\2', response.content)
+                cache.set(key, (content, response['Content-Type']), timeout)
+                response['X-Page-Cache'] = 'miss'
+            return response
+        return wrapper
+    return decorator
+
+
+def purge_tags(*tags):
+    """Invalidate every cached page that depends on any of `tags`."""
+    for tag in tags:
+        bump_version(_tag_namespace(tag))
@@ -0,0 +1,178 @@
+"""
+Keyset (cursor) pagination.
+
+Django's Paginator runs a COUNT(*) and an OFFSET scan on every page, so page
+N costs N pages of work.  CursorPaginator instead remembers the sort key of
+the last (or first) row it returned and asks the database for the rows
+strictly after (or before) it, which an index on the sort key answers
+directly.  Cursors are opaque URL-safe tokens.
+
+Usage:
+    paginator = CursorPaginator(queryset, 15, ordering=('-created_at', '-id'))
+    page = paginator.page(request.GET.get('cursor'))
+    page.next_cursor / page.previous_cursor   → tokens for ?cursor=...
+
+The ordering must end in a unique field (normally id) so every row has a
+distinct position.
+"""
+
+import base64
+import hashlib
+import json
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Q
+from main.cache_versions import bump_version, get_version
+
+APPROXIMATE_COUNT_TIMEOUT = 5 * 60  # seconds
+# Bumped from the Job / JobApplication receivers in main/signals.py
+COUNT_NAMESPACE = 'approx_count'
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _encode_cursor(values, direction):
+    payload = json.dumps({'v': values, 'd': direction}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def _decode_cursor(token):
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values, direction = payload['v'], payload['d']
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor(token)
+    if direction not in ('next', 'prev') or not isinstance(values, list):
+        raise InvalidCursor(token)
+    return values, direction
+
+
+class CursorPage:
+    """One page of results; iterable like a Paginator page."""
+
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __bool__(self):
+        return bool(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    @property
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+
+class CursorPaginator:
+    def __init__(self, queryset, per_page, ordering=('-created_at', '-id')):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+        self.fields = [(name.lstrip('-'), name.startswith('-')) for name in self.ordering]
+
+    def _position(self, obj):
+        return [getattr(obj, field) for field, _ in self.fields]
+
+    def _seek(self, values, forward):
+        """
+        Q matching rows after (forward) or before the given position,
+        honouring each field's sort direction:
+            (a > x) OR (a = x AND b > y) OR (a = x AND b = y AND c > z) ...
+        """
+        condition = Q()
+        for i, (field, descending) in enumerate(self.fields):
+            lookup = 'lt' if descending == forward else 'gt'
+            term = Q(**{f'{field}__{lookup}': values[i]})
+            for j in range(i):
+                term &= Q(**{self.fields[j][0]: values[j]})
+            condition |= term
+        return condition
+
+    def page(self, cursor=None):
+        """
+        Return the page after/before `cursor` (the first page when cursor is
+        empty or malformed).
+        """
+        values, direction = None, 'next'
+        if cursor:
+            try:
+                values, direction = _decode_cursor(cursor)
+            except InvalidCursor:
+                values, direction = None, 'next'
+            if values is not None and len(values) != len(self.fields):
+                values, direction = None, 'next'
+
+        forward = direction == 'next'
+        queryset = self.queryset
+        if values is not None:
+            queryset = queryset.filter(self._seek(values, forward))
+
+        if forward:
+            queryset = queryset.order_by(*self.ordering)
+        else:
+            queryset = queryset.order_by(*[
+                name[1:] if name.startswith('-') else f'-{name}' for name in self.ordering
+            ])
+
+        rows = list(queryset[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if not forward:
+            rows.reverse()
+
+        if not rows:
+            return CursorPage([], None, None)
+
+        if forward:
+            has_next, has_previous = has_more, values is not None
+        else:
+            has_next, has_previous = True, has_more
+
+        next_cursor = _encode_cursor(self._position(rows[-1]), 'next') if has_next else None
+        previous_cursor = _encode_cursor(self._position(rows[0]), 'prev') if has_previous else None
+        return CursorPage(rows, next_cursor, previous_cursor)
+
+
+def approximate_count(queryset, timeout=APPROXIMATE_COUNT_TIMEOUT):
+    """
+    COUNT(*) for `queryset`, cached for a few minutes per distinct query.
+    Good enough for "about N results" labels without counting on every page;
+    invalidate_counts() drops every cached total when jobs or applications
+    change.
+    """
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    digest = hashlib.md5(f'{sql}|{params}'.encode()).hexdigest()
+    key = f'{COUNT_NAMESPACE}:v{get_version(COUNT_NAMESPACE)}:{digest}'
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout)
+    return count
+
+
+def invalidate_counts():
+    """Every approximate_count() total is recounted on its next use."""
+    bump_version(COUNT_NAMESPACE)
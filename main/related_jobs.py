@@ -0,0 +1,143 @@
+"""
+Related-jobs index.
+
+For every active job the RelatedJob table holds its TOP_K most related
+active jobs.  Only jobs sharing at least one skill are related: they
+score SKILL_WEIGHT per shared skill plus COUNTRY_WEIGHT when they are in
+the same country; ties go to the newer job.  The score is symmetric,
+which keeps updates local: when job X changes, refresh_job(X) recomputes
+X's own list, then touches only the jobs whose list X enters, leaves or
+moves within — jobs sharing a skill with X, not every job in its country.
+Signal receivers only queue changed jobs (mark_jobs_dirty(), a 'rel' row
+in the MatchRefresh table); the refresh_job_matches worker refreshes
+them, so saving a job never waits for the index.
+
+The detail page reads a job's list with one query on (job_id, rank), and
+tops a short list up with the newest live jobs in the same country.
+"""
+
+from django.db import transaction
+from django.db.models import Count
+from main.models import Job, MatchRefresh, RelatedJob
+
+TOP_K = 6
+SKILL_WEIGHT = 2
+COUNTRY_WEIGHT = 1
+
+JobSkill = Job.skills.through
+
+
+def _scores_for(job):
+    """{other active job id: score} for every job sharing a skill with `job`."""
+    skill_ids = list(JobSkill.objects.filter(job_id=job.pk).values_list('skill_id', flat=True))
+    if not skill_ids:
+        return {}
+    shared = (
+        JobSkill.objects.filter(skill_id__in=skill_ids, job__status='active')
+        .exclude(job_id=job.pk)
+        .values('job_id', 'job__country')
+        .annotate(n=Count('skill_id'))
+        .order_by()
+        .values_list('job_id', 'job__country', 'n')
+    )
+    return {
+        job_id: n * SKILL_WEIGHT + (COUNTRY_WEIGHT if country == job.country else 0)
+        for job_id, country, n in shared
+    }
+
+
+def _top(scores):
+    return sorted(scores.items(), key=lambda item: (-item[1], -item[0]))[:TOP_K]
+
+
+def _store(job_id, top):
+    RelatedJob.objects.filter(job_id=job_id).delete()
+    RelatedJob.objects.bulk_create([
+        RelatedJob(job_id=job_id, related_id=related_id, score=score, rank=rank)
+        for rank, (related_id, score) in enumerate(top)
+    ])
+
+
+def recompute(job):
+    """Rebuild one job's list from scratch; returns the full score map."""
+    if job.status != 'active':
+        RelatedJob.objects.filter(job_id=job.pk).delete()
+        return {}
+    scores = _scores_for(job)
+    _store(job.pk, _top(scores))
+    return scores
+
+
+@transaction.atomic
+def refresh_job(job):
+    """Bring the index up to date after `job` (or its skills) changed."""
+    scores = recompute(job)
+    active = job.status == 'active'
+
+    lists = {}
+    for job_id, related_id, score in RelatedJob.objects.filter(
+        job_id__in=RelatedJob.objects.filter(related_id=job.pk).values('job_id')
+    ).values_list('job_id', 'related_id', 'score'):
+        lists.setdefault(job_id, {})[related_id] = score
+    if active and scores:
+        for job_id, related_id, score in RelatedJob.objects.filter(
+            job_id__in=[job_id for job_id in scores if job_id not in lists]
+        ).values_list('job_id', 'related_id', 'score'):
+            lists.setdefault(job_id, {})[related_id] = score
+
+    full = []
+    for job_id in set(lists) | (set(scores) if active else set()):
+        entries = lists.get(job_id, {})
+        old_score = entries.get(job.pk)
+        new_score = scores.get(job_id) if active else None
+        if old_score == new_score:
+            continue
+        if old_score is not None and (new_score is None or new_score < old_score):
+            # Dropped or demoted: whatever should take its place is unknown.
+            full.append(job_id)
+            continue
+        # Entered or promoted: the other entries are unaffected.
+        entries[job.pk] = new_score
+        top = _top(entries)
+        if job.pk in dict(top) or old_score is not None:
+            _store(job_id, top)
+
+    for other in Job.objects.filter(pk__in=full):
+        recompute(other)
+
+
+def refresh_jobs(job_ids):
+    for job in Job.objects.filter(pk__in=job_ids):
+        refresh_job(job)
+
+
+def mark_jobs_dirty(job_ids):
+    """Queue jobs for the worker, in the caller's transaction."""
+    rows = [MatchRefresh(kind='rel', object_id=pk) for pk in set(job_ids) if pk is not None]
+    if rows:
+        MatchRefresh.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+def rebuild():
+    """Recompute every list; returns the number of jobs indexed."""
+    RelatedJob.objects.all().delete()
+    count = 0
+    for job in Job.objects.filter(status='active').iterator(chunk_size=500):
+        recompute(job)
+        count += 1
+    return count
+
+
+def get_related_jobs(job, limit=3):
+    related = list(
+        Job.objects.live().filter(related_from__job=job)
+        .order_by('related_from__rank')[:limit]
+    )
+    if len(related) < limit:
+        # Jobs sharing no skill aren't indexed; fill up from the same country
+        related += (
+            Job.objects.live().filter(country=job.country)
+            .exclude(pk__in=[job.pk, *(other.pk for other in related)])
+            .order_by('-pk')[:limit - len(related)]
+        )
+    return related
@@ -0,0 +1,269 @@
+"""
+Full-text search for the public job board.
+
+The index covers job title, company, description, city and skill names and
+is kept in sync by the receivers in main/signals.py.  The backend is
+pluggable through settings.JOB_SEARCH_BACKEND; every backend exposes the
+same small API:
+
+    backend.index_job(job)            – (re)index a single job
+    backend.remove_job(job_id)        – drop a job from the index
+    backend.rebuild()                 – reindex every job
+    backend.filter_queryset(qs, q)    – restrict qs to matches, annotated
+                                        with `search_rank` (lower = better)
+"""
+
+import logging
+import re
+from django.conf import settings
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKEND = 'main.search.SQLiteFTS5Backend'
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def _job_document(job):
+    """Collect the searchable text for one job."""
+    return {
+        'title': job.title or '',
+        'company_name': job.company_name or '',
+        'description': job.description or '',
+        'city': job.city or '',
+        'skills': ' '.join(job.skills.values_list('name', flat=True)),
+    }
+
+
+class IcontainsBackend:
+    """Fallback backend: plain LIKE scans, no index to maintain."""
+
+    def index_job(self, job):
+        pass
+
+    def remove_job(self, job_id):
+        pass
+
+    def rebuild(self):
+        return 0
+
+    def filter_queryset(self, queryset, query):
+        return queryset.filter(
+            Q(title__icontains=query) |
+            Q(company_name__icontains=query) |
+            Q(description__icontains=query) |
+            Q(city__icontains=query) |
+            Q(skills__name__icontains=query)
+        ).distinct().annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+class SQLiteFTS5Backend:
+    """
+    SQLite FTS5 virtual table keyed by job id (rowid = jobs.id).
+    Results are ranked with bm25, weighting title and skills above the
+    description body.
+    """
+
+    table = 'job_search_index'
+    # bm25 weights, in column order: title, company_name, description, city, skills
+    weights = (10.0, 5.0, 1.0, 3.0, 6.0)
+
+    def create_table(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+                "title, company_name, description, city, skills, "
+                "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+            )
+
+    def index_job(self, job):
+        doc = _job_document(job)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [job.pk])
+            cursor.execute(
+                f"INSERT INTO {self.table} (rowid, title, company_name, description, city, skills) "
+                "VALUES (%s, %s, %s, %s, %s, %s)",
+                [job.pk, doc['title'], doc['company_name'], doc['description'], doc['city'], doc['skills']],
+            )
+
+    def remove_job(self, job_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [job_id])
+
+    def rebuild(self):
+        from main.models import Job
+
+        self.create_table()
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+        count = 0
+        for job in Job.objects.prefetch_related('skills').iterator(chunk_size=500):
+            self.index_job(job)
+            count += 1
+        return count
+
+    @staticmethod
+    def build_match_expression(query):
+        """
+        Turn free user input into a safe FTS5 query: every word becomes a
+        quoted prefix term, all terms must match.
+        """
+        tokens = _TOKEN_RE.findall(query)
+        return ' '.join(f'"{token}"*' for token in tokens)
+
+    def filter_queryset(self, queryset, query):
+        match = self.build_match_expression(query)
+        if not match:
+            return queryset.none()
+
+        job_table = queryset.model._meta.db_table
+        weights = ', '.join(str(w) for w in self.weights)
+        return queryset.filter(
+            id__in=RawSQL(f"SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s", [match])
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT bm25({self.table}, {weights}) FROM {self.table} "
+                f"WHERE {self.table} MATCH %s AND rowid = {job_table}.id",
+                [match],
+                output_field=FloatField(),
+            )
+        )
+
+
+class PostgresSearchBackend:
+    """
+    PostgreSQL full-text search: one row per job holding a weighted
+    tsvector (GIN-indexed), ranked with ts_rank_cd.  When the pg_trgm
+    extension is installed, a trigram index over the same text also
+    catches misspellings ("weldr") and its word similarity is added to
+    the rank; without it, search is full-text only.  The table, indexes
+    and extension are created by migration 0031.
+    """
+
+    table = 'job_search_document'
+    config = 'simple'  # no stemming/stop words: titles and skills mix languages
+    # setweight classes: A (title, skills), B (company, city), D (description)
+
+    def __init__(self):
+        self._has_trigram = None
+
+    def create_table(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "job_id bigint PRIMARY KEY REFERENCES jobs (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+                "document tsvector NOT NULL, "
+                "body text NOT NULL)"
+            )
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_document_idx ON {self.table} USING GIN (document)")
+            if self.has_trigram:
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS {self.table}_body_trgm_idx ON {self.table} USING GIN (body gin_trgm_ops)"
+                )
+
+    @property
+    def has_trigram(self):
+        if self._has_trigram is None:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                self._has_trigram = cursor.fetchone() is not None
+        return self._has_trigram
+
+    def index_job(self, job):
+        doc = _job_document(job)
+        body = ' '.join(doc[name] for name in ('title', 'skills', 'company_name', 'city'))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {self.table} (job_id, document, body) VALUES (%s, "
+                f"setweight(to_tsvector('{self.config}', %s), 'A') || "
+                f"setweight(to_tsvector('{self.config}', %s), 'A') || "
+                f"setweight(to_tsvector('{self.config}', %s), 'B') || "
+                f"setweight(to_tsvector('{self.config}', %s), 'B') || "
+                f"setweight(to_tsvector('{self.config}', %s), 'D'), %s) "
+                "ON CONFLICT (job_id) DO UPDATE SET document = EXCLUDED.document, body = EXCLUDED.body",
+                [job.pk, doc['title'], doc['skills'], doc['company_name'], doc['city'], doc['description'], body],
+            )
+
+    def remove_job(self, job_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE job_id = %s", [job_id])
+
+    def rebuild(self):
+        from main.models import Job
+
+        self.create_table()
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+        count = 0
+        for job in Job.objects.prefetch_related('skills').iterator(chunk_size=500):
+            self.index_job(job)
+            count += 1
+        return count
+
+    @staticmethod
+    def build_tsquery(query):
+        """Every word becomes a prefix term, all terms must match: 'weld:* & qatar:*'."""
+        return ' & '.join(f'{token}:*' for token in _TOKEN_RE.findall(query.lower()))
+
+    def filter_queryset(self, queryset, query):
+        tsquery = self.build_tsquery(query)
+        if not tsquery:
+            return queryset.none()
+
+        job_table = queryset.model._meta.db_table
+        matches = f"document @@ to_tsquery('{self.config}', %s)"
+        rank = f"ts_rank_cd(document, to_tsquery('{self.config}', %s))"
+        params, rank_params = [tsquery], [tsquery]
+        if self.has_trigram:
+            # "<%%" is pg_trgm's word-similarity operator (%% escapes the
+            # placeholder syntax); it is served by the trigram GIN index
+            matches = f"({matches} OR %s <%% body)"
+            rank = f"({rank} + word_similarity(%s, body))"
+            params, rank_params = [tsquery, query], [tsquery, query]
+
+        return queryset.filter(
+            id__in=RawSQL(f"SELECT job_id FROM {self.table} WHERE {matches}", params)
+        ).annotate(
+            # Negated so that, as with bm25, lower is better
+            search_rank=RawSQL(
+                f"SELECT -{rank} FROM {self.table} WHERE job_id = {job_table}.id",
+                rank_params,
+                output_field=FloatField(),
+            )
+        )
+
+
+_backend = None
+
+
+def get_search_backend():
+    """Return the configured backend instance (created once per process)."""
+    global _backend
+    if _backend is None:
+        path = getattr(settings, 'JOB_SEARCH_BACKEND', DEFAULT_BACKEND)
+        _backend = import_string(path)()
+    return _backend
+
+
+def search_jobs(queryset, query):
+    """Filter `queryset` down to jobs matching `query`, best matches first."""
+    return get_search_backend().filter_queryset(queryset, query).order_by('search_rank', '-created_at')
+
+
+def index_job(job):
+    """Reindex one job; never lets an index failure break the save."""
+    try:
+        get_search_backend().index_job(job)
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Search index update failed (job=%s): %s", job.pk, exc)
+
+
+def remove_job(job_id):
+    try:
+        get_search_backend().remove_job(job_id)
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Search index delete failed (job=%s): %s", job_id, exc)
@@ -0,0 +1,421 @@
+"""
+Model signal receivers.  Connected from MainConfig.ready().
+"""
+
+from functools import partial
+from django.db.models.signals import pre_save, post_save, post_delete, pre_delete, m2m_changed
+from django.db import transaction
+from django.dispatch import receiver
+from main.models import User, Company, Job, Skill, JobApplication, ApplicationStatusCount, TeamMember, HeroPhoto, RelatedJob, UserSkill, JobMatch
+from main import search
+from main import application_stats
+from main import auth_cache
+from main import images
+from main import related_jobs
+from main import matching
+from main import skill_suggestions
+from main import utils as recommender
+from main.facets import invalidate_country_facets
+from main.company_cache import invalidate_company
+from main.page_cache import purge_tags
+from main.pagination import invalidate_counts
+
+
+# ── Job search index ───────────────────────────────────────────────────────
+
+@receiver(post_save, sender=Job)
+def index_job_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    search.index_job(instance)
+
+
+@receiver(post_delete, sender=Job)
+def unindex_job_on_delete(sender, instance, **kwargs):
+    search.remove_job(instance.pk)
+
+
+# ── Jobs list facets ───────────────────────────────────────────────────────
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_facets_on_job_change(sender, **kwargs):
+    invalidate_country_facets()
+
+
+@receiver(m2m_changed, sender=Job.skills.through)
+def remember_jobs_before_skill_clear(sender, instance, action, reverse, **kwargs):
+    if action == 'pre_clear' and reverse:
+        instance._search_job_ids = list(instance.jobs.values_list('pk', flat=True))
+
+
+@receiver(m2m_changed, sender=Job.skills.through)
+def reindex_job_on_skills_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        search.index_job(instance)
+    else:
+        # skill.jobs.add(...) – instance is the Skill, pk_set holds job ids
+        job_ids = pk_set if pk_set is not None else instance._search_job_ids
+        for job in Job.objects.filter(pk__in=job_ids):
+            search.index_job(job)
+
+
+@receiver(post_save, sender=Skill)
+def reindex_jobs_on_skill_rename(sender, instance, created=False, raw=False, **kwargs):
+    if created or raw:
+        return
+    for job in instance.jobs.all():
+        search.index_job(job)
+
+
+@receiver(pre_delete, sender=Skill)
+def remember_jobs_before_skill_delete(sender, instance, **kwargs):
+    instance._search_job_ids = list(instance.jobs.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Skill)
+def reindex_jobs_on_skill_delete(sender, instance, **kwargs):
+    for job in Job.objects.filter(pk__in=getattr(instance, '_search_job_ids', [])):
+        search.index_job(job)
+
+
+# ── Application status counters ────────────────────────────────────────────
+
+@receiver(pre_save, sender=JobApplication)
+def load_counted_status(sender, instance, raw=False, **kwargs):
+    # Instances not loaded through from_db (e.g. built by hand with a pk)
+    if raw or instance.pk is None or hasattr(instance, '_counted_as'):
+        return
+    old = JobApplication.objects.filter(pk=instance.pk).values_list('status', 'job_id', 'user_id').first()
+    instance._counted_as = old
+
+
+@receiver(post_save, sender=JobApplication)
+def count_application_on_save(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    old_key = None if created else getattr(instance, '_counted_as', None)
+    new_key = instance.count_key()
+    application_stats.record_change(old_key, new_key)
+    instance._counted_as = new_key
+
+
+@receiver(post_delete, sender=JobApplication)
+def uncount_application_on_delete(sender, instance, **kwargs):
+    old_key = getattr(instance, '_counted_as', None) or instance.count_key()
+    application_stats.record_change(old_key, None)
+
+
+@receiver(post_delete, sender=Job)
+def drop_job_counters(sender, instance, **kwargs):
+    ApplicationStatusCount.objects.filter(scope='job', scope_id=instance.pk).delete()
+
+
+@receiver(post_delete, sender=User)
+def drop_user_counters(sender, instance, **kwargs):
+    ApplicationStatusCount.objects.filter(scope='user', scope_id=instance.pk).delete()
+
+
+# ── Approximate result counts ──────────────────────────────────────────────
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+def invalidate_counts_on_change(sender, raw=False, **kwargs):
+    # After commit, so a request in between can't cache the old total again
+    if not raw:
+        transaction.on_commit(invalidate_counts)
+
+
+@receiver(m2m_changed, sender=Job.skills.through)
+def invalidate_counts_on_job_skills_change(sender, action, **kwargs):
+    # Skill names are searchable, so they change search result totals
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        transaction.on_commit(invalidate_counts)
+
+
+# ── Cached JWT users ───────────────────────────────────────────────────────
+
+@receiver(post_save, sender=User)
+def invalidate_cached_user_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    # set_password() leaves the raw password on _password until save() returns
+    if getattr(instance, '_password', None) is not None:
+        auth_cache.revoke_user_tokens(instance.pk)
+    else:
+        auth_cache.invalidate_user(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def invalidate_cached_user_on_delete(sender, instance, **kwargs):
+    auth_cache.invalidate_user(instance.pk)
+
+
+# ── Company profile cache ──────────────────────────────────────────────────
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def invalidate_company_cache(sender, **kwargs):
+    invalidate_company()
+
+
+# ── Anonymous page cache ───────────────────────────────────────────────────
+
+_PAGE_CACHE_TAGS = {Job: 'job', TeamMember: 'team', HeroPhoto: 'hero', Company: 'company'}
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def purge_page_cache(sender, raw=False, **kwargs):
+    tag = _PAGE_CACHE_TAGS.get(sender)
+    if tag and not raw:
+        purge_tags(tag)
+
+
+@receiver(m2m_changed, sender=Job.skills.through)
+def purge_job_pages_on_skills_change(sender, action, **kwargs):
+    # Job pages list the job's skills
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        purge_tags('job')
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def purge_job_pages_on_skill_change(sender, instance, created=False, raw=False, **kwargs):
+    # A renamed or deleted skill changes every job page listing it; a new one none
+    if not (created or raw):
+        purge_tags('job')
+
+
+# ── Responsive image variants ──────────────────────────────────────────────
+
+# Generated by the image worker (generate_image_variants --watch), not on save
+
+@receiver(post_delete, sender=HeroPhoto)
+@receiver(post_delete, sender=TeamMember)
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=Company)
+def delete_image_variants(sender, instance, **kwargs):
+    for (label, field_name), (manifest_field, _) in images.VARIANT_FIELDS.items():
+        manifest = getattr(instance, manifest_field) if label == sender._meta.label else None
+        if manifest:
+            storage = getattr(instance, field_name).storage
+            transaction.on_commit(partial(images.delete_variants, storage, manifest))
+
+
+# ── Related-jobs index ─────────────────────────────────────────────────────
+
+# Queued for the refresh_job_matches worker, not recomputed on save
+
+@receiver(post_save, sender=Job)
+def refresh_related_jobs_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    related_jobs.mark_jobs_dirty([instance.pk])
+
+
+@receiver(m2m_changed, sender=Job.skills.through)
+def refresh_related_jobs_on_skills_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        related_jobs.mark_jobs_dirty([instance.pk])
+    else:
+        related_jobs.mark_jobs_dirty(pk_set if pk_set is not None else instance._search_job_ids)
+
+
+@receiver(pre_delete, sender=Job)
+def remember_related_lists_before_job_delete(sender, instance, **kwargs):
+    instance._related_listed_in = list(
+        RelatedJob.objects.filter(related_id=instance.pk).values_list('job_id', flat=True)
+    )
+
+
+@receiver(post_delete, sender=Job)
+def refill_related_lists_on_job_delete(sender, instance, **kwargs):
+    # The deleted job's rows are gone with it; refill the lists it was in
+    related_jobs.mark_jobs_dirty(getattr(instance, '_related_listed_in', []))
+
+
+@receiver(post_delete, sender=Skill)
+def refresh_related_jobs_on_skill_delete(sender, instance, **kwargs):
+    related_jobs.mark_jobs_dirty(getattr(instance, '_search_job_ids', []))
+
+
+# ── Candidate ↔ job matching ───────────────────────────────────────────────
+
+# Queued for the match refresh worker (refresh_job_matches), not run on save
+
+@receiver(pre_save, sender=UserSkill)
+def link_user_skill(sender, instance, raw=False, **kwargs):
+    if not raw:
+        matching.link_user_skill(instance)
+
+
+@receiver(post_save, sender=UserSkill)
+@receiver(post_delete, sender=UserSkill)
+def refresh_matches_on_user_skill_change(sender, instance, raw=False, **kwargs):
+    if not raw:
+        matching.mark_users_dirty([instance.user_id])
+
+
+@receiver(post_save, sender=Skill)
+def relink_user_skills_on_skill_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        matching.mark_users_dirty(matching.relink_user_skills([instance]))
+
+
+@receiver(pre_delete, sender=Skill)
+def remember_candidates_before_skill_delete(sender, instance, **kwargs):
+    instance._matching_user_ids = list(
+        UserSkill.objects.filter(skill=instance).values_list('user_id', flat=True)
+    )
+
+
+@receiver(post_delete, sender=Skill)
+def refresh_matches_on_skill_delete(sender, instance, **kwargs):
+    matching.mark_jobs_dirty(getattr(instance, '_search_job_ids', []))
+    matching.mark_users_dirty(set(getattr(instance, '_matching_user_ids', [])) | matching.relink_user_skills([instance]))
+
+
+@receiver(post_save, sender=Job)
+def refresh_matches_on_job_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        matching.mark_jobs_dirty([instance.pk])
+
+
+@receiver(m2m_changed, sender=Job.skills.through)
+def refresh_matches_on_job_skills_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        matching.mark_jobs_dirty([instance.pk])
+    else:
+        matching.mark_jobs_dirty(pk_set if pk_set is not None else instance._search_job_ids)
+
+
+@receiver(pre_delete, sender=Job)
+def remember_candidates_before_job_delete(sender, instance, **kwargs):
+    instance._matching_user_ids = list(
+        JobMatch.objects.filter(job_id=instance.pk, user_rank__isnull=False).values_list('user_id', flat=True)
+    )
+
+
+@receiver(post_delete, sender=Job)
+def refresh_matches_on_job_delete(sender, instance, **kwargs):
+    matching.mark_users_dirty(getattr(instance, '_matching_user_ids', []))
+
+
+@receiver(pre_save, sender=User)
+def load_candidate_status(sender, instance, raw=False, update_fields=None, **kwargs):
+    # Only candidates (role='user', is_active) are matched
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and not {'role', 'is_active'} & set(update_fields):
+        return
+    instance._candidate_status = User.objects.filter(pk=instance.pk).values_list('role', 'is_active').first()
+
+
+@receiver(post_save, sender=User)
+def refresh_matches_on_candidate_status_change(sender, instance, raw=False, **kwargs):
+    old = instance.__dict__.pop('_candidate_status', None)
+    if not raw and old is not None and old != (instance.role, instance.is_active):
+        matching.mark_users_dirty([instance.pk])
+
+
+@receiver(pre_delete, sender=User)
+def remember_jobs_before_candidate_delete(sender, instance, **kwargs):
+    instance._matching_job_ids = list(
+        JobMatch.objects.filter(user_id=instance.pk, job_rank__isnull=False).values_list('job_id', flat=True)
+    )
+
+
+@receiver(post_delete, sender=User)
+def refresh_matches_on_candidate_delete(sender, instance, **kwargs):
+    matching.mark_jobs_dirty(getattr(instance, '_matching_job_ids', []))
+
+
+# ── Apriori recommendation cache ───────────────────────────────────────────
+
+@receiver(post_save, sender=JobApplication)
+def clear_recommendations_on_new_application(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        recommender.clear_apriori_cache()
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def clear_recommendations_on_job_change(sender, raw=False, **kwargs):
+    # A closed or deleted job's place in the lists goes to the next rule
+    if not raw:
+        transaction.on_commit(recommender.clear_apriori_cache)
+
+
+# ── Skill suggestions ──────────────────────────────────────────────────────
+
+def _skill_baskets(sender):
+    for model, field_name in skill_suggestions.BASKET_FIELDS:
+        field = model._meta.get_field(field_name)
+        if field.remote_field.through is sender:
+            return field.m2m_column_name()
+    return None
+
+
+@receiver(m2m_changed, sender=JobApplication.skills.through)
+@receiver(m2m_changed, sender=Job.skills.through)
+def count_skill_associations(sender, instance, action, reverse, pk_set, **kwargs):
+    column = _skill_baskets(sender)
+
+    if not reverse:
+        # instance is the application/job; pk_set holds skill ids
+        if action not in ('pre_remove', 'pre_clear', 'post_add', 'post_remove', 'post_clear'):
+            return
+        current = skill_suggestions.basket_skill_ids(sender, column, [instance.pk])[instance.pk]
+        if action == 'pre_remove':
+            instance._removed_skill_ids = current & set(pk_set)
+        elif action == 'pre_clear':
+            instance._removed_skill_ids = current
+        elif action == 'post_add':
+            skill_suggestions.record_added(current - pk_set, pk_set)
+        else:
+            skill_suggestions.record_removed(current, getattr(instance, '_removed_skill_ids', ()))
+        return
+
+    # skill.applications.add(...) / skill.jobs.add(...) – instance is the Skill
+    if action == 'pre_remove':
+        holding = sender.objects.filter(skill_id=instance.pk, **{f'{column}__in': pk_set})
+        instance._skill_basket_ids = set(holding.values_list(column, flat=True))
+    elif action == 'pre_clear':
+        holding = sender.objects.filter(skill_id=instance.pk)
+        instance._skill_basket_ids = set(holding.values_list(column, flat=True))
+    elif action == 'post_add':
+        for skill_ids in skill_suggestions.basket_skill_ids(sender, column, pk_set).values():
+            skill_suggestions.record_added(skill_ids - {instance.pk}, [instance.pk])
+    elif action in ('post_remove', 'post_clear'):
+        basket_ids = getattr(instance, '_skill_basket_ids', ())
+        for skill_ids in skill_suggestions.basket_skill_ids(sender, column, basket_ids).values():
+            skill_suggestions.record_removed(skill_ids, [instance.pk])
+
+
+@receiver(pre_delete, sender=JobApplication)
+@receiver(pre_delete, sender=Job)
+def remember_skills_before_basket_delete(sender, instance, **kwargs):
+    instance._basket_skill_ids = set(instance.skills.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=JobApplication)
+@receiver(post_delete, sender=Job)
+def uncount_skill_associations_on_delete(sender, instance, **kwargs):
+    skill_suggestions.record_removed((), getattr(instance, '_basket_skill_ids', ()))
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def reload_skill_suggestions_on_skill_change(sender, raw=False, **kwargs):
+    # Names live in the in-memory table; a deleted skill's rows cascade away
+    if not raw:
+        transaction.on_commit(skill_suggestions.publish_changes)
@@ -0,0 +1,227 @@
+"""
+"People who picked these skills also picked…" suggestions.
+
+Every job application (JobApplication.skills) and every job posting
+(Job.skills) is a basket of skills.  SkillAssociation stores, per
+unordered skill pair, how many baskets contain both, and on its diagonal
+how many contain each skill.  The counts are kept current from
+m2m_changed / delete receivers in main/signals.py, which pass the skills
+a basket gained or lost to record_added() / record_removed(); only the
+pairs touching those skills change.
+
+For the request path each process holds the counts as a SkillTable:
+
+    baskets[skill_id]    → number of baskets with the skill
+    neighbours[skill_id] → ((other_id, pair count), ...), most frequent first
+
+and suggest() scores each candidate skill c by the mean of
+P(c | s) = pair count / baskets[s] over the selected skills s.  That is a
+few dict lookups per selected skill, well under a millisecond.
+
+Like rule_index.py, the table is reloaded when the 'skill_assoc' cache
+version changes, checked at most every LOCAL_TTL seconds.  Every
+application moves the counts and bumps the version, so a process keeps
+its table for at least RELOAD_INTERVAL seconds before reloading it:
+suggestions lag the counts by up to that long, and a busy site costs
+each process one full read of the table per interval, not one per
+application.
+"""
+
+import heapq
+import threading
+import time
+from collections import Counter
+from itertools import combinations
+from django.db import transaction
+from django.db.models import F
+from main.cache_versions import bump_version, get_version
+from main.models import Job, JobApplication, Skill, SkillAssociation
+
+NAMESPACE = 'skill_assoc'
+LOCAL_TTL = 5          # seconds between version checks in this process
+RELOAD_INTERVAL = 60   # minimum seconds between reloads of this process's table
+MAX_NEIGHBOURS = 50    # co-occurring skills kept per skill
+DEFAULT_LIMIT = 5
+
+# Skill sets counted as baskets: (model, m2m field)
+BASKET_FIELDS = (
+    (JobApplication, 'skills'),
+    (Job, 'skills'),
+)
+
+
+def _pair(a, b):
+    return (a, b) if a <= b else (b, a)
+
+
+def _pair_deltas(existing, changed, sign):
+    """
+    {(skill_a, skill_b): ±1} for a basket that gained (sign=1) or lost
+    (sign=-1) `changed` while also holding `existing`.
+    """
+    changed = set(changed) - set(existing)
+    deltas = Counter()
+    for skill_id in changed:
+        deltas[(skill_id, skill_id)] += sign
+        for other_id in existing:
+            deltas[_pair(skill_id, other_id)] += sign
+    for a, b in combinations(sorted(changed), 2):
+        deltas[(a, b)] += sign
+    return deltas
+
+
+# ── incremental maintenance ────────────────────────────────────────────────
+
+def _apply(deltas):
+    """
+    Add `deltas` to the pair counts with a constant number of queries:
+    missing pairs are inserted at 0 (ignoring rows a concurrent writer just
+    inserted), then counts move with UPDATE count = count + delta, one
+    statement per distinct delta, so concurrent baskets never overwrite
+    each other's counts.
+    """
+    deltas = {pair: delta for pair, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    skill_a_ids, skill_b_ids = {a for a, _ in deltas}, {b for _, b in deltas}
+    with transaction.atomic():
+        SkillAssociation.objects.bulk_create(
+            [SkillAssociation(skill_a_id=a, skill_b_id=b, count=0) for (a, b), delta in deltas.items() if delta > 0],
+            ignore_conflicts=True,
+        )
+        by_delta = {}
+        rows = SkillAssociation.objects.filter(skill_a_id__in=skill_a_ids, skill_b_id__in=skill_b_ids)
+        for pk, a, b in rows.values_list('pk', 'skill_a_id', 'skill_b_id'):
+            delta = deltas.get((a, b))
+            if delta:
+                by_delta.setdefault(delta, []).append(pk)
+        for delta, pks in by_delta.items():
+            SkillAssociation.objects.filter(pk__in=pks).update(count=F('count') + delta)
+        SkillAssociation.objects.filter(skill_a_id__in=skill_a_ids, count__lte=0).delete()
+        transaction.on_commit(publish_changes)
+
+
+def record_added(existing_ids, added_ids):
+    """A basket holding `existing_ids` gained `added_ids`."""
+    _apply(_pair_deltas(existing_ids, added_ids, 1))
+
+
+def record_removed(remaining_ids, removed_ids):
+    """A basket lost `removed_ids` and still holds `remaining_ids`."""
+    _apply(_pair_deltas(remaining_ids, removed_ids, -1))
+
+
+def basket_skill_ids(through, basket_column, basket_ids):
+    """{basket_id: set(skill ids)} read from an m2m through table."""
+    baskets = {basket_id: set() for basket_id in basket_ids}
+    rows = through.objects.filter(**{f'{basket_column}__in': baskets}).values_list(basket_column, 'skill_id')
+    for basket_id, skill_id in rows.iterator():
+        baskets[basket_id].add(skill_id)
+    return baskets
+
+
+def rebuild():
+    """Recount every pair from scratch; returns the number of baskets counted."""
+    counts, basket_count = Counter(), 0
+    for model, field_name in BASKET_FIELDS:
+        field = model._meta.get_field(field_name)
+        through, column = field.remote_field.through, field.m2m_column_name()
+        baskets = {}
+        for basket_id, skill_id in through.objects.values_list(column, 'skill_id').order_by().iterator():
+            baskets.setdefault(basket_id, []).append(skill_id)
+        for skill_ids in baskets.values():
+            counts.update(_pair_deltas((), skill_ids, 1))
+        basket_count += len(baskets)
+
+    with transaction.atomic():
+        SkillAssociation.objects.all().delete()
+        SkillAssociation.objects.bulk_create([
+            SkillAssociation(skill_a_id=a, skill_b_id=b, count=count)
+            for (a, b), count in counts.items()
+        ], batch_size=1000)
+        transaction.on_commit(publish_changes)
+    return basket_count
+
+
+def publish_changes():
+    """Every process reloads its SkillTable on its next check."""
+    bump_version(NAMESPACE)
+    _local['checked_at'] = 0.0
+
+
+# ── in-memory table ────────────────────────────────────────────────────────
+
+class SkillTable:
+    __slots__ = ('version', 'baskets', 'neighbours', 'names', 'loaded_at')
+
+    def __init__(self, version, rows, names):
+        baskets, neighbours = {}, {}
+        for a, b, count in rows:
+            if a == b:
+                baskets[a] = count
+            else:
+                neighbours.setdefault(a, []).append((b, count))
+                neighbours.setdefault(b, []).append((a, count))
+        self.version = version
+        self.baskets = baskets
+        self.neighbours = {
+            skill_id: tuple(sorted(entries, key=lambda entry: entry[1], reverse=True)[:MAX_NEIGHBOURS])
+            for skill_id, entries in neighbours.items()
+        }
+        self.names = names
+        self.loaded_at = time.monotonic()
+
+    def suggest(self, selected_ids, limit=DEFAULT_LIMIT):
+        """[(skill_id, score)] most likely to go with `selected_ids`, best first."""
+        selected = [skill_id for skill_id in dict.fromkeys(selected_ids) if skill_id in self.baskets]
+        if not selected:
+            return []
+        scores = {}
+        for skill_id in selected:
+            total = self.baskets[skill_id]
+            for other_id, count in self.neighbours.get(skill_id, ()):
+                scores[other_id] = scores.get(other_id, 0.0) + count / total
+        for skill_id in selected:
+            scores.pop(skill_id, None)
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(skill_id, score / len(selected)) for skill_id, score in top if skill_id in self.names]
+
+
+_local = {'table': None, 'checked_at': 0.0}
+_load_lock = threading.Lock()
+
+
+def _build(version):
+    rows = SkillAssociation.objects.values_list('skill_a_id', 'skill_b_id', 'count').order_by()
+    names = dict(Skill.objects.values_list('id', 'name'))
+    return SkillTable(version, rows.iterator(), names)
+
+
+def _stale(table, version, now):
+    return table is None or (table.version != version and now - table.loaded_at >= RELOAD_INTERVAL)
+
+
+def get_skill_table():
+    """This process's current SkillTable, reloaded after the counts change."""
+    table, now = _local['table'], time.monotonic()
+    if table is not None and now - _local['checked_at'] < LOCAL_TTL:
+        return table
+
+    version = get_version(NAMESPACE)
+    if _stale(table, version, now):
+        with _load_lock:
+            table = _local['table']
+            if _stale(table, version, now):
+                table = _build(version)
+                _local['table'] = table
+    _local['checked_at'] = now
+    return table
+
+
+def suggest_skills(selected_ids, limit=DEFAULT_LIMIT):
+    """[{'id', 'name', 'score'}] for the skills most often picked with `selected_ids`."""
+    table = get_skill_table()
+    return [
+        {'id': skill_id, 'name': table.names[skill_id], 'score': round(score, 4)}
+        for skill_id, score in table.suggest(selected_ids, limit)
+    ]
@@ -0,0 +1,52 @@
+"""
+{% responsive_img %} — <img> with WebP/JPEG srcset from an image's variant manifest.
+
+    {% load responsive_images %}
+    {% responsive_img photo.image sizes="(min-width: 768px) 448px, 100vw" class="w-full h-full object-cover" alt=photo.caption %}
+
+Falls back to a plain <img src="original"> for images that have no
+variants yet (the image worker, `python manage.py generate_image_variants
+--watch`, hasn't reached them).
+Keyword arguments become attributes; underscores turn into hyphens
+(data_photo=... → data-photo="...").
+"""
+
+from django import template
+from django.utils.html import format_html, format_html_join
+from main import images
+
+register = template.Library()
+
+
+def _srcset(storage, manifest, ext):
+    return ', '.join(
+        f'{storage.url(images.variant_name(manifest, width, ext))} {width}w'
+        for width in manifest['sizes']
+    )
+
+
+@register.simple_tag
+def responsive_img(field_file, sizes='100vw', loading='lazy', **attrs):
+    if not field_file:
+        return ''
+    attributes = format_html_join(
+        '', ' {}="{}"', ((name.replace('_', '-'), value) for name, value in attrs.items() if value is not None)
+    )
+
+    config = images.variant_config(field_file.instance, field_file.field.name)
+    manifest = getattr(field_file.instance, config[0], None) if config else None
+    if not manifest or manifest.get('src') != field_file.name or not manifest.get('sizes'):
+        return format_html('<img src="{}" loading="{}"{}>', field_file.url, loading, attributes)
+
+    storage = field_file.storage
+    fallback = manifest['fallback']
+    largest = images.variant_name(manifest, manifest['sizes'][-1], fallback)
+    return format_html(
+        '<picture style="display:contents">'
+        '<source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}" width="{}" height="{}" loading="{}" decoding="async"{}>'
+        '</picture>',
+        _srcset(storage, manifest, 'webp'), sizes,
+        storage.url(largest), _srcset(storage, manifest, fallback), sizes,
+        manifest['w'], manifest['h'], loading, attributes,
+    )
@@ -1,3 +1,207 @@
-from django.test import TestCase
+import datetime
+import re
+import unittest
+from django.contrib.auth import SESSION_KEY, BACKEND_SESSION_KEY, HASH_SESSION_KEY
+from django.contrib.sessions.backends.db import SessionStore
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import RefreshToken
+from main.middleware import JWTAuthenticationMiddleware
+from main.models import ContactMessage, Job, JobApplication, Skill, User
 
-# Create your tests here.
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class AuthenticationQueryCountTests(TestCase):
+    """request.user costs at most one credential lookup, and nothing until touched."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='applicant', password='x', role='user')
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def _process(self, request):
+        SessionMiddleware(lambda r: HttpResponse()).process_request(request)
+        JWTAuthenticationMiddleware(lambda r: HttpResponse()).process_request(request)
+        return request
+
+    def _jwt_request(self):
+        request = self.factory.get('/')
+        request.COOKIES['access_token'] = str(RefreshToken.for_user(self.user).access_token)
+        return self._process(request)
+
+    def _session_key(self):
+        session = SessionStore()
+        session[SESSION_KEY] = str(self.user.pk)
+        session[BACKEND_SESSION_KEY] = 'django.contrib.auth.backends.ModelBackend'
+        session[HASH_SESSION_KEY] = self.user.get_session_auth_hash()
+        session.save()
+        return session.session_key
+
+    def _session_request(self, session_key=None):
+        request = self.factory.get('/')
+        request.COOKIES['sessionid'] = session_key or self._session_key()
+        return self._process(request)
+
+    def test_anonymous_request_runs_no_queries(self):
+        request = self._process(self.factory.get('/'))
+        with self.assertNumQueries(0):
+            self.assertFalse(request.user.is_authenticated)
+
+    def test_user_is_not_resolved_until_touched(self):
+        session_key = self._session_key()
+        with self.assertNumQueries(0):
+            self._jwt_request()
+            self._session_request(session_key)
+
+    def test_jwt_request_loads_user_once_then_hits_cache(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self._jwt_request().user.pk, self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(self._jwt_request().user.pk, self.user.pk)
+
+    def test_jwt_request_skips_session_lookup(self):
+        request = self._jwt_request()
+        request.COOKIES['sessionid'] = 'unused'
+        with self.assertNumQueries(1):
+            self.assertTrue(request.user.is_authenticated)
+
+    def test_session_request_reads_session_and_user(self):
+        request = self._session_request()
+        with self.assertNumQueries(2):
+            self.assertEqual(request.user.pk, self.user.pk)
+
+    def test_invalid_jwt_falls_back_to_session(self):
+        request = self._session_request()
+        request.COOKIES['access_token'] = 'not-a-token'
+        with self.assertNumQueries(2):
+            self.assertEqual(request.user.pk, self.user.pk)
+
+
+@unittest.skipUnless(connection.vendor == 'sqlite', 'reads SQLite EXPLAIN QUERY PLAN output')
+@override_settings(CACHES=LOCMEM_CACHE)
+class QueryPlanTests(TestCase):
+    """
+    Every query the main pages run on the big tables is served by an index.
+
+    Each page is requested against a seeded database, and every SELECT it
+    ran is fed to EXPLAIN QUERY PLAN.  A full scan of one of WATCHED_TABLES
+    fails the test: a plain "SCAN <table>" step, or a "SCAN <table> USING
+    INDEX" whose rows then go through a temp B-tree sort (every row read,
+    rather than an ordered walk that stops at the LIMIT).  Queries with no
+    WHERE and no LIMIT (e.g. the jobs filter dropdown) return every row,
+    so a scan is the right plan for them and they are not checked.
+    """
+
+    WATCHED_TABLES = {Job._meta.db_table, JobApplication._meta.db_table, ContactMessage._meta.db_table}
+
+    # "SCAN jobs", "SCAN U0", "SCAN jobs USING INDEX jobs_status_created_idx"
+    SCAN_RE = re.compile(r'^SCAN (\w+)( USING (?:COVERING )?INDEX \w+)?$')
+    # Django's table aliases: FROM "jobs" U0, INNER JOIN "jobs" T4
+    ALIAS_RE = re.compile(r'"(\w+)" ([A-Z]\d+)\b')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username='admin', password='x', role='admin', email='admin@example.com')
+        cls.user = User.objects.create_user(
+            username='applicant', password='x', role='user', email='applicant@example.com',
+            is_profile_complete=True, is_email_verified=True,
+        )
+        skills = [Skill.objects.create(name=f'Skill {i}') for i in range(5)]
+        today = datetime.date.today()
+        cls.jobs = []
+        for i in range(30):
+            job = Job.objects.create(
+                title=f'Welder {i}', company_name='Acme', description='Welding work', country=('QA', 'AE')[i % 2],
+                salary=1000, deadline=today + datetime.timedelta(days=(30 if i % 5 else -3)),
+                status=('active', 'active', 'closed', 'draft')[i % 4], is_urgent=(i % 7 == 0), posted_by=cls.admin,
+            )
+            job.skills.set(skills[i % 3:i % 3 + 2])
+            cls.jobs.append(job)
+        statuses = ['pending', 'reviewed', 'shortlisted', 'accepted', 'rejected']
+        cls.applications = []
+        for i in range(60):
+            application = JobApplication.objects.create(
+                job=cls.jobs[i % 30], user=cls.user if i % 2 else None, full_name=f'Applicant {i}',
+                contact_number='123', passport_number=f'P{i}', passport_photo='passport.jpg', status=statuses[i % 5],
+            )
+            application.skills.set(skills[:2])
+            cls.applications.append(application)
+        for i in range(10):
+            ContactMessage.objects.create(
+                full_name=f'Visitor {i}', email='visitor@example.com', subject='Hello', message='Hi', is_read=bool(i % 2),
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def _login(self, user):
+        self.client.cookies['access_token'] = str(RefreshToken.for_user(user).access_token)
+
+    def _full_scans(self, sql):
+        if ' WHERE ' not in sql and ' LIMIT ' not in sql:
+            return
+        aliases = {alias: table for table, alias in self.ALIAS_RE.findall(sql)}
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+            plan = [row[-1] for row in cursor.fetchall()]
+        sorted_afterwards = any(step.startswith('USE TEMP B-TREE FOR ORDER BY') for step in plan)
+        for step in plan:
+            match = self.SCAN_RE.match(step)
+            if not match or aliases.get(match.group(1), match.group(1)) not in self.WATCHED_TABLES:
+                continue
+            if not match.group(2) or sorted_afterwards:
+                yield step
+
+    def assertIndexedPlans(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        selects = [query['sql'] for query in queries.captured_queries if query['sql'].lstrip().upper().startswith('SELECT')]
+        self.assertTrue(selects, f'{url} ran no queries')
+        for sql in selects:
+            scans = list(self._full_scans(sql))
+            self.assertFalse(scans, f'{url}: {", ".join(scans)} in\n{sql}')
+        return response
+
+    def test_public_job_pages(self):
+        live_job = Job.objects.live().first()
+        for url in ['/', '/jobs/?country=QA', '/jobs/?search=welder', f'/jobs/{live_job.slug}/']:
+            self.assertIndexedPlans(url)
+        first_page = self.assertIndexedPlans('/jobs/')
+        self.assertIndexedPlans(f"/jobs/?cursor={first_page.context['jobs'].next_cursor}")
+
+    def test_applicant_pages(self):
+        self._login(self.user)
+        live_job = Job.objects.live().first()
+        application = JobApplication.objects.filter(user=self.user).first()
+        for url in [
+            f'/jobs/{live_job.slug}/',
+            f'/jobs/{live_job.slug}/apply/',
+            '/my-applications/',
+            '/my-applications/?status=pending',
+            f'/my-applications/{application.pk}/',
+        ]:
+            self.assertIndexedPlans(url)
+
+    def test_admin_pages(self):
+        self._login(self.admin)
+        for url in [
+            '/my-admin/dashboard/',
+            '/my-admin/applications/',
+            '/my-admin/applications/?status=pending',
+            f'/my-admin/applications/?job={self.jobs[0].pk}',
+            '/my-admin/jobs/?status=active',
+            '/my-admin/contact-messages/',
+            '/my-admin/contact-messages/?status=unread',
+            '/my-admin/contact-messages/?status=replied',
+        ]:
+            self.assertIndexedPlans(url)
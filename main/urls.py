@@ -57,6 +57,7 @@ from main.views import (
     user_job_detail,
     apply_for_job,
     application_success,
+    skill_suggestions,
     user_my_applications,
     user_application_detail,
     # Admin applications
@@ -101,6 +102,7 @@ urlpatterns = [
 
     # User jobs
     path('jobs/', user_jobs_list, name='user_jobs_list'),
+    path('jobs/skills/suggest/', skill_suggestions, name='skill_suggestions'),
     path('jobs/<slug:slug>/', user_job_detail, name='user_job_detail'),
     path('jobs/<slug:slug>/apply/', apply_for_job, name='apply_for_job'),
     path('jobs/<slug:slug>/apply/success/', application_success, name='application_success'),
@@ -1,13 +1,34 @@
-from .apriori_recommendations import (
-    get_product_recommendations,
-    get_frequently_bought_together,
-    run_apriori_analysis,
-    clear_apriori_cache
-)
-
-__all__ = [
-    'get_product_recommendations',
-    'get_frequently_bought_together',
-    'run_apriori_analysis',
-    'clear_apriori_cache',
-]
+"""
+Job recommender (association-rule mining over job applications).
+
+The recommender is optional: its modules are imported on first use of
+one of the names below, not when main.utils is imported, and the dense
+mining mode's pandas/mlxtend (requirements-mining.txt) are only imported
+when that mode actually runs.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'get_job_recommendations': 'apriori_recommendations',
+    'get_frequently_applied_together': 'apriori_recommendations',
+    'run_apriori_analysis': 'apriori_recommendations',
+    'run_sparse_analysis': 'apriori_recommendations',
+    'mine_job_rules': 'apriori_recommendations',
+    'clear_apriori_cache': 'apriori_recommendations',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'{__name__}.{module_name}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
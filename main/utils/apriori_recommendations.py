@@ -1,40 +1,59 @@
 """
-Apriori Algorithm for Product Recommendations
-Uses association rule mining to find products frequently bought together
+Apriori Algorithm for Job Recommendations
+Uses association rule mining on job applications to find jobs that are
+frequently applied to together ("people who applied to X also applied to Y").
+
+Rules are mined offline (python manage.py mine_job_rules) and persisted in
+the JobAssociationRule table; the request path reads them through the
+per-process index in rule_index.py.
 """
 
-import pandas as pd
-from mlxtend.frequent_patterns import apriori, association_rules
-from mlxtend.preprocessing import TransactionEncoder
-from main.models import Order, OrderItem, Product
+import importlib.util
+import time
+from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
+from main.models import Job, JobApplication, JobAssociationRule
+from main.cache_versions import bump_version, get_version
+from main.utils.rule_index import get_rule_index, publish_new_rules
+from main.utils.sparse_mining import Rule, mine
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Every recommendation result is cached under the current generation of this
+# namespace; clear_apriori_cache() bumps it to drop them all at once.
+CACHE_NAMESPACE = 'apriori'
+CACHE_TIMEOUT = 3600
+
+
+def _cache_key(kind, job_id, index):
+    # The rule index version is part of the key too, so a process that has
+    # not picked up a new mining run yet can't cache results under the new
+    # generation from the old rules.
+    return f'{CACHE_NAMESPACE}:v{get_version(CACHE_NAMESPACE)}:r{index.version}:{kind}:{job_id}'
+
+
+def dense_mode_available():
+    """True when the optional pandas/mlxtend stack (requirements-mining.txt) is installed"""
+    return all(importlib.util.find_spec(name) is not None for name in ('pandas', 'mlxtend'))
+
 
 def get_transaction_data():
     """
-    Get transaction data from orders
-    Returns list of lists where each sublist contains product IDs in an order
+    Get transaction data from job applications
+    Returns list of lists where each sublist contains the job IDs one applicant applied to
     """
     try:
-        # Get all delivered/completed orders
-        orders = Order.objects.filter(
-            status__in=['delivered', 'confirmed', 'processing', 'shipped']
-        ).prefetch_related('items__product')
-
-        if not orders.exists():
-            logger.info("No orders found for Apriori analysis")
-            return []
-
-        # Create transaction list
-        transactions = []
-        for order in orders:
-            # Get product IDs in this order
-            product_ids = [item.product.id for item in order.items.all() if item.product]
-            if len(product_ids) > 1:  # Only include orders with multiple items
-                transactions.append(product_ids)
+        # An applicant is the logged-in user, or the passport number for guest applications
+        applicants = {}
+        rows = JobApplication.objects.values_list('user_id', 'passport_number', 'job_id').order_by()
+        for user_id, passport_number, job_id in rows.iterator():
+            key = ('user', user_id) if user_id else ('passport', passport_number.strip().upper())
+            applicants.setdefault(key, set()).add(job_id)
+
+        # Only include applicants who applied to more than one job
+        transactions = [sorted(job_ids) for job_ids in applicants.values() if len(job_ids) > 1]
 
         logger.info(f"Found {len(transactions)} transactions for Apriori analysis")
         return transactions
@@ -56,6 +75,11 @@ def run_apriori_analysis(min_support=0.01, min_confidence=0.1):
         DataFrame with association rules or None if insufficient data
     """
     try:
+        # Mining only runs offline, so the web process never imports pandas/mlxtend
+        import pandas as pd
+        from mlxtend.frequent_patterns import apriori, association_rules
+        from mlxtend.preprocessing import TransactionEncoder
+
         # Get transaction data
         transactions = get_transaction_data()
 
@@ -95,151 +119,235 @@ def run_apriori_analysis(min_support=0.01, min_confidence=0.1):
         return None
 
 
-def get_product_recommendations(product_id, limit=4):
+def run_sparse_analysis(min_support=0.01, min_confidence=0.1, max_len=3, memory_limit_mb=256):
     """
-    Get product recommendations based on Apriori algorithm
+    Mine association rules on bitsets within a memory ceiling (see sparse_mining.py)
 
     Args:
-        product_id: ID of the product to get recommendations for
-        limit: Maximum number of recommendations to return
+        min_support: Starting minimum support; raised automatically if mining
+            would not fit in memory_limit_mb
+        min_confidence: Minimum confidence threshold
+        max_len: Largest itemset size considered
+        memory_limit_mb: Memory ceiling for mining
 
     Returns:
-        List of Product objects or empty list if no recommendations
+        List of Rule tuples, strongest first, or None if insufficient data
     """
     try:
-        # Check cache first (cache for 1 hour)
-        cache_key = f'apriori_recommendations_{product_id}'
-        cached_recommendations = cache.get(cache_key)
+        transactions = get_transaction_data()
 
-        if cached_recommendations is not None:
-            logger.info(f"Using cached recommendations for product {product_id}")
-            return cached_recommendations
+        if len(transactions) < 2:
+            logger.info("Insufficient transactions for Apriori (need at least 2)")
+            return None
 
-        # Run Apriori analysis
-        rules = run_apriori_analysis()
+        rules, used_support = mine(
+            transactions,
+            min_support=min_support,
+            min_confidence=min_confidence,
+            max_len=max_len,
+            memory_limit_mb=memory_limit_mb,
+        )
 
-        if rules is None or rules.empty:
-            logger.info(f"No Apriori rules available for product {product_id}")
-            cache.set(cache_key, [], 3600)  # Cache empty result for 1 hour
-            return []
+        if not rules:
+            logger.info("No association rules found with current support/confidence thresholds")
+            return None
 
-        # Find rules where the product is in antecedents (if bought X, then Y)
-        recommended_product_ids = []
+        logger.info(f"Generated {len(rules)} association rules (min_support={used_support:g})")
+        return rules
 
-        for idx, rule in rules.iterrows():
-            # Check if current product is in antecedents
-            if product_id in rule['antecedents']:
-                # Get consequents (recommended products)
-                for consequent_id in rule['consequents']:
-                    if consequent_id != product_id and consequent_id not in recommended_product_ids:
-                        recommended_product_ids.append(consequent_id)
+    except Exception as e:
+        logger.error(f"Error in sparse Apriori analysis: {str(e)}")
+        return None
 
-        # If no recommendations from antecedents, check consequents
-        if not recommended_product_ids:
-            for idx, rule in rules.iterrows():
-                if product_id in rule['consequents']:
-                    for antecedent_id in rule['antecedents']:
-                        if antecedent_id != product_id and antecedent_id not in recommended_product_ids:
-                            recommended_product_ids.append(antecedent_id)
-
-        if not recommended_product_ids:
-            logger.info(f"No specific recommendations found for product {product_id}")
-            cache.set(cache_key, [], 3600)
-            return []
-
-        # Get Product objects
-        recommended_products = list(Product.objects.filter(
-            id__in=recommended_product_ids[:limit],
-            is_active=True
-        ).select_related('category'))
-
-        # Cache the results for 1 hour
-        cache.set(cache_key, recommended_products, 3600)
-
-        logger.info(f"Found {len(recommended_products)} Apriori recommendations for product {product_id}")
-        return recommended_products
 
-    except Exception as e:
-        logger.error(f"Error getting product recommendations: {str(e)}")
-        return []
+def _rules_from_dataframe(df):
+    columns = df[['antecedents', 'consequents', 'support', 'confidence', 'lift']]
+    return [Rule(*row) for row in columns.itertuples(index=False)]
+
+
+def save_rules(rules):
+    """
+    Replace the persisted rule table with `rules`
+
+    Args:
+        rules: List of Rule tuples
+
+    Returns:
+        Number of (antecedent, consequent) rows stored
+    """
+    mined_at = int(time.time() * 1000)
+
+    # One row per job pair, keeping the strongest rule that links them
+    pairs = {}
+    for rule in rules:
+        for antecedent_id in rule.antecedents:
+            for consequent_id in rule.consequents:
+                key = (int(antecedent_id), int(consequent_id))
+                current = pairs.get(key)
+                if current is None or (rule.confidence, rule.lift) > (current[1], current[2]):
+                    pairs[key] = (float(rule.support), float(rule.confidence), float(rule.lift))
+
+    existing_jobs = set(Job.objects.filter(
+        id__in={job_id for pair in pairs for job_id in pair}
+    ).values_list('id', flat=True))
+
+    with transaction.atomic():
+        JobAssociationRule.objects.all().delete()
+        JobAssociationRule.objects.bulk_create([
+            JobAssociationRule(
+                antecedent_id=antecedent_id,
+                consequent_id=consequent_id,
+                support=support,
+                confidence=confidence,
+                lift=lift,
+                mined_at=mined_at,
+            )
+            for (antecedent_id, consequent_id), (support, confidence, lift) in pairs.items()
+            if antecedent_id in existing_jobs and consequent_id in existing_jobs
+        ], batch_size=1000)
+        transaction.on_commit(publish_new_rules)
+        transaction.on_commit(clear_apriori_cache)
+
+    count = JobAssociationRule.objects.count()
+    logger.info(f"Saved {count} job association rules")
+    return count
+
+
+def mine_job_rules(min_support=0.01, min_confidence=0.1, mode=None, memory_limit_mb=None):
+    """
+    Mine association rules from job applications and persist them
+
+    Args:
+        mode: 'sparse' or 'dense' (default: settings.APRIORI_MINING['MODE'])
+        memory_limit_mb: Ceiling for the sparse mode (default: settings)
+
+    Returns:
+        Tuple of (list of Rule tuples or None, number of rows stored).  When
+        mining produced nothing, the previously stored rules are kept.
+    """
+    config = getattr(settings, 'APRIORI_MINING', {})
+    mode = mode or config.get('MODE', 'sparse')
+
+    if mode == 'dense' and not dense_mode_available():
+        logger.warning("Dense mining needs pandas and mlxtend (requirements-mining.txt); using sparse mode")
+        mode = 'sparse'
+
+    if mode == 'dense':
+        df = run_apriori_analysis(min_support=min_support, min_confidence=min_confidence)
+        rules = None if df is None else _rules_from_dataframe(df)
+    else:
+        rules = run_sparse_analysis(
+            min_support=min_support,
+            min_confidence=min_confidence,
+            max_len=config.get('MAX_LEN', 3),
+            memory_limit_mb=memory_limit_mb or config.get('MEMORY_LIMIT_MB', 256),
+        )
 
+    if not rules:
+        return rules, 0
+    return rules, save_rules(rules)
 
-def get_frequently_bought_together(product_id, limit=3):
+
+def _active_jobs(entries, limit):
+    """
+    [(Job, rule entry)] for the first `limit` live jobs among rule index
+    entries, in rule order, with one query
     """
-    Get products frequently bought together with the given product
+    jobs = Job.objects.live().in_bulk([entry[0] for entry in entries])
+    return [(jobs[entry[0]], entry) for entry in entries if entry[0] in jobs][:limit]
+
+
+def _live_jobs(job_ids):
+    """Live Job objects for cached ids, in the cached order, with one query"""
+    jobs = Job.objects.live().in_bulk(job_ids)
+    return [jobs[job_id] for job_id in job_ids if job_id in jobs]
+
+
+def get_job_recommendations(job_id, limit=4):
+    """
+    Get job recommendations based on Apriori association rules
 
     Args:
-        product_id: ID of the product
-        limit: Maximum number of products to return
+        job_id: ID of the job to get recommendations for
+        limit: Maximum number of recommendations to return
 
     Returns:
-        List of Product objects with confidence scores
+        List of Job objects or empty list if no recommendations
     """
     try:
-        # Check cache
-        cache_key = f'bought_together_{product_id}'
-        cached_result = cache.get(cache_key)
+        # Only the ids are cached (for 1 hour); the jobs are read fresh, so
+        # one closed or deleted since is left out rather than shown stale
+        index = get_rule_index()
+        cache_key = _cache_key(f'recommendations:{limit}', job_id, index)
+        cached_ids = cache.get(cache_key)
 
-        if cached_result is not None:
-            return cached_result
+        if cached_ids is not None:
+            logger.info(f"Using cached recommendations for job {job_id}")
+            return _live_jobs(cached_ids)
 
-        # Run Apriori
-        rules = run_apriori_analysis()
+        # Rules where the job is the antecedent (applied to X, so also Y)
+        recommended_jobs = [job for job, _ in _active_jobs(index.consequents(job_id), limit)]
 
-        if rules is None or rules.empty:
-            cache.set(cache_key, [], 3600)
-            return []
+        # If no recommendations from antecedents, check consequents
+        if not recommended_jobs:
+            recommended_jobs = [job for job, _ in _active_jobs(index.antecedents(job_id), limit)]
 
-        # Filter rules for current product and sort by confidence
-        product_rules = []
+        cache.set(cache_key, [job.pk for job in recommended_jobs], CACHE_TIMEOUT)
 
-        for idx, rule in rules.iterrows():
-            if product_id in rule['antecedents']:
-                for consequent_id in rule['consequents']:
-                    if consequent_id != product_id:
-                        product_rules.append({
-                            'product_id': consequent_id,
-                            'confidence': rule['confidence'],
-                            'support': rule['support'],
-                            'lift': rule['lift']
-                        })
+        logger.info(f"Found {len(recommended_jobs)} Apriori recommendations for job {job_id}")
+        return recommended_jobs
 
-        # Sort by confidence and lift
-        product_rules.sort(key=lambda x: (x['confidence'], x['lift']), reverse=True)
+    except Exception as e:
+        logger.error(f"Error getting job recommendations: {str(e)}")
+        return []
 
-        # Get top products
-        top_product_ids = [rule['product_id'] for rule in product_rules[:limit]]
 
-        if not top_product_ids:
-            cache.set(cache_key, [], 3600)
-            return []
+def get_frequently_applied_together(job_id, limit=3):
+    """
+    Get jobs frequently applied to together with the given job
 
-        # Fetch products
-        products = list(Product.objects.filter(
-            id__in=top_product_ids,
-            is_active=True
-        ).select_related('category'))
+    Args:
+        job_id: ID of the job
+        limit: Maximum number of jobs to return
 
-        # Add confidence scores to products
-        confidence_map = {rule['product_id']: rule['confidence'] for rule in product_rules}
-        for product in products:
-            product.recommendation_confidence = confidence_map.get(product.id, 0)
+    Returns:
+        List of Job objects with confidence scores
+    """
+    try:
+        # Check cache: (job id, confidence) pairs, the jobs are read fresh
+        index = get_rule_index()
+        cache_key = _cache_key(f'applied_together:{limit}', job_id, index)
+        cached_result = cache.get(cache_key)
 
-        cache.set(cache_key, products, 3600)
-        return products
+        if cached_result is None:
+            # Rules for current job, already sorted by confidence and lift
+            cached_result = [
+                (job.pk, confidence)
+                for job, (_, confidence, _, _) in _active_jobs(index.consequents(job_id), limit)
+            ]
+            cache.set(cache_key, cached_result, CACHE_TIMEOUT)
+
+        confidences = dict(cached_result)
+        jobs = _live_jobs(list(confidences))
+        for job in jobs:
+            # Add confidence scores to jobs
+            job.recommendation_confidence = confidences[job.pk]
+        return jobs
 
     except Exception as e:
-        logger.error(f"Error getting frequently bought together: {str(e)}")
+        logger.error(f"Error getting frequently applied together: {str(e)}")
         return []
 
 
 def clear_apriori_cache():
     """
     Clear all Apriori recommendation caches
-    Call this when new orders are placed
+    Called after a mining run is stored, when new applications are submitted
+    and when a job is saved or deleted
     """
     try:
-        # This is a simple implementation - in production you might use cache.delete_pattern
-        logger.info("Apriori cache cleared")
+        # O(1) for every worker: old entries become unreachable and expire
+        generation = bump_version(CACHE_NAMESPACE)
+        logger.info(f"Apriori cache cleared (generation {generation})")
     except Exception as e:
         logger.error(f"Error clearing Apriori cache: {str(e)}")
@@ -0,0 +1,90 @@
+"""
+In-memory index over the mined job association rules.
+
+Every lookup used to hit the JobAssociationRule table.  The rules only
+change when a mining run finishes, so each process keeps them as two
+dicts built once per run:
+
+    forward[job_id]  → ((consequent_id, confidence, lift, support), ...)
+    backward[job_id] → ((antecedent_id, confidence, lift, support), ...)
+
+each tuple already sorted by confidence, then lift, and capped at
+MAX_PER_JOB entries, so a lookup is a dict hit and a slice.
+
+save_rules() bumps the 'job_rules' cache version when a run is stored.
+Processes check that version at most every LOCAL_TTL seconds; a new
+version makes the next lookup build a fresh RuleIndex and swap it in with
+a single assignment, so readers see either the old index or the new one.
+"""
+
+import threading
+import time
+from main.cache_versions import bump_version, get_version
+from main.models import JobAssociationRule
+
+NAMESPACE = 'job_rules'
+LOCAL_TTL = 5        # seconds between version checks in this process
+MAX_PER_JOB = 50
+
+
+class RuleIndex:
+    __slots__ = ('version', 'forward', 'backward')
+
+    def __init__(self, version, rows):
+        forward, backward = {}, {}
+        for antecedent_id, consequent_id, confidence, lift, support in rows:
+            forward.setdefault(antecedent_id, []).append((consequent_id, confidence, lift, support))
+            backward.setdefault(consequent_id, []).append((antecedent_id, confidence, lift, support))
+        self.version = version
+        self.forward = {job_id: self._ranked(entries) for job_id, entries in forward.items()}
+        self.backward = {job_id: self._ranked(entries) for job_id, entries in backward.items()}
+
+    @staticmethod
+    def _ranked(entries):
+        entries.sort(key=lambda entry: (entry[1], entry[2]), reverse=True)
+        return tuple(entries[:MAX_PER_JOB])
+
+    def consequents(self, job_id):
+        """Jobs applied to alongside `job_id`, strongest rule first."""
+        return self.forward.get(job_id, ())
+
+    def antecedents(self, job_id):
+        """Jobs whose applicants went on to apply to `job_id`, strongest first."""
+        return self.backward.get(job_id, ())
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.forward.values())
+
+
+_local = {'index': None, 'checked_at': 0.0}
+_load_lock = threading.Lock()
+
+
+def _build(version):
+    rows = JobAssociationRule.objects.values_list(
+        'antecedent_id', 'consequent_id', 'confidence', 'lift', 'support'
+    ).order_by()
+    return RuleIndex(version, rows.iterator())
+
+
+def get_rule_index():
+    """This process's current RuleIndex, rebuilt after a new mining run."""
+    index, now = _local['index'], time.monotonic()
+    if index is not None and now - _local['checked_at'] < LOCAL_TTL:
+        return index
+
+    version = get_version(NAMESPACE)
+    if index is None or index.version != version:
+        with _load_lock:
+            index = _local['index']
+            if index is None or index.version != version:
+                index = _build(version)
+                _local['index'] = index
+    _local['checked_at'] = now
+    return index
+
+
+def publish_new_rules():
+    """Call after a mining run is stored: every process reloads on its next check."""
+    bump_version(NAMESPACE)
+    _local['checked_at'] = 0.0
@@ -0,0 +1,153 @@
+"""
+Memory-bounded frequent-itemset mining over bitsets.
+
+The dense path (run_apriori_analysis) one-hot encodes every transaction
+into a transactions × items boolean DataFrame before mlxtend's apriori
+runs, so memory grows with both, and a low min_support multiplies the
+candidate itemsets on top of that.
+
+Here each frequent item is a bitset (a Python int) with bit t set when
+transaction t contains it; items below min_support never get one.  The
+support of an itemset is the popcount of the AND of its items' bitsets,
+and itemsets are grown depth-first (Eclat), so only the bitsets on the
+current path are alive at any time.
+
+Mining tracks an estimate of its memory use against a ceiling.  When a run
+would go over it, mine() doubles min_support and starts again, and
+returns the support it settled on.
+"""
+
+import logging
+import math
+from collections import Counter, namedtuple
+from itertools import combinations
+
+logger = logging.getLogger(__name__)
+
+Rule = namedtuple('Rule', 'antecedents consequents support confidence lift')
+
+# Rough per-object costs used by the memory estimate (CPython, 64-bit)
+_INT_OVERHEAD = 32
+_ITEMSET_BYTES = 250      # frozenset + dict slot for one result
+_MAX_SUPPORT = 0.5        # give up auto-tuning past this
+
+
+class MemoryLimitExceeded(Exception):
+    pass
+
+
+class _Budget:
+    def __init__(self, limit_bytes):
+        self.limit = limit_bytes
+        self.used = 0
+
+    def take(self, nbytes):
+        self.used += nbytes
+        if self.used > self.limit:
+            raise MemoryLimitExceeded(f'needs more than {self.limit // (1024 * 1024)} MB')
+
+    def give_back(self, nbytes):
+        self.used -= nbytes
+
+
+def _bitset_bytes(bits):
+    return (bits.bit_length() + 7) // 8 + _INT_OVERHEAD
+
+
+def _item_bitsets(transactions, min_count, budget):
+    """[(item, bitset, count)] for every item in at least `min_count` transactions."""
+    counts = Counter(item for items in transactions for item in items)
+    frequent = sorted(item for item, count in counts.items() if count >= min_count)
+    row_bytes = (len(transactions) + 7) // 8
+    budget.take(len(frequent) * (row_bytes + _INT_OVERHEAD))
+
+    buffers = {item: bytearray(row_bytes) for item in frequent}
+    for t, items in enumerate(transactions):
+        byte, mask = t >> 3, 1 << (t & 7)
+        for item in items:
+            buffer = buffers.get(item)
+            if buffer is not None:
+                buffer[byte] |= mask
+
+    bitsets = []
+    for item in frequent:
+        bitsets.append((item, int.from_bytes(buffers.pop(item), 'little'), counts[item]))
+    return bitsets
+
+
+def find_frequent_itemsets(transactions, min_support, max_len=3, memory_limit_mb=256):
+    """
+    {frozenset(items): transaction count} for every itemset of up to
+    `max_len` items with support >= min_support.  Raises
+    MemoryLimitExceeded when the estimate goes over `memory_limit_mb`.
+    """
+    budget = _Budget(memory_limit_mb * 1024 * 1024)
+    min_count = max(2, math.ceil(min_support * len(transactions)))
+    level = _item_bitsets(transactions, min_count, budget)
+
+    itemsets = {}
+
+    def grow(prefix, candidates):
+        for i, (item, bits, count) in enumerate(candidates):
+            itemset = prefix + (item,)
+            budget.take(_ITEMSET_BYTES)
+            itemsets[frozenset(itemset)] = count
+            if len(itemset) >= max_len:
+                continue
+            extensions, held = [], 0
+            try:
+                for other, other_bits, _ in candidates[i + 1:]:
+                    joined = bits & other_bits
+                    joined_count = joined.bit_count()
+                    if joined_count >= min_count:
+                        size = _bitset_bytes(joined)
+                        budget.take(size)
+                        held += size
+                        extensions.append((other, joined, joined_count))
+                if extensions:
+                    grow(itemset, extensions)
+            finally:
+                budget.give_back(held)
+
+    grow((), level)
+    return itemsets
+
+
+def generate_rules(itemsets, transaction_count, min_confidence):
+    """Association rules from frequent itemsets, strongest (confidence, lift) first."""
+    rules = []
+    for itemset, count in itemsets.items():
+        if len(itemset) < 2:
+            continue
+        support = count / transaction_count
+        for size in range(1, len(itemset)):
+            for antecedent in combinations(itemset, size):
+                antecedent = frozenset(antecedent)
+                confidence = count / itemsets[antecedent]
+                if confidence < min_confidence:
+                    continue
+                consequent = itemset - antecedent
+                lift = confidence / (itemsets[consequent] / transaction_count)
+                rules.append(Rule(antecedent, consequent, support, confidence, lift))
+    rules.sort(key=lambda rule: (rule.confidence, rule.lift), reverse=True)
+    return rules
+
+
+def mine(transactions, min_support=0.01, min_confidence=0.1, max_len=3, memory_limit_mb=256):
+    """
+    Frequent itemsets + rules within the memory ceiling.
+
+    Returns (rules, min_support actually used).  min_support is doubled
+    until mining fits; past 50% support the result is empty.
+    """
+    support = min_support
+    while support <= _MAX_SUPPORT:
+        try:
+            itemsets = find_frequent_itemsets(transactions, support, max_len, memory_limit_mb)
+        except MemoryLimitExceeded as e:
+            logger.warning(f"Sparse mining at min_support={support:g} {e}; retrying at {support * 2:g}")
+            support *= 2
+            continue
+        return generate_rules(itemsets, len(transactions), min_confidence), support
+    logger.warning(f"Sparse mining does not fit in {memory_limit_mb} MB at any min_support <= {_MAX_SUPPORT}")
+    return [], support
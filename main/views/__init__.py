@@ -58,6 +58,7 @@ from .user_job_views import (
     user_job_detail,
     apply_for_job,
     application_success,
+    skill_suggestions,
     user_my_applications,
     user_application_detail,
 )
@@ -145,6 +146,7 @@ __all__ = [
     'user_job_detail',
     'apply_for_job',
     'application_success',
+    'skill_suggestions',
     'user_my_applications',
     'user_application_detail',
     # Admin applications
@@ -2,7 +2,7 @@ from django.shortcuts import render, redirect
 from django.contrib import messages
 from main.models import User
 from main.decorators import admin_required
-from .auth_views import get_tokens_for_user, set_jwt_cookies
+from .auth_views import get_tokens_for_user, set_jwt_cookies, revoke_jwt_cookie
 
 
 @admin_required
@@ -97,6 +97,7 @@ def admin_change_password(request):
             user = request.user
             user.set_password(new_password)
             user.save()
+            revoke_jwt_cookie(request)
 
             # Generate new tokens since password changed
             tokens = get_tokens_for_user(user)
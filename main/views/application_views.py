@@ -1,9 +1,10 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
-from django.core.paginator import Paginator
 from django.db.models import Q
 from main.models import JobApplication, Job
 from main.decorators import admin_required
+from main.pagination import CursorPaginator, approximate_count
+from main.application_stats import get_status_breakdown
 from main.emails import send_application_status_update, send_rejection_email
 
 
@@ -36,19 +37,11 @@ def application_list(request):
     jobs = Job.objects.all().order_by('title')
 
     # Pagination
-    paginator = Paginator(applications, 15)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = CursorPaginator(applications, 15, ordering=('-created_at', '-id'))
+    page_obj = paginator.page(request.GET.get('cursor'))
 
     # Status counts
-    status_counts = {
-        'all': JobApplication.objects.count(),
-        'pending': JobApplication.objects.filter(status='pending').count(),
-        'reviewed': JobApplication.objects.filter(status='reviewed').count(),
-        'shortlisted': JobApplication.objects.filter(status='shortlisted').count(),
-        'accepted': JobApplication.objects.filter(status='accepted').count(),
-        'rejected': JobApplication.objects.filter(status='rejected').count(),
-    }
+    status_counts = get_status_breakdown()
 
     context = {
         'applications': page_obj,
@@ -57,6 +50,7 @@ def application_list(request):
         'selected_job': job_id,
         'search': search,
         'status_counts': status_counts,
+        'total_applications': approximate_count(applications),
     }
     return render(request, 'my-admin/applications/list.html', context)
 
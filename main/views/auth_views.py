@@ -2,10 +2,14 @@ from django.shortcuts import render, redirect
 from django.contrib import messages
 from django.contrib.auth import update_session_auth_hash
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Q
 from rest_framework_simplejwt.tokens import RefreshToken
 from main.models import User, UserDocument, Skill, UserSkill
 from main.decorators import admin_required, user_required, guest_only
+from main.auth_cache import revoke_token
+from main.matching import get_recommended_jobs
+from main.page_cache import cache_page_for_anonymous
 import requests
 import secrets
 import random
@@ -69,6 +73,11 @@ def set_jwt_cookies(response, tokens):
     return response
 
 
+def revoke_jwt_cookie(request):
+    """Revoke the access token this request was made with (logout, password change)."""
+    revoke_token(request.COOKIES.get(settings.SIMPLE_JWT.get('AUTH_COOKIE', 'access_token')))
+
+
 def clear_jwt_cookies(response):
     """Clear JWT tokens from cookies."""
     response.delete_cookie(settings.SIMPLE_JWT.get('AUTH_COOKIE', 'access_token'))
@@ -336,6 +345,7 @@ def admin_reset_password(request):
 @admin_required
 def admin_logout(request):
     """Logout admin user by clearing JWT cookies."""
+    revoke_jwt_cookie(request)
     messages.success(request, 'You have been logged out successfully.')
     response = redirect('admin_login')
     return clear_jwt_cookies(response)
@@ -346,23 +356,19 @@ def admin_dashboard(request):
     """Admin dashboard view."""
     from main.models import Job, JobApplication
 
+    from main.application_stats import get_status_breakdown
+
     total_users = User.objects.filter(role='user').count()
     total_jobs = Job.objects.filter(status='active').count()
-    total_applications = JobApplication.objects.count()
-    pending_applications = JobApplication.objects.filter(status='pending').count()
+
+    # Application status breakdown (denormalized counters, one query)
+    app_status = get_status_breakdown()
+    total_applications = app_status['all']
+    pending_applications = app_status['pending']
 
     # Recent applications (latest 5)
     recent_applications = JobApplication.objects.select_related('job').order_by('-created_at')[:5]
 
-    # Application status breakdown
-    app_status = {
-        'pending': JobApplication.objects.filter(status='pending').count(),
-        'reviewed': JobApplication.objects.filter(status='reviewed').count(),
-        'shortlisted': JobApplication.objects.filter(status='shortlisted').count(),
-        'accepted': JobApplication.objects.filter(status='accepted').count(),
-        'rejected': JobApplication.objects.filter(status='rejected').count(),
-    }
-
     context = {
         'user': request.user,
         'total_users': total_users,
@@ -604,6 +610,7 @@ def verify_email(request):
 @user_required
 def user_logout(request):
     """Logout user by clearing JWT cookies."""
+    revoke_jwt_cookie(request)
     messages.success(request, 'You have been logged out successfully.')
     response = redirect('home')
     return clear_jwt_cookies(response)
@@ -797,6 +804,8 @@ def user_profile(request):
     context = {
         'user': request.user,
         'document': document,
+        # Precomputed from the user's skills (main/matching.py)
+        'recommended_jobs': get_recommended_jobs(request.user, limit=6),
     }
     return render(request, 'user/profile.html', context)
 
@@ -845,10 +854,11 @@ def edit_profile(request):
 
             user.save()
 
-            # Save user skills
-            UserSkill.objects.filter(user=user).delete()
-            for name in skill_names:
-                UserSkill.objects.create(user=user, name=name)
+            # Save user skills (one transaction, so matches are refreshed once)
+            with transaction.atomic():
+                UserSkill.objects.filter(user=user).delete()
+                for name in skill_names:
+                    UserSkill.objects.create(user=user, name=name)
 
             messages.success(request, 'Profile updated successfully!')
             return redirect('user_profile')
@@ -902,6 +912,7 @@ def change_password(request):
             user = request.user
             user.set_password(new_password)
             user.save()
+            revoke_jwt_cookie(request)
 
             # Generate new tokens since password changed
             tokens = get_tokens_for_user(user)
@@ -982,10 +993,11 @@ def complete_profile(request):
         user.is_profile_complete = True
         user.save()
 
-        # Save user skills
-        UserSkill.objects.filter(user=user).delete()
-        for name in skill_names:
-            UserSkill.objects.create(user=user, name=name)
+        # Save user skills (one transaction, so matches are refreshed once)
+        with transaction.atomic():
+            UserSkill.objects.filter(user=user).delete()
+            for name in skill_names:
+                UserSkill.objects.create(user=user, name=name)
 
         # Save documents
         if passport_number:
@@ -1055,12 +1067,13 @@ def edit_documents(request):
 # PLACEHOLDER VIEWS (to be implemented later)
 # =============================================================================
 
+@cache_page_for_anonymous('home', tags=('job', 'team', 'hero', 'company'))
 def home(request):
     """Home page view."""
     from main.models import Job, TeamMember, HeroPhoto
 
-    # Get latest active jobs for home page carousel
-    featured_jobs = Job.objects.filter(status='active').order_by('-is_urgent', '-created_at')[:6]
+    # Get latest live jobs for home page carousel
+    featured_jobs = Job.objects.live().order_by('-is_urgent', '-created_at')[:6]
 
     # Get active team members for team section
     team_members = TeamMember.objects.filter(is_active=True).order_by('display_order', 'id')
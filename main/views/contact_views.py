@@ -1,8 +1,8 @@
 from django.shortcuts import render, redirect
 from django.contrib import messages
-from django.core.mail import send_mail
 from django.conf import settings
 from main.models import ContactMessage
+from main.emails import queue_plain_email
 
 
 def submit_contact(request):
@@ -75,14 +75,8 @@ The Talent Solutions Team
 This is an automated confirmation email. Please do not reply to this email.
 """
 
-        send_mail(
-            subject=email_subject,
-            message=email_message,
-            from_email=settings.EMAIL_SENDERS.get('support', 'no-reply@talentsolutions.com.np'),
-            recipient_list=[user_email],
-            fail_silently=False,
-        )
-        print(f"Confirmation email sent to {user_email}")
+        queue_plain_email('support', user_email, email_subject, email_message)
+        print(f"Confirmation email queued for {user_email}")
     except Exception as e:
         print(f"Error sending confirmation email: {e}")
 
@@ -92,11 +86,11 @@ def send_admin_notification(full_name, user_email, phone, subject, message_text)
     Send notification email to admin/recruitment team
     """
     try:
-        from main.models import Company
+        from main.company_cache import get_company
 
         # Get company email or fallback to default
         try:
-            company = Company.objects.first()
+            company = get_company()
             admin_email = company.email if company else 'info@talentsolutions.com.np'
         except:
             admin_email = 'info@talentsolutions.com.np'
@@ -119,13 +113,7 @@ Submitted via Talent Solutions website contact form
 Reply to this inquiry: {user_email}
 """
 
-        send_mail(
-            subject=email_subject,
-            message=email_message,
-            from_email=settings.EMAIL_SENDERS.get('support', 'no-reply@talentsolutions.com.np'),
-            recipient_list=[admin_email],
-            fail_silently=False,
-        )
-        print(f"Admin notification sent to {admin_email}")
+        queue_plain_email('support', admin_email, email_subject, email_message)
+        print(f"Admin notification queued for {admin_email}")
     except Exception as e:
         print(f"Error sending admin notification: {e}")
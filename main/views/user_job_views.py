@@ -1,72 +1,73 @@
 from django.shortcuts import render, get_object_or_404, redirect
-from django.core.paginator import Paginator
-from django.db.models import Q
 from django.contrib import messages
+from django.db import transaction
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
 from main.models import Job, Skill, JobApplication, UserDocument
 from main.decorators import user_required
 from main.emails import send_application_confirmation, send_new_application_alert
+from main.search import search_jobs
+from main.facets import get_country_facets
+from main.pagination import CursorPaginator, approximate_count
+from main.application_stats import get_status_breakdown
+from main.related_jobs import get_related_jobs
+from main.skill_suggestions import suggest_skills
+from main import utils as recommender
 
 
 def user_jobs_list(request):
     """Public jobs listing page."""
-    # Get only active jobs
-    jobs = Job.objects.filter(status='active').order_by('-is_urgent', '-created_at')
+    # Only active jobs still taking applications
+    jobs = Job.objects.live().order_by('-is_urgent', '-created_at')
 
-    # Search
+    # Search (full-text index, best matches first)
     search = request.GET.get('search', '').strip()
+    ordering = ('-is_urgent', '-created_at', '-id')
     if search:
-        jobs = jobs.filter(
-            Q(title__icontains=search) |
-            Q(company_name__icontains=search) |
-            Q(description__icontains=search)
-        )
+        jobs = search_jobs(jobs, search)
+        ordering = ('search_rank', '-created_at', '-id')
 
     # Country filter
     country = request.GET.get('country', '')
     if country:
         jobs = jobs.filter(country=country)
 
-    # Get unique countries for filter dropdown
-    countries = Job.objects.filter(status='active').values_list('country', flat=True).distinct()
-    from main.models.job_model import COUNTRY_CHOICES
-    country_dict = dict(COUNTRY_CHOICES)
-    available_countries = [(code, country_dict.get(code, code)) for code in countries]
-    available_countries.sort(key=lambda x: x[1])
+    # Countries (with live job counts) for the filter dropdown – cached
+    available_countries = get_country_facets()
 
-    # Pagination
-    paginator = Paginator(jobs, 9)  # 9 jobs per page (3x3 grid)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Pagination (keyset: every page costs the same as the first)
+    paginator = CursorPaginator(jobs, 9, ordering=ordering)  # 9 jobs per page (3x3 grid)
+    page_obj = paginator.page(request.GET.get('cursor'))
 
     context = {
         'jobs': page_obj,
         'search': search,
         'selected_country': country,
         'countries': available_countries,
-        'total_jobs': paginator.count,
+        'total_jobs': approximate_count(jobs),
     }
     return render(request, 'user/jobs/list.html', context)
 
 
 def user_job_detail(request, slug):
     """Public job detail page."""
-    job = get_object_or_404(Job, slug=slug, status='active')
+    job = get_object_or_404(Job.objects.live(), slug=slug)
 
     # Get user's latest application for this job (if any)
     user_application = None
     if request.user.is_authenticated:
         user_application = JobApplication.objects.filter(job=job, user=request.user).order_by('-created_at').first()
 
-    # Get related jobs (same country or similar skills)
-    related_jobs = Job.objects.filter(
-        status='active'
-    ).exclude(id=job.id).filter(
-        Q(country=job.country) | Q(skills__in=job.skills.all())
-    ).distinct()[:3]
+    # Related jobs (shared skills / same country), precomputed in main/related_jobs.py
+    related_jobs = get_related_jobs(job, limit=3)
+
+    # "Applicants also applied to", from the mined association rules
+    also_applied_jobs = recommender.get_job_recommendations(job.id, limit=3)
 
     context = {
         'job': job,
         'related_jobs': related_jobs,
+        'also_applied_jobs': also_applied_jobs,
         'user_application': user_application,
     }
     return render(request, 'user/jobs/detail.html', context)
@@ -152,53 +153,54 @@ def apply_for_job(request, slug):
             }
             return render(request, 'user/jobs/apply.html', context)
 
-        # Create application
-        application = JobApplication(
-            job=job,
-            full_name=full_name,
-            contact_number=contact_number,
-            passport_number=passport_number,
-            passport_photo=passport_photo if passport_photo else existing_passport_photo,
-        )
-
-        # Set user if logged in
-        if request.user.is_authenticated:
-            application.user = request.user
-
-        # Set CV if provided
-        if cv:
-            application.cv = cv
-
-        application.save()
-
-        # Add skills (after saving the application)
-        for skill_id in selected_skills:
-            try:
-                skill = Skill.objects.get(id=skill_id)
-                application.skills.add(skill)
-            except Skill.DoesNotExist:
-                pass
-
-        # Save info back to user profile if not already set
-        if request.user.is_authenticated:
-            user = request.user
-            if not user.phone_number and contact_number:
-                user.phone_number = contact_number
-                user.save()
-
-            doc, _ = UserDocument.objects.get_or_create(user=user)
-            doc_updated = False
-            if not doc.passport_number and passport_number:
-                doc.passport_number = passport_number
-                doc_updated = True
-            if not doc.passport_photo and passport_photo:
-                doc.passport_photo = passport_photo
-                doc_updated = True
-            if not doc.cv and cv:
-                doc.cv = cv
-                doc_updated = True
-            if doc_updated:
-                doc.save()
+        # One write transaction: the application, its skills and the profile updates
+        with transaction.atomic():
+            # Create application
+            application = JobApplication(
+                job=job,
+                full_name=full_name,
+                contact_number=contact_number,
+                passport_number=passport_number,
+                passport_photo=passport_photo if passport_photo else existing_passport_photo,
+            )
+
+            # Set user if logged in
+            if request.user.is_authenticated:
+                application.user = request.user
+
+            # Set CV if provided
+            if cv:
+                application.cv = cv
+
+            application.save()
+
+            # Add skills (after saving the application) in one add(), so
+            # the skill pair counters update once for the whole set
+            skill_ids = Skill.objects.filter(
+                id__in=[skill_id for skill_id in selected_skills if str(skill_id).isdigit()]
+            ).values_list('id', flat=True)
+            application.skills.add(*skill_ids)
+
+            # Save info back to user profile if not already set
+            if request.user.is_authenticated:
+                user = request.user
+                if not user.phone_number and contact_number:
+                    user.phone_number = contact_number
+                    user.save()
+
+                doc, _ = UserDocument.objects.get_or_create(user=user)
+                doc_updated = False
+                if not doc.passport_number and passport_number:
+                    doc.passport_number = passport_number
+                    doc_updated = True
+                if not doc.passport_photo and passport_photo:
+                    doc.passport_photo = passport_photo
+                    doc_updated = True
+                if not doc.cv and cv:
+                    doc.cv = cv
+                    doc_updated = True
+                if doc_updated:
+                    doc.save()
 
         # Send confirmation to applicant + alert to admin
         send_application_confirmation(application)
@@ -246,6 +248,17 @@ def application_success(request, slug):
     return render(request, 'user/jobs/application_success.html', {'job': job})
 
 
+@require_GET
+def skill_suggestions(request):
+    """Skills most often picked together with ?skills=1,2,3 (JSON, for the apply form)."""
+    selected = [int(pk) for pk in request.GET.get('skills', '').split(',') if pk.strip().isdigit()]
+    try:
+        limit = min(max(int(request.GET.get('limit', 5)), 1), 20)
+    except ValueError:
+        limit = 5
+    return JsonResponse({'suggestions': suggest_skills(selected, limit)})
+
+
 @user_required
 def user_my_applications(request):
     """List all applications submitted by the logged-in user."""
@@ -259,25 +272,17 @@ def user_my_applications(request):
         applications = applications.filter(status=selected_status)
 
     # Status counts for filter tabs
-    all_apps = JobApplication.objects.filter(user=request.user)
-    status_counts = {
-        'all': all_apps.count(),
-        'pending': all_apps.filter(status='pending').count(),
-        'reviewed': all_apps.filter(status='reviewed').count(),
-        'shortlisted': all_apps.filter(status='shortlisted').count(),
-        'accepted': all_apps.filter(status='accepted').count(),
-        'rejected': all_apps.filter(status='rejected').count(),
-    }
+    status_counts = get_status_breakdown(user=request.user)
 
     # Pagination
-    paginator = Paginator(applications, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = CursorPaginator(applications, 10, ordering=('-created_at', '-id'))
+    page_obj = paginator.page(request.GET.get('cursor'))
 
     context = {
         'applications': page_obj,
         'selected_status': selected_status,
         'status_counts': status_counts,
+        'total_applications': approximate_count(applications),
     }
     return render(request, 'user/applications/list.html', context)
 
@@ -73,10 +73,10 @@ MIDDLEWARE = [
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # JWT cookie first, session fallback; replaces Django's AuthenticationMiddleware
+    'main.middleware.JWTAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'main.middleware.JWTAuthenticationMiddleware',
 ]
 
 ROOT_URLCONF = 'talent_solutions.urls'
@@ -104,13 +104,101 @@ WSGI_APPLICATION = 'talent_solutions.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# DB_ENGINE selects the database: 'sqlite' (default) or 'postgresql'.
+# PostgreSQL needs requirements-postgres.txt and the POSTGRES_* variables in
+# .env.example; `python manage.py copy_sqlite_to_postgres` moves the data.
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite').lower()
+
+# Several Gunicorn workers (plus the mailer / job-expiry workers) share one
+# SQLite file.  Every new connection runs SQLITE_PRAGMAS:
+#   journal_mode=WAL     readers don't block the writer, nor it them
+#   synchronous=NORMAL   fsync at checkpoints, not every commit (safe with WAL)
+#   mmap_size/cache_size keep hot pages in memory (128 MB mapped, 32 MB cache)
+#   temp_store=MEMORY    sorts and temp B-trees stay off disk
+# 'timeout' is the busy timeout: a writer waits up to that many seconds for
+# the lock instead of failing with "database is locked".  transaction_mode
+# IMMEDIATE takes the write lock when an atomic() block starts, so a
+# transaction can't read under a shared lock and then fail to upgrade it
+# (which SQLite reports as locked at once, without waiting).
+# `python manage.py benchmark_sqlite_concurrency` compares this with the
+# SQLite defaults.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 128 * 1024 * 1024,
+    'cache_size': -32 * 1024,  # negative = KiB
+    'temp_store': 'MEMORY',
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db_data' / 'db.sqlite3' if ENVIRONMENT == 'production' else BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            'timeout': 20,
+            'transaction_mode': 'IMMEDIATE',
+            'init_command': ';'.join(f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items()),
+        },
+        # Reuse each worker's connection instead of reopening it (and
+        # rerunning the PRAGMAs) on every request
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+if DB_ENGINE == 'postgresql':
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ.get('POSTGRES_DB', 'talent_solutions'),
+        'USER': os.environ.get('POSTGRES_USER', 'talent_solutions'),
+        'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+        'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+        'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+        # Persistent connections, checked before reuse so a dropped one
+        # (server restart, idle timeout) is replaced instead of failing
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'connect_timeout': 5,
+        },
+    }
+    # DB_POOL_MAX_SIZE > 0 switches to a psycopg connection pool per worker
+    # instead (Django doesn't allow both a pool and persistent connections).
+    DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', 0))
+    if DB_POOL_MAX_SIZE:
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 1)),
+            'max_size': DB_POOL_MAX_SIZE,
+            'timeout': 10,
+        }
+    INSTALLED_APPS.append('django.contrib.postgres')
+
+# `python manage.py backup` (run nightly by backup.sh).  The SQLite file is
+# copied PAGES_PER_STEP pages at a time through SQLite's online backup API,
+# pausing STEP_PAUSE_MS between steps so writers get the lock in between.
+BACKUP = {
+    'DIR': BASE_DIR / 'backups',
+    'KEEP_DAYS': 14,
+    'PAGES_PER_STEP': 256,
+    'STEP_PAUSE_MS': 5,
+}
+
+# Cache
+# LocMemCache is per-process. Production runs several Gunicorn workers, and
+# signal-driven invalidation in one worker must be seen by all of them, so
+# production uses a file-based cache shared by every worker in the container.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache' if ENVIRONMENT == 'production' else 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': os.environ.get('CACHE_DIR', '/tmp/talent_solutions_cache') if ENVIRONMENT == 'production' else 'talent-solutions',
+    }
+}
+
+# Full-text search backend for the public job board (see main/search.py)
+JOB_SEARCH_BACKEND = 'main.search.PostgresSearchBackend' if DB_ENGINE == 'postgresql' else 'main.search.SQLiteFTS5Backend'
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -214,5 +302,41 @@ EMAIL_SENDERS = {
     'notifications': 'no-reply@talentsolutions.com.np',       # general notifications → user
 }
 
+# Outbound email queue (main/outbox.py). Views only queue messages; the
+# `python manage.py send_queued_emails` worker delivers them with retries.
+EMAIL_OUTBOX = {
+    'MAX_ATTEMPTS': 6,                 # then the message is dead-lettered
+    'BACKOFF_BASE_SECONDS': 30,        # 30s, 60s, 120s, ... between retries
+    'BACKOFF_MAX_SECONDS': 60 * 60,
+    'BATCH_SIZE': 50,
+    'STALE_AFTER_SECONDS': 10 * 60,
+}
+
+# SMTP connection pool used by the worker (main/mailer.py): one TLS/AUTH
+# handshake serves a whole batch instead of one per message.
+EMAIL_POOL = {
+    'MAX_CONNECTIONS': 2,
+    'MAX_IDLE_SECONDS': 60,            # relays drop idle sessions; reconnect after this
+    'MAX_MESSAGES_PER_CONNECTION': 200,
+}
+
+# Association-rule mining for job recommendations (main/utils/apriori_recommendations.py).
+# 'sparse' mines bitsets within MEMORY_LIMIT_MB, raising min_support if it has to;
+# 'dense' is the pandas + mlxtend apriori path (needs both installed).
+APRIORI_MINING = {
+    'MODE': 'sparse',
+    'MEMORY_LIMIT_MB': 256,
+    'MAX_LEN': 3,
+}
+
+# Boot import budget checked by `python manage.py import_profile`: importing
+# MODULE (plus the URLconf, which the first request loads) must take at most
+# BUDGET_MS, and none of FORBIDDEN may be imported on the way.
+IMPORT_PROFILE = {
+    'MODULE': 'talent_solutions.wsgi',
+    'BUDGET_MS': 1500,
+    'FORBIDDEN': ['pandas', 'numpy', 'scipy', 'mlxtend'],
+}
+
 # Base URL used in email links (set SITE_URL in .env when deployed)
 SITE_URL = os.environ.get('SITE_URL', 'http://localhost:8000')